@@ -1,23 +1,44 @@
+import time
+STARTUP_TIME = time.perf_counter()  # 시작 단계별 소요 시간 측정 기준 (--profile-startup)
+
 import sys
 import os
 from pathlib import Path
 import json
-import cv2
+import importlib
+import numpy as np
 import logging
 import math
+import fnmatch
+import hashlib
+import tempfile
+import argparse
+import csv
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from string import Template
+
+try:
+    import orjson  # 선택 의존성 - 어노테이션 JSON 고속 (역)직렬화
+except ImportError:
+    orjson = None
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
     QHBoxLayout, QPushButton, QFileDialog, QLabel, 
-    QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QSpinBox, QHeaderView,
     QProgressBar, QFrame, QSplitter, QStyle, QMessageBox,
     QLineEdit, QDialog, QToolTip, QButtonGroup, QRadioButton,
-    QGraphicsDropShadowEffect, QSizePolicy, QShortcut,
-    QGridLayout, QSlider
+    QSizePolicy, QShortcut,
+    QGridLayout, QSlider, QTableView, QStyledItemDelegate, QComboBox
 )
 from PyQt5.QtCore import (
-    Qt, QTimer, QPointF, QRectF, QSize, QPoint
+    Qt, QTimer, QPointF, QRectF, QRect, QSize, QPoint, QThread, pyqtSignal,
+    QAbstractTableModel, QModelIndex, QEvent
 )
 from PyQt5.QtGui import (
     QImage, QPixmap, QPainter, QColor, QPen, QPainterPath,
@@ -36,74 +57,1681 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class StartupProfiler:
+    """시작 단계별 소요 시간 기록 (--profile-startup 옵션이면 창 표시 후 출력)"""
+
+    def __init__(self, start):
+        self.enabled = False
+        self.reported = False
+        self.last = start
+        self.start = start
+        self.marks = []  # (단계 이름, 소요 시간 초)
+
+    def mark(self, name):
+        """직전 기록 이후 소요 시간을 name 단계로 기록"""
+        now = time.perf_counter()
+        self.marks.append((name, now - self.last))
+        self.last = now
+
+    def record(self, name, seconds):
+        """시작 이후 따로 측정한 단계 기록 (지연 import 등)"""
+        self.marks.append((name, seconds))
+        if self.enabled and self.reported:
+            print(f"{name:<32}{seconds * 1000:>9.1f} ms", file=sys.stderr)
+
+    def report(self, out=None):
+        """기록된 단계 출력 (이후 기록되는 단계는 바로 출력)"""
+        out = out or sys.stderr
+        for name, seconds in self.marks:
+            print(f"{name:<32}{seconds * 1000:>9.1f} ms", file=out)
+        print(f"{'total':<32}{(self.last - self.start) * 1000:>9.1f} ms", file=out)
+        self.reported = True
+
+startup_profiler = StartupProfiler(STARTUP_TIME)
+
+class LazyModule:
+    """처음 속성에 접근할 때 가져오는 모듈 (창을 띄우기 전에 무거운 import를 피함)"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    self._module = importlib.import_module(self._name)
+                    startup_profiler.record(f'import {self._name} (deferred)', time.perf_counter() - start)
+                module = self._module
+        return getattr(module, attr)
+
+# OpenCV는 첫 비디오를 열 때 가져옴
+cv2 = LazyModule('cv2')
+
+startup_profiler.mark('imports')
+
+# 재생 시 미리 디코딩해 둘 프레임 수
+PLAYBACK_BUFFER_SIZE = 30
+
+# 키프레임부터 디코딩할 때 프레임 캐시에 남길 마지막 프레임 수 (역방향 이동용)
+GOP_CACHE_FRAMES = 30
+
+# 디코딩 프레임 LRU 캐시의 기본 메모리 한도 (바이트)
+FRAME_CACHE_BYTES = 512 * 1024 * 1024
+
+# 재생 속도 선택지 (배속) 및 J/L 셔틀 키를 반복해서 누를 때의 배속 단계
+PLAYBACK_SPEEDS = (0.25, 0.5, 1.0, 1.5, 2.0, 4.0)
+SHUTTLE_SPEEDS = (1.0, 2.0, 4.0)
+
+# 역재생 시 한 번에 정방향으로 디코딩해 뒤집어 내보낼 최대 프레임 수
+REVERSE_CHUNK_FRAMES = 60
+
+# 화면 표시 변환 품질 ('fast': 선형 보간, 'smooth': 축소 시 영역 평균/확대 시 바이큐빅)
+PLAYBACK_DISPLAY_QUALITY = 'fast'
+PAUSED_DISPLAY_QUALITY = 'smooth'
+
+# 슬라이더 스크럽 시 미리보기 갱신 간격 (ms) 및 미리보기 해상도 배율
+SCRUB_INTERVAL_MS = 30
+SCRUB_PREVIEW_SCALE = 0.5
+
+# 썸네일, 상태 인덱스 등 디스크 캐시 저장 위치
+CACHE_DIR = Path.home() / '.video_labeler'
+
+# 새 파일 권한 계산용 umask (프로세스 공용 설정이므로 시작할 때 메인 스레드에서 한 번만 읽음)
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+# 디스크 인덱스 변경 사항을 파일에 기록하는 주기 (ms)
+INDEX_FLUSH_INTERVAL_MS = 5000
+
+# 다음 비디오 미리 열기: 목록에서 앞서 열어 둘 파일 수, 파일당 미리 디코딩할 첫 프레임 수,
+# 미리 디코딩한 프레임의 전체 메모리 한도 (바이트)
+PREFETCH_DEPTH = 1
+PREFETCH_FRAMES = 30
+PREFETCH_MAX_BYTES = 128 * 1024 * 1024
+
+# 액션 타입 번호와 이름 (타임라인, 오버레이, 배치 도구가 공유)
+ACTION_NAMES = {
+    4: "기타",
+    1: "탐색",
+    2: "사용",
+    3: "종료"
+}
+
+# 틴더 스타일 색상 테마 - 액션 타입별 색상 (타임라인, 오버레이, 앱 스타일시트가 공유)
+ACTION_COLORS = {
+    4: "#9e9e9e",  # 기타: 회색
+    1: "#2196f3",  # 탐색: 파란색
+    2: "#4caf50",  # 사용: 초록색
+    3: "#fe3c72"   # 종료: 틴더 메인 색상
+}
+
+# 화면 공통 색상 (역할 이름 -> 색상, 강조/진행 색은 액션 색상에서 가져옴)
+THEME_COLORS = {
+    'accent': ACTION_COLORS[3],   # 주요 버튼, 재생 위치
+    'accent_hover': "#f28cb1",    # 주요 버튼 호버, 현재 파일 행
+    'accent_light': "#ff4f81",    # 대화상자 확인 버튼 호버
+    'success': ACTION_COLORS[2],  # 진행률
+    'danger': "#ff4444",
+    'danger_hover': "#ff6666",
+    'marker': "#ffd700",          # 구간 표시 시작점
+    'text': "#424242",
+    'text_disabled': "#999999",
+    'border': "#dddddd",
+    'surface': "#ffffff",
+    'window': "#f6f7f8",
+    'hover': "#f0f0f0",
+    'pressed': "#e0e0e0",
+    'disabled': "#f5f5f5",
+    'disabled_strong': "#cccccc",
+    'video': "#000000"
+}
+
+# 어노테이션 JSON 필수 키
+ANNOTATION_REQUIRED_KEYS = ('meta_data', 'additional_info', 'annotations')
+SEGMENT_REQUIRED_KEYS = ('start_frame', 'end_frame', 'action_type', 'duration', 'keyframe')
+
+# 새 어노테이션 문서의 기본값 (기존 파일을 다시 저장할 때는 파일의 값을 유지)
+DEFAULT_META_DATA = {'environment': 3, 'camera_height': 165, 'camera_angle': 50}
+DEFAULT_ADDITIONAL_INFO = {'InteractionType': 'Touchscreen'}
+DEFAULT_TARGET_OBJECT = {'age': 1, 'gender': 1, 'disability': 2}
+
+# 어노테이션 저장 요청을 모으는 시간 (마지막 요청 후 대기 ms / 첫 요청 후 최대 대기 ms)
+SAVE_COALESCE_MS = 500
+SAVE_MAX_DELAY_MS = 3000
+
+# 자동 저장 주기 (초, 0이면 사용 안 함) 및 재생 중 미룬 자동 저장의 재시도 간격 (ms)
+AUTOSAVE_INTERVAL_SEC = 30
+AUTOSAVE_RETRY_MS = 2000
+
+# 되돌리기 기록 최대 개수
+UNDO_DEPTH = 200
+
+# 지원 비디오 확장자
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
+
+# 폴더 검색 결과를 파일 목록에 전달하는 단위 (개수 / 최대 대기 시간 초)
+SCAN_BATCH_SIZE = 500
+SCAN_BATCH_INTERVAL = 0.2
+
+# 타임라인 필름스트립 썸네일 개수 및 높이 (px)
+THUMBNAIL_COUNT = 40
+THUMBNAIL_HEIGHT = 90
+
+# 타임라인 최대 확대 시 화면에 보이는 최소 프레임 수
+TIMELINE_MIN_VISIBLE_FRAMES = 30
+
+# 이보다 좁은(px) 세그먼트는 개별로 그리지 않고 밀도 막대로 합쳐 표시
+TIMELINE_LOD_MIN_WIDTH = 2
+
+def frame_to_qimage(frame, target_size=None, smooth=True):
+    """OpenCV BGR 프레임을 표시용 QImage로 변환 (target_size가 주어지면 비율 유지 스케일링)"""
+    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    h, w, ch = rgb_frame.shape
+    image = QImage(rgb_frame.data, w, h, ch * w, QImage.Format_RGB888)
+
+    if target_size is not None and target_size.isValid():
+        if image.size().scaled(target_size, Qt.KeepAspectRatio) != image.size():
+            mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+            return image.scaled(target_size, Qt.KeepAspectRatio, mode)
+
+    # numpy 버퍼와 분리된 복사본 반환
+    return image.copy()
+
+class FrameConverter:
+    """BGR 프레임을 표시 크기로 먼저 줄인 뒤 재사용 버퍼 안에서 RGB로 변환하는 변환기
+
+    해상도별로 RGB 버퍼와 이를 감싼 QImage를 pool_size개씩 돌려 쓰므로 프레임마다
+    새 메모리를 할당하지 않는다. 반환된 QImage는 같은 해상도로 pool_size번 더
+    변환하면 덮어써지므로, 그 전에 표시(QPixmap 변환)되어야 한다.
+    pool_size가 0이면 버퍼를 미리 잡아 두지 않고 변환할 때마다 새로 할당한다.
+    """
+
+    def __init__(self, pool_size=1):
+        self.pool_size = pool_size
+        self._pools = {}  # (w, h) -> [(rgb 버퍼, QImage), ...]
+        self._next = {}   # (w, h) -> 다음에 쓸 버퍼 위치
+
+    @staticmethod
+    def fit_size(width, height, target_size):
+        """비율을 유지하며 target_size 안에 들어가는 최대 크기"""
+        if target_size is None or not target_size.isValid() or target_size.isEmpty():
+            return width, height
+        size = QSize(width, height).scaled(target_size, Qt.KeepAspectRatio)
+        return max(1, size.width()), max(1, size.height())
+
+    @staticmethod
+    def _allocate(size):
+        w, h = size
+        rgb = np.empty((h, w, 3), dtype=np.uint8)
+        image = QImage(rgb.data, w, h, w * 3, QImage.Format_RGB888)
+        image._buffer = rgb  # 버퍼 정리 후에도 표시 중인 이미지의 메모리 유지
+        return rgb, image
+
+    def _buffer(self, size):
+        if not self.pool_size:
+            return self._allocate(size)
+        pool = self._pools.get(size)
+        if pool is None:
+            if len(self._pools) >= 4:
+                # 창 크기 변경 등으로 쓰이지 않는 해상도 버퍼 정리
+                self._pools.clear()
+                self._next.clear()
+            pool = [self._allocate(size) for _ in range(self.pool_size)]
+            self._pools[size] = pool
+            self._next[size] = 0
+
+        i = self._next[size]
+        self._next[size] = (i + 1) % len(pool)
+        return pool[i]
+
+    def convert(self, frame, target_size=None, quality=PAUSED_DISPLAY_QUALITY):
+        """프레임을 target_size에 맞춰 줄이고 RGB QImage로 변환"""
+        h, w = frame.shape[:2]
+        size = self.fit_size(w, h, target_size)
+        rgb, image = self._buffer(size)
+
+        if size == (w, h):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+        else:
+            if quality == 'fast':
+                interpolation = cv2.INTER_LINEAR
+            elif size[0] < w:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_CUBIC
+            cv2.resize(frame, size, dst=rgb, interpolation=interpolation)
+            cv2.cvtColor(rgb, cv2.COLOR_BGR2RGB, dst=rgb)
+        return image
+
+class PlaybackClock:
+    """단조 시계 기준으로 지금 표시해야 할 프레임을 계산하는 재생 시계
+
+    타이머 간격이나 디코딩 시간과 무관하게 경과 시간 × fps × 배속으로 위치를
+    정하므로 재생이 밀리거나 누적 오차가 생기지 않는다.
+    """
+
+    def __init__(self, fps=15.0, speed=1.0):
+        self.fps = fps
+        self.speed = speed
+        self.direction = 1  # 1: 정방향, -1: 역방향
+        self._origin_frame = 0.0
+        self._origin_time = time.monotonic()
+
+    def start(self, frame_index, direction=1):
+        """지금 frame_index 위치에서 direction 방향으로 시계 시작"""
+        self.direction = direction
+        self._origin_frame = float(frame_index)
+        self._origin_time = time.monotonic()
+
+    def position(self):
+        """현재 재생 위치 (소수 프레임)"""
+        elapsed = time.monotonic() - self._origin_time
+        return self._origin_frame + elapsed * self.fps * self.speed * self.direction
+
+    def frame(self):
+        """지금 표시해야 할 프레임 번호"""
+        position = self.position()
+        return math.floor(position) if self.direction > 0 else math.ceil(position)
+
+    def set_fps(self, fps):
+        self._rebase()
+        self.fps = fps
+
+    def set_speed(self, speed):
+        """배속 변경 (현재 위치에서 이어서 진행)"""
+        self._rebase()
+        self.speed = speed
+
+    def tick_interval(self):
+        """화면 갱신 타이머 간격 (ms) - 프레임 간격의 절반, 4~20ms"""
+        frame_ms = 1000.0 / max(self.fps * self.speed, 1e-3)
+        return int(max(4, min(20, frame_ms / 2)))
+
+    def _rebase(self):
+        self._origin_frame = self.position()
+        self._origin_time = time.monotonic()
+
+class FrameRingBuffer:
+    """디코더 스레드와 GUI 스레드가 공유하는 고정 크기 프레임 링 버퍼"""
+
+    def __init__(self, capacity=PLAYBACK_BUFFER_SIZE):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        with self._cond:
+            return self._size
+
+    def put(self, item):
+        """프레임 추가 (가득 찬 경우 빈 슬롯이 생길 때까지 대기, 닫힌 경우 False)"""
+        with self._cond:
+            while self._size == self.capacity and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return False
+            self._slots[(self._head + self._size) % self.capacity] = item
+            self._size += 1
+            return True
+
+    def pop(self):
+        """준비된 프레임 하나를 꺼냄 (없으면 None)"""
+        with self._cond:
+            if self._size == 0:
+                return None
+            item = self._slots[self._head]
+            self._slots[self._head] = None
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+            self._cond.notify()
+            return item
+
+    def close(self):
+        """버퍼 닫기 (대기 중인 디코더 스레드 해제)"""
+        with self._cond:
+            self._closed = True
+            self._slots = [None] * self.capacity
+            self._size = 0
+            self._cond.notify_all()
+
+class FrameDecoder(QThread):
+    """재생할 프레임을 미리 디코딩/변환하여 링 버퍼에 채우는 작업 스레드"""
+
+    def __init__(self, video_path, start_frame, frame_buffer, target_size=None,
+                 quality=PLAYBACK_DISPLAY_QUALITY, clock=None, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self.start_frame = start_frame
+        self.frame_buffer = frame_buffer
+        self.target_size = QSize(target_size) if target_size is not None else None
+        self.quality = quality
+        self.clock = clock  # 주어지면 이미 지난 프레임은 변환하지 않고 건너뜀
+        self.skipped = 0
+        # 링 버퍼에 쌓인 프레임 + 표시 중인 프레임 + 변환 중인 프레임만큼 버퍼를 돌려 씀
+        self.converter = FrameConverter(frame_buffer.capacity + 2)
+        self._running = True
+
+    def set_target_size(self, size):
+        """변환 대상 크기 변경 (다음 디코딩 프레임부터 적용)"""
+        self.target_size = QSize(size)
+
+    def stop(self):
+        """디코딩 중지 및 스레드 종료 대기"""
+        self._running = False
+        self.frame_buffer.close()
+        self.wait()
+
+    def run(self):
+        cap = cv2.VideoCapture(str(self.video_path))
+        try:
+            if not cap.isOpened():
+                logger.error(f"Decoder failed to open video: {self.video_path}")
+                self.frame_buffer.put((self.start_frame, None))
+                return
+
+            if self.start_frame > 0:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, self.start_frame)
+
+            frame_index = self.start_frame
+            while self._running:
+                # 재생 시계보다 뒤처진 프레임은 디코딩만 하고 변환/전달하지 않음
+                if self.clock is not None and frame_index < self.clock.frame():
+                    if not cap.grab():
+                        self.frame_buffer.put((frame_index, None))
+                        break
+                    frame_index += 1
+                    self.skipped += 1
+                    continue
+
+                ret, frame = cap.read()
+                if not ret:
+                    # 스트림 끝 표시
+                    self.frame_buffer.put((frame_index, None))
+                    break
+
+                image = self.converter.convert(frame, self.target_size, self.quality)
+                if not self.frame_buffer.put((frame_index, image)):
+                    break
+                frame_index += 1
+
+        except Exception as e:
+            logger.error(f"Error in frame decoder: {str(e)}", exc_info=True)
+        finally:
+            cap.release()
+
+class FrameCache:
+    """(파일, 프레임 번호)를 키로 하는 디코딩 프레임 LRU 캐시 (메모리 크기 기준 제거)"""
+
+    def __init__(self, max_bytes=FRAME_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    def get(self, video_path, frame_index):
+        """캐시된 프레임 반환 (없으면 None)"""
+        key = (str(video_path), frame_index)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+    def put(self, video_path, frame_index, frame):
+        """프레임 저장 후 메모리 한도를 넘으면 오래된 프레임부터 제거"""
+        if frame.nbytes > self.max_bytes:
+            return
+
+        key = (str(video_path), frame_index)
+        with self._lock:
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old.nbytes
+            self._frames[key] = frame
+            self.current_bytes += frame.nbytes
+            self._evict()
+
+    def discard_file(self, video_path):
+        """특정 파일의 프레임 제거"""
+        video_path = str(video_path)
+        with self._lock:
+            for key in [k for k in self._frames if k[0] == video_path]:
+                self.current_bytes -= self._frames.pop(key).nbytes
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self.current_bytes = 0
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and self._frames:
+            _, frame = self._frames.popitem(last=False)
+            self.current_bytes -= frame.nbytes
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """캐시 사용 현황"""
+        return {
+            'frames': len(self._frames),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate
+        }
+
+def parse_patterns(text):
+    """쉼표/공백으로 구분된 glob 패턴 목록"""
+    return [p for p in text.replace(',', ' ').split() if p]
+
+class DirectoryScanner(QThread):
+    """os.scandir로 폴더를 탐색하여 비디오 파일을 묶음 단위로 전달하는 작업 스레드"""
+    files_found = pyqtSignal(list)
+    progress = pyqtSignal(int, int)   # 확인한 항목 수, 찾은 비디오 수
+    scan_finished = pyqtSignal(int, bool)  # 찾은 비디오 수, 취소 여부
+
+    def __init__(self, root, include_patterns=None, exclude_patterns=None, parent=None):
+        super().__init__(parent)
+        self.root = Path(root)
+        self.include_patterns = [p.lower() for p in include_patterns or []]
+        self.exclude_patterns = [p.lower() for p in exclude_patterns or []]
+        self._running = True
+
+    def cancel(self):
+        """검색 취소 요청 (끝나면 scan_finished가 취소 여부와 함께 전달됨)"""
+        self._running = False
+
+    def stop(self):
+        """검색 취소 후 스레드 종료 대기"""
+        self.cancel()
+        self.wait()
+
+    def is_excluded(self, name, relative_path):
+        name = name.lower()
+        relative_path = relative_path.lower()
+        return any(
+            fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative_path, pattern)
+            for pattern in self.exclude_patterns
+        )
+
+    def is_included(self, name, relative_path):
+        name_lower = name.lower()
+        if not name_lower.endswith(VIDEO_EXTENSIONS):
+            return False
+        if not self.include_patterns:
+            return True
+        relative_path = relative_path.lower()
+        return any(
+            fnmatch.fnmatch(name_lower, pattern) or fnmatch.fnmatch(relative_path, pattern)
+            for pattern in self.include_patterns
+        )
+
+    def run(self):
+        scanned = 0
+        found = 0
+        batch = []
+        last_emit = time.monotonic()
+        stack = [self.root]
+        root = str(self.root)
+
+        try:
+            while stack and self._running:
+                directory = stack.pop()
+                try:
+                    entries = os.scandir(directory)
+                except OSError as e:
+                    logger.warning(f"Cannot scan directory {directory}: {str(e)}")
+                    continue
+
+                with entries:
+                    for entry in entries:
+                        if not self._running:
+                            break
+                        scanned += 1
+                        relative_path = os.path.relpath(entry.path, root).replace(os.sep, '/')
+                        if self.is_excluded(entry.name, relative_path):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file() and self.is_included(entry.name, relative_path):
+                                batch.append(Path(entry.path))
+                                found += 1
+                        except OSError:
+                            continue
+
+                        now = time.monotonic()
+                        if len(batch) >= SCAN_BATCH_SIZE or now - last_emit >= SCAN_BATCH_INTERVAL:
+                            if batch:
+                                self.files_found.emit(batch)
+                                batch = []
+                            self.progress.emit(scanned, found)
+                            last_emit = now
+
+            if batch and self._running:
+                self.files_found.emit(batch)
+            self.progress.emit(scanned, found)
+
+        except Exception as e:
+            logger.error(f"Error scanning directory: {str(e)}", exc_info=True)
+        finally:
+            self.scan_finished.emit(found, not self._running)
+
+class ThumbnailCache:
+    """비디오별 타임라인 썸네일 디스크 캐시 (비디오 경로/크기/수정 시각 기준)"""
+
+    def __init__(self, cache_dir=None, count=THUMBNAIL_COUNT, height=THUMBNAIL_HEIGHT):
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR / 'thumbnails'
+        self.count = count
+        self.height = height
+
+    def video_dir(self, video_path):
+        """비디오 썸네일 저장 폴더 (파일이 바뀌면 다른 폴더가 됨)"""
+        video_path = Path(video_path)
+        stat = video_path.stat()
+        key = f"{video_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{self.count}|{self.height}"
+        return self.cache_dir / hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def slot_frame(self, slot, total_frames):
+        """썸네일 슬롯이 대표하는 프레임 번호 (구간 중앙)"""
+        return min(int((slot + 0.5) * total_frames / self.count), max(total_frames - 1, 0))
+
+    def slot_at_frame(self, frame_index, total_frames):
+        """프레임이 속한 썸네일 슬롯 번호"""
+        if total_frames <= 0:
+            return 0
+        return max(0, min(int(frame_index * self.count / total_frames), self.count - 1))
+
+    def slot_path(self, video_dir, slot):
+        return video_dir / f"{slot:03d}.jpg"
+
+    def generate(self, video_path, total_frames, should_stop=None, on_ready=None):
+        """캐시에 없는 슬롯만 디코딩하여 저장 (on_ready(slot, QImage)가 있으면 각 슬롯 전달)"""
+        cap = None
+        try:
+            video_dir = self.video_dir(video_path)
+            video_dir.mkdir(parents=True, exist_ok=True)
+
+            for slot in range(self.count):
+                if should_stop is not None and should_stop():
+                    return
+
+                slot_path = self.slot_path(video_dir, slot)
+                if slot_path.exists():
+                    if on_ready is None:
+                        continue
+                    image = QImage(str(slot_path))
+                    if not image.isNull():
+                        on_ready(slot, image)
+                        continue
+
+                # 캐시에 없는 슬롯만 디코딩
+                if cap is None:
+                    cap = cv2.VideoCapture(str(video_path))
+                    if not cap.isOpened():
+                        logger.error(f"Thumbnail generation failed to open video: {video_path}")
+                        return
+
+                cap.set(cv2.CAP_PROP_POS_FRAMES, self.slot_frame(slot, total_frames))
+                ret, frame = cap.read()
+                if not ret:
+                    continue
+
+                h, w = frame.shape[:2]
+                thumb_width = max(1, int(w * self.height / h))
+                thumb = cv2.resize(frame, (thumb_width, self.height), interpolation=cv2.INTER_AREA)
+
+                # 한글 경로에서도 동작하도록 imencode 후 직접 기록 (중간에 종료되어도 잘린 파일이 남지 않게)
+                ok, encoded = cv2.imencode('.jpg', thumb, [cv2.IMWRITE_JPEG_QUALITY, 80])
+                if ok:
+                    write_atomic(slot_path, encoded.tobytes(), durable=False)
+
+                if on_ready is not None:
+                    on_ready(slot, frame_to_qimage(thumb))
+        finally:
+            if cap is not None:
+                cap.release()
+
+class ThumbnailWorker(QThread):
+    """균등 간격 프레임을 썸네일로 만들어 디스크 캐시에 저장하는 작업 스레드"""
+    thumbnail_ready = pyqtSignal(str, int, QImage)
+
+    def __init__(self, video_path, total_frames, thumbnail_cache, parent=None):
+        super().__init__(parent)
+        self.video_path = Path(video_path)
+        self.total_frames = total_frames
+        self.thumbnail_cache = thumbnail_cache
+        self._running = True
+
+    def stop(self):
+        """썸네일 생성 취소"""
+        self._running = False
+        self.wait()
+
+    def run(self):
+        try:
+            self.thumbnail_cache.generate(
+                self.video_path, self.total_frames,
+                should_stop=lambda: not self._running,
+                on_ready=lambda slot, image: self.thumbnail_ready.emit(str(self.video_path), slot, image)
+            )
+        except Exception as e:
+            logger.error(f"Error generating thumbnails: {str(e)}", exc_info=True)
+
+def file_mode(path):
+    """기존 파일의 권한 비트 (없으면 새 파일 기본 권한 0o666 & ~umask)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
+
+def write_atomic(path, data, durable=True):
+    """같은 폴더의 임시 파일에 쓰고 교체 (중간에 중단되어도 기존 파일 유지)
+
+    durable=False면 fsync를 생략한다 (다시 만들 수 있는 캐시용).
+    """
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            # mkstemp는 소유자 전용(0600)으로 만들므로 기존 파일 권한(없으면 umask 기본값) 유지
+            if hasattr(os, 'fchmod'):
+                os.fchmod(f.fileno(), file_mode(path))
+            if durable:
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    # 교체된 디렉터리 항목도 디스크에 기록 (POSIX)
+    if durable and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+class PersistentIndex:
+    """파일 경로별 항목을 (크기, 수정 시각)과 함께 보관하는 JSON 디스크 인덱스"""
+
+    def __init__(self, index_path):
+        self.index_path = Path(index_path)
+        self.entries = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            if self.index_path.exists():
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading index {self.index_path}: {str(e)}")
+            self.entries = {}
+
+    def save(self):
+        """변경 사항이 있으면 임시 파일에 쓴 뒤 교체 (저장 스레드에서 호출, 캐시이므로 fsync 생략)"""
+        with self._lock:
+            if not self.dirty:
+                return
+            snapshot = dict(self.entries)
+            self.dirty = False
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.index_path, dumps_json(snapshot, indent=False), durable=False)
+        except Exception as e:
+            logger.error(f"Error saving index {self.index_path}: {str(e)}")
+
+    @staticmethod
+    def file_signature(path):
+        """(크기, 수정 시각) - 파일이 없으면 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def lookup(self, path, signature=None):
+        """파일이 바뀌지 않았으면 저장된 항목 반환"""
+        signature = signature or self.file_signature(path)
+        entry = self.entries.get(str(path))
+        if entry is None or signature is None:
+            return None
+        if (entry.get('size'), entry.get('mtime_ns')) != tuple(signature):
+            return None
+        return entry
+
+    def store(self, path, values, signature=None):
+        """현재 파일 상태 기준으로 항목 저장"""
+        signature = signature or self.file_signature(path)
+        if signature is None:
+            return
+        entry = dict(values)
+        entry['size'], entry['mtime_ns'] = signature
+        with self._lock:
+            self.entries[str(path)] = entry
+            self.dirty = True
+
+class KeyframeIndex:
+    """비디오별 키프레임 위치 인덱스"""
+
+    def __init__(self, keyframes):
+        self.keyframes = keyframes or [0]  # 오름차순 키프레임 번호
+
+    def keyframe_before(self, frame_index):
+        """frame_index 이하에서 가장 가까운 키프레임 번호"""
+        i = bisect_right(self.keyframes, frame_index) - 1
+        return self.keyframes[max(i, 0)]
+
+    @classmethod
+    def build(cls, video_path, should_stop=None):
+        """패킷만 읽어(디코딩 없이) 키프레임 인덱스 생성 (지원하지 않는 경우 None)"""
+        if not hasattr(cv2, 'CAP_PROP_LRF_HAS_KEY_FRAME'):
+            return None
+
+        cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+        try:
+            if not cap.isOpened():
+                return None
+
+            keyframes = []
+            frame_index = 0
+            while cap.grab():
+                if should_stop is not None and should_stop():
+                    return None
+                if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(frame_index)
+                frame_index += 1
+
+            if not keyframes:
+                return None
+            return cls(keyframes)
+        finally:
+            cap.release()
+
+def probe_video(video_path, should_stop=None, keyframes=True):
+    """비디오 컨테이너 정보 조사 (fps, 프레임 수, 해상도, 코덱, 길이, 키프레임 인덱스)
+
+    키프레임 인덱스는 패킷을 모두 읽어야 하므로 keyframes=False면 헤더 정보만 조사한다.
+    """
+    cap = cv2.VideoCapture(str(video_path))
+    try:
+        if not cap.isOpened():
+            return None
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+    finally:
+        cap.release()
+
+    codec = ''.join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00 ')
+    metadata = {
+        'fps': fps,
+        'frame_count': frame_count,
+        'width': width,
+        'height': height,
+        'codec': codec,
+        'duration': frame_count / fps if fps > 0 else 0.0
+    }
+    if keyframes:
+        keyframe_index = KeyframeIndex.build(video_path, should_stop)
+        metadata['keyframes'] = keyframe_index.keyframes if keyframe_index else None
+    return metadata
+
+class VideoMetadataCache(PersistentIndex):
+    """비디오별 메타데이터 디스크 캐시 (경로, 크기, 수정 시각 기준)
+
+    자주 다시 기록되는 인덱스를 작게 유지하기 위해 키프레임 목록은
+    비디오별 파일(keyframes/<경로 해시>.json)에 따로 저장하고, 읽을 때 합친다.
+    """
+
+    def __init__(self, index_path=None, keyframe_dir=None):
+        self.keyframe_dir = Path(keyframe_dir) if keyframe_dir else CACHE_DIR / 'keyframes'
+        super().__init__(index_path or CACHE_DIR / 'video_metadata_v2.json')
+
+    def keyframe_path(self, video_path):
+        key = str(Path(video_path).resolve())
+        return self.keyframe_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, video_path):
+        """캐시된 메타데이터 (없거나 파일이 바뀌었으면 None)"""
+        signature = self.file_signature(video_path)
+        entry = self.lookup(video_path, signature)
+        if entry is None or not entry.get('keyframe_count'):
+            return entry
+        metadata = dict(entry)
+        metadata['keyframes'] = None
+        try:
+            with open(self.keyframe_path(video_path), 'rb') as f:
+                stored = loads_json(f.read())
+            if [stored.get('size'), stored.get('mtime_ns')] == list(signature):
+                metadata['keyframes'] = stored['keyframes']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading keyframes for {video_path}: {str(e)}")
+        return metadata
+
+    def store(self, video_path, values, signature=None):
+        """메타데이터 저장 (키프레임 목록은 별도 파일로, 조사하지 않았으면 keyframe_count 없이)"""
+        signature = signature or self.file_signature(video_path)
+        if signature is None:
+            return
+        values = dict(values)
+        if 'keyframes' in values:
+            keyframes = values.pop('keyframes')
+            values['keyframe_count'] = len(keyframes) if keyframes else 0
+            if keyframes:
+                try:
+                    self.keyframe_dir.mkdir(parents=True, exist_ok=True)
+                    stored = {'size': signature[0], 'mtime_ns': signature[1], 'keyframes': keyframes}
+                    write_atomic(self.keyframe_path(video_path), dumps_json(stored, indent=False), durable=False)
+                except Exception as e:
+                    logger.error(f"Error writing keyframes for {video_path}: {str(e)}")
+                    del values['keyframe_count']  # 다음에 다시 조사
+        super().store(video_path, values, signature)
+
+    @staticmethod
+    def has_keyframe_index(metadata):
+        """키프레임 조사까지 끝난 메타데이터인지 (헤더만 조사했으면 False)"""
+        return metadata is not None and 'keyframe_count' in metadata
+
+    @staticmethod
+    def keyframe_index(metadata):
+        """메타데이터에 저장된 키프레임 인덱스"""
+        if not metadata or not metadata.get('keyframes'):
+            return None
+        return KeyframeIndex(metadata['keyframes'])
+
+class MetadataProber(QThread):
+    """목록에 추가된 비디오의 메타데이터를 백그라운드에서 조사하여 캐시에 채우는 작업 스레드
+
+    목록 전체는 헤더 정보만 조사하고, 파일 전체를 읽는 키프레임 인덱스는
+    keyframes=True로 요청된 파일(현재 비디오와 다음 몇 개)만 만든다.
+    """
+    metadata_ready = pyqtSignal(str, dict)
+
+    def __init__(self, metadata_cache, parent=None):
+        super().__init__(parent)
+        self.metadata_cache = metadata_cache
+        self._queue = deque()
+        self._queued = set()
+        self._keyframes = set()  # 키프레임 인덱스까지 만들 파일
+        self._cond = threading.Condition()
+        self._running = True
+
+    def enqueue(self, paths, front=False, keyframes=False):
+        """조사할 비디오 추가 (front=True면 가장 먼저 처리, keyframes=True면 키프레임 인덱스도)"""
+        with self._cond:
+            for path in paths:
+                key = str(path)
+                if keyframes:
+                    self._keyframes.add(key)
+                if front:
+                    if key in self._queued:
+                        self._queue.remove(key)
+                    self._queue.appendleft(key)
+                elif key not in self._queued:
+                    self._queue.append(key)
+                self._queued.add(key)
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                video_path = self._queue.popleft()
+                self._queued.discard(video_path)
+                keyframes = video_path in self._keyframes
+                self._keyframes.discard(video_path)
+
+            try:
+                metadata = self.metadata_cache.get(video_path)
+                if metadata is None or (keyframes and not VideoMetadataCache.has_keyframe_index(metadata)):
+                    signature = PersistentIndex.file_signature(video_path)
+                    metadata = probe_video(video_path, lambda: not self._running, keyframes)
+                    if metadata is None:
+                        continue
+                    self.metadata_cache.store(video_path, metadata, signature)
+                    metadata = self.metadata_cache.get(video_path) or metadata
+                self.metadata_ready.emit(video_path, metadata)
+            except Exception as e:
+                logger.error(f"Error probing video {video_path}: {str(e)}")
+
+class PrefetchedVideo:
+    """미리 열어 둔 비디오 (캡처, 메타데이터, 사이드카 어노테이션)"""
+
+    def __init__(self, video_path):
+        self.video_path = str(video_path)
+        self.cap = None
+        self.metadata = None
+        self.position = 0              # 캡처의 다음 read()가 반환할 프레임 번호
+        self.frame_bytes = 0           # 프레임 캐시에 미리 넣은 프레임 크기 합
+        self.annotation_signature = None
+        self.annotation = None         # 미리 읽은 AnnotationDocument
+
+    def annotation_for(self, json_path):
+        """미리 읽은 어노테이션 문서 (그 뒤로 파일이 바뀌었으면 None)"""
+        if self.annotation is None:
+            return None
+        if PersistentIndex.file_signature(json_path) != self.annotation_signature:
+            return None
+        return self.annotation
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+class VideoPrefetcher(QThread):
+    """파일 목록에서 다음 비디오를 미리 열어 두는 작업 스레드
+
+    캡처를 열고 첫 프레임들을 프레임 캐시에 디코딩해 두며, 사이드카 JSON을
+    읽고 썸네일 캐시를 채워 다음 파일로 넘어갈 때 기다리지 않도록 한다.
+    """
+
+    def __init__(self, frame_cache, metadata_cache, thumbnail_cache,
+                 depth=PREFETCH_DEPTH, max_bytes=PREFETCH_MAX_BYTES, parent=None):
+        super().__init__(parent)
+        self.frame_cache = frame_cache
+        self.metadata_cache = metadata_cache
+        self.thumbnail_cache = thumbnail_cache
+        self.depth = depth
+        self.max_bytes = max_bytes
+        self._targets = []   # 미리 열 비디오 경로 (우선순위 순)
+        self._ready = {}     # 경로 -> PrefetchedVideo
+        self._cond = threading.Condition()
+        self._running = True
+
+    def request(self, paths):
+        """미리 열 비디오 지정 (목록에서 빠진 비디오는 닫음)"""
+        targets = [str(path) for path in paths[:self.depth]]
+        with self._cond:
+            self._targets = targets
+            stale = [self._ready.pop(path) for path in list(self._ready) if path not in targets]
+            self._cond.notify()
+        for video in stale:
+            video.release()
+
+    def take(self, video_path):
+        """미리 열어 둔 비디오를 넘겨받음 (준비되지 않았으면 None)"""
+        video_path = str(video_path)
+        with self._cond:
+            if video_path in self._targets:
+                self._targets.remove(video_path)
+            video = self._ready.pop(video_path, None)
+        if video is not None and video.cap is None:
+            return None
+        return video
+
+    def used_bytes(self):
+        with self._cond:
+            return sum(video.frame_bytes for video in self._ready.values())
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self.wait()
+        with self._cond:
+            videos = list(self._ready.values())
+            self._ready.clear()
+        for video in videos:
+            video.release()
+
+    def _next_target(self):
+        for path in self._targets:
+            if path not in self._ready:
+                return path
+        return None
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._running and self._next_target() is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                video_path = self._next_target()
+
+            video = PrefetchedVideo(video_path)
+            try:
+                self.prefetch(video)
+            except Exception as e:
+                logger.error(f"Error prefetching video {video_path}: {str(e)}")
+                video.release()
+
+            # 준비하는 동안 대상에서 빠졌으면 버림 (실패한 경우도 다시 시도하지 않도록 보관)
+            with self._cond:
+                if self._running and video_path in self._targets:
+                    self._ready[video_path] = video
+                    video = None
+            if video is not None:
+                video.release()
+
+    def prefetch(self, video):
+        """캡처 열기, 첫 프레임 디코딩, 어노테이션 읽기, 썸네일 캐시 채우기"""
+        video_path = video.video_path
+
+        def should_stop():
+            return not self._running or video_path not in self._targets
+
+        video.cap = cv2.VideoCapture(video_path)
+        if not video.cap.isOpened():
+            video.release()
+            return
+
+        metadata = self.metadata_cache.get(video_path)
+        if metadata is None:
+            metadata = {
+                'fps': video.cap.get(cv2.CAP_PROP_FPS),
+                'frame_count': int(video.cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                'width': int(video.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(video.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            }
+        video.metadata = metadata
+
+        # 메모리 한도 안에서 첫 프레임들을 프레임 캐시에 디코딩
+        frame_size = max(metadata['width'] * metadata['height'] * 3, 1)
+        budget = max(self.max_bytes - self.used_bytes(), 0)
+        for frame_index in range(min(PREFETCH_FRAMES, budget // frame_size)):
+            if should_stop():
+                return
+            ret, frame = video.cap.read()
+            if not ret:
+                break
+            self.frame_cache.put(video_path, frame_index, frame)
+            video.frame_bytes += frame.nbytes
+            video.position = frame_index + 1
+
+        # 사이드카 어노테이션 읽기
+        json_path = Path(video_path).with_suffix('.json')
+        signature = PersistentIndex.file_signature(json_path)
+        if signature is not None:
+            try:
+                video.annotation = AnnotationDocument.load(json_path)
+                video.annotation_signature = signature
+            except Exception as e:
+                logger.warning(f"Prefetch could not read annotations {json_path}: {str(e)}")
+
+        # 타임라인 썸네일 디스크 캐시 채우기
+        if metadata['frame_count'] > 0 and not should_stop():
+            self.thumbnail_cache.generate(video_path, metadata['frame_count'], should_stop)
+
+class ReverseFrameDecoder(QThread):
+    """역재생용 디코더 스레드
+
+    직전 키프레임부터 구간을 정방향으로 디코딩해 표시 크기로 변환한 뒤
+    역순으로 링 버퍼에 넣는다. GOP가 REVERSE_CHUNK_FRAMES보다 길면 마지막
+    프레임들만 보관하고, 나머지는 다음 구간에서 다시 디코딩한다.
+    """
+
+    def __init__(self, video_path, start_frame, frame_buffer, target_size=None, keyframe_index=None,
+                 quality=PLAYBACK_DISPLAY_QUALITY, clock=None, chunk_frames=REVERSE_CHUNK_FRAMES, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self.start_frame = start_frame
+        self.frame_buffer = frame_buffer
+        self.target_size = QSize(target_size) if target_size is not None else None
+        self.keyframe_index = keyframe_index
+        self.quality = quality
+        self.clock = clock
+        self.chunk_frames = chunk_frames
+        # 구간 하나와 링 버퍼만큼의 프레임이 한꺼번에 살아 있으므로 버퍼를 미리 잡아 두지 않고
+        # 변환할 때 할당 (표시가 끝난 프레임은 바로 해제됨)
+        self.converter = FrameConverter(0)
+        self.skipped = 0
+        self._running = True
+
+    def set_target_size(self, size):
+        """변환 대상 크기 변경 (다음 디코딩 프레임부터 적용)"""
+        self.target_size = QSize(size)
+
+    def stop(self):
+        """디코딩 중지 및 스레드 종료 대기"""
+        self._running = False
+        self.frame_buffer.close()
+        self.wait()
+
+    def is_late(self, frame_index):
+        return self.clock is not None and frame_index > self.clock.frame()
+
+    def run(self):
+        cap = cv2.VideoCapture(str(self.video_path))
+        try:
+            if not cap.isOpened():
+                logger.error(f"Reverse decoder failed to open video: {self.video_path}")
+                self.frame_buffer.put((self.start_frame, None))
+                return
+
+            end = self.start_frame
+            while self._running and end >= 0:
+                # 재생 시계가 이미 지나간 구간은 디코딩하지 않음
+                if self.clock is not None:
+                    end = min(end, self.clock.frame())
+                    if end < 0:
+                        break
+
+                if self.keyframe_index is not None:
+                    key = self.keyframe_index.keyframe_before(end)
+                else:
+                    key = max(end - self.chunk_frames + 1, 0)
+                chunk_start = max(key, end - self.chunk_frames + 1)
+
+                cap.set(cv2.CAP_PROP_POS_FRAMES, key)
+                images = []
+                frame_index = key
+                while self._running and frame_index <= end:
+                    if frame_index < chunk_start or self.is_late(frame_index):
+                        ok = cap.grab()
+                        if ok and frame_index >= chunk_start:
+                            self.skipped += 1
+                    else:
+                        ok, frame = cap.read()
+                        if ok:
+                            images.append((frame_index, self.converter.convert(frame, self.target_size, self.quality)))
+                    if not ok:
+                        break
+                    frame_index += 1
+
+                if frame_index <= end and not images and frame_index == key:
+                    # 구간 시작부터 읽지 못하면 더 진행할 수 없음
+                    logger.error(f"Reverse decoder failed to read frame {key}")
+                    break
+
+                for item in reversed(images):
+                    if not self.frame_buffer.put(item):
+                        return
+                end = chunk_start - 1
+
+            # 스트림 시작 표시
+            self.frame_buffer.put((-1, None))
+
+        except Exception as e:
+            logger.error(f"Error in reverse decoder: {str(e)}", exc_info=True)
+        finally:
+            cap.release()
+
+class SeekEngine:
+    """키프레임 인덱스 기반 프레임 탐색기
+
+    프레임 캐시를 먼저 확인하고, 다음 프레임은 순차 읽기로 제공한다.
+    캐시에 없는 프레임은 직전 키프레임부터 디코딩하며 마지막 GOP 구간을
+    캐시에 채워 이후의 역방향 이동이 디코더를 거치지 않도록 한다.
+    """
+
+    def __init__(self, cap, video_path, frame_cache, keyframe_index=None, cache_size=GOP_CACHE_FRAMES):
+        self.cap = cap
+        self.video_path = str(video_path)
+        self.frame_cache = frame_cache
+        self.keyframe_index = keyframe_index
+        self.cache_size = cache_size
+        self.position = 0  # 다음 read()가 반환할 프레임 번호
+
+    def set_keyframe_index(self, keyframe_index):
+        self.keyframe_index = keyframe_index
+
+    def read_frame(self, frame_index):
+        """지정한 프레임의 BGR 이미지 반환 (읽기 실패 시 None)"""
+        frame = self.frame_cache.get(self.video_path, frame_index)
+        if frame is not None:
+            return frame
+
+        if frame_index != self.position:
+            if self.keyframe_index is None:
+                # 인덱스가 준비되기 전에는 기존 방식으로 탐색
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                self.position = frame_index
+            else:
+                keyframe = self.keyframe_index.keyframe_before(frame_index)
+                # 같은 GOP 안에서 앞으로 이동하는 경우는 탐색 없이 이어서 디코딩
+                if not (keyframe <= self.position < frame_index):
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+                    self.position = keyframe
+
+        return self._decode_until(frame_index)
+
+    def read_preview(self, frame_index):
+        """스크럽 미리보기용 프레임 반환 (캐시에 없으면 직전 키프레임만 디코딩)"""
+        frame = self.frame_cache.get(self.video_path, frame_index)
+        if frame is not None or self.keyframe_index is None:
+            return frame if frame is not None else self.read_frame(frame_index)
+
+        keyframe = self.keyframe_index.keyframe_before(frame_index)
+        frame = self.frame_cache.get(self.video_path, keyframe)
+        if frame is not None:
+            return frame
+
+        if self.position != keyframe:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+            self.position = keyframe
+        return self._decode_until(keyframe)
+
+    def _decode_until(self, frame_index):
+        """현재 위치부터 frame_index까지 디코딩하며 마지막 구간을 캐시에 저장"""
+        cache_from = frame_index - self.cache_size + 1
+        frame = None
+        while self.position <= frame_index:
+            if self.position < cache_from:
+                if not self.cap.grab():
+                    return None
+                self.position += 1
+                continue
+
+            ret, frame = self.cap.read()
+            if not ret:
+                return None
+            self.frame_cache.put(self.video_path, self.position, frame)
+            self.position += 1
+        return frame
+
 class VideoSegment:
+    """구간 하나 (duration은 항상 계산, keyframe은 따로 지정하지 않으면 구간 중앙)"""
+    __slots__ = ('start_frame', 'end_frame', 'action_type', '_keyframe', 'keypoints')
+
     def __init__(self, start_frame, end_frame, action_type=1):
         self.start_frame = start_frame
         self.end_frame = end_frame
         self.action_type = action_type
-        self.duration = end_frame - start_frame
-        self.keyframe = (start_frame + end_frame) // 2  # 웹 버전과 일치
-        self.keypoints = []  # 웹 버전과 일치
+        self._keyframe = None   # 지정된 키프레임 (None이면 구간 중앙)
+        self.keypoints = ()     # 웹 버전과 일치 (비어 있으면 공유 튜플)
+
+    @property
+    def duration(self):
+        return self.end_frame - self.start_frame
+
+    @property
+    def keyframe(self):
+        """지정된 키프레임 (구간을 벗어나면 구간 중앙, 웹 버전과 일치)"""
+        keyframe = self._keyframe
+        if keyframe is None or not self.start_frame <= keyframe <= self.end_frame:
+            return (self.start_frame + self.end_frame) // 2
+        return keyframe
+
+    @keyframe.setter
+    def keyframe(self, value):
+        self._keyframe = value
+
+    def snapshot(self):
+        """되돌리기용 필드 값"""
+        return self.start_frame, self.end_frame, self.action_type, self._keyframe, self.keypoints
+
+    def restore(self, snapshot):
+        self.start_frame, self.end_frame, self.action_type, self._keyframe, self.keypoints = snapshot
+
+    @classmethod
+    def from_dict(cls, data):
+        """저장된 구간에서 생성 (duration은 시작/종료 프레임으로 다시 계산)"""
+        segment = cls(int(data['start_frame']), int(data['end_frame']), int(data['action_type']))
+        if 'keyframe' in data:
+            segment._keyframe = int(data['keyframe'])
+        segment.keypoints = data.get('keypoints') or ()
+        return segment
+
+    def to_dict(self, segment_id):
+        return {
+            'segment_id': segment_id,
+            'action_type': self.action_type,
+            'start_frame': self.start_frame,
+            'end_frame': self.end_frame,
+            'duration': self.duration,
+            'keyframe': self.keyframe,
+            'keypoints': self.keypoints
+        }
+
+# 구간 목록의 열 단위 표현 (정렬, 겹침 검사, 통계 등 일괄 연산용)
+SEGMENT_DTYPE = np.dtype([
+    ('start_frame', np.int64),
+    ('end_frame', np.int64),
+    ('action_type', np.int64),
+    ('keyframe', np.int64)
+])
+
+def segment_columns(segments):
+    """구간 목록을 구조화 배열로 변환 (목록 순서 유지)"""
+    return np.fromiter(
+        ((s.start_frame, s.end_frame, s.action_type, s.keyframe) for s in segments),
+        dtype=SEGMENT_DTYPE, count=len(segments)
+    )
+
+def count_overlaps(columns):
+    """앞선 구간과 겹치는 구간 수 (시작 프레임 순으로 정렬 후 끝 프레임 누적 최댓값과 비교)"""
+    if len(columns) < 2:
+        return 0
+    ordered = columns[np.argsort(columns['start_frame'], kind='stable')]
+    max_end = np.maximum.accumulate(ordered['end_frame'])
+    return int(np.count_nonzero(ordered['start_frame'][1:] <= max_end[:-1]))
+
+def action_summary(columns):
+    """액션 타입별 (구간 수, 프레임 합)"""
+    if len(columns) == 0:
+        return {}
+    actions, inverse = np.unique(columns['action_type'], return_inverse=True)
+    counts = np.bincount(inverse)
+    frames = np.bincount(inverse, weights=columns['end_frame'] - columns['start_frame'])
+    return {int(a): (int(c), int(f)) for a, c, f in zip(actions, counts, frames)}
+
+class SegmentIndex:
+    """세그먼트 구간 인덱스
+
+    시작 프레임 순으로 정렬된 목록과 끝 프레임의 누적 최댓값을 함께 유지하여
+    특정 프레임/구간과 겹치는 세그먼트를 이분 탐색으로 찾는다.
+    추가/삭제/수정 시 변경 위치 이후만 다시 계산한다.
+    """
+
+    def __init__(self, segments=()):
+        self.rebuild(segments)
+
+    def __len__(self):
+        return len(self._segments)
+
+    def rebuild(self, segments):
+        """세그먼트 목록으로 인덱스 전체 재구성"""
+        self._seq = 0
+        self._keys = {}         # id(segment) -> (start_frame, seq)
+        self._sorted_keys = []  # 정렬된 (start_frame, seq)
+        self._starts = []       # 정렬된 시작 프레임
+        self._segments = []     # 시작 프레임 순 세그먼트
+        self._max_end = []      # 앞에서부터의 끝 프레임 최댓값
+        entries = []
+        for segment in segments:
+            key = (segment.start_frame, self._next_seq())
+            self._keys[id(segment)] = key
+            entries.append((key, segment))
+        entries.sort(key=lambda entry: entry[0])
+        for key, segment in entries:
+            self._sorted_keys.append(key)
+            self._starts.append(key[0])
+            self._segments.append(segment)
+        self._max_end = [0] * len(self._segments)
+        self._refresh_max_end(0)
+
+    def add(self, segment):
+        """세그먼트 추가"""
+        key = (segment.start_frame, self._next_seq())
+        pos = bisect_right(self._sorted_keys, key)
+        self._keys[id(segment)] = key
+        self._sorted_keys.insert(pos, key)
+        self._starts.insert(pos, key[0])
+        self._segments.insert(pos, segment)
+        self._max_end.insert(pos, 0)
+        self._refresh_max_end(pos)
+
+    def remove(self, segment):
+        """세그먼트 제거"""
+        key = self._keys.pop(id(segment), None)
+        if key is None:
+            return
+        pos = bisect_left(self._sorted_keys, key)
+        del self._sorted_keys[pos]
+        del self._starts[pos]
+        del self._segments[pos]
+        del self._max_end[pos]
+        self._refresh_max_end(pos)
+
+    def update(self, segment):
+        """시작/끝 프레임이 바뀐 세그먼트 위치 갱신"""
+        self.remove(segment)
+        self.add(segment)
+
+    def at(self, frame):
+        """frame을 포함하는 세그먼트 목록 (시작 프레임이 늦은 순)"""
+        return self.overlapping(frame, frame)
+
+    def overlapping(self, start_frame, end_frame):
+        """[start_frame, end_frame] 구간과 겹치는 세그먼트 목록 (시작 프레임이 늦은 순)"""
+        result = []
+        i = bisect_right(self._starts, end_frame) - 1
+        while i >= 0 and self._max_end[i] >= start_frame:
+            segment = self._segments[i]
+            if segment.end_frame >= start_frame:
+                result.append(segment)
+            i -= 1
+        return result
+
+    def overlaps_of(self, segment):
+        """해당 세그먼트와 겹치는 다른 세그먼트 목록"""
+        return [
+            other for other in self.overlapping(segment.start_frame, segment.end_frame)
+            if other is not segment
+        ]
+
+    def _next_seq(self):
+        self._seq += 1
+        return self._seq
+
+    def _refresh_max_end(self, pos):
+        """pos 이후의 끝 프레임 누적 최댓값 재계산"""
+        current = self._max_end[pos - 1] if pos > 0 else float('-inf')
+        for i in range(pos, len(self._segments)):
+            current = max(current, self._segments[i].end_frame)
+            self._max_end[i] = current
 
 class TimelineWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(60)
         self.segments = []
+        self.segment_index = SegmentIndex()
         self.total_frames = 0
         self.current_frame = 0
+        self.view_start = 0.0  # 화면 왼쪽 끝 프레임
+        self.view_span = 0.0   # 화면에 보이는 프레임 수
         self.marking_start = None
+        self.thumbnail_cache = ThumbnailCache()
+        self.thumbnails = {}  # 슬롯 번호 -> QPixmap
+        self._background = None  # 정적 레이어 캐시 픽스맵
+        self._background_size = None
 
-        # 틴더 스타일의 색상 테마 수정
-        self.colors = {
-            4: "#9e9e9e",  # 기타: 회색
-            1: "#2196f3",  # 탐색: 파란색
-            2: "#4caf50",  # 사용: 초록색
-            3: "#fe3c72"   # 종료: 틴더 메인 색상
-        }
-        self.action_names = {
-            4: "기타",
-            1: "탐색",
-            2: "사용",
-            3: "종료"
-        }
+        self.colors = dict(ACTION_COLORS)
+        self.action_names = dict(ACTION_NAMES)
         
         self.setMouseTracking(True)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-            }
-        """)
+        self.setObjectName('timeline')
+
+        # 썸네일 호버 미리보기 팝업
+        self.preview_popup = QLabel(self, Qt.ToolTip)
+        self.preview_popup.setObjectName('thumbnailPreview')
+        self.preview_popup.hide()
+
+    def set_thumbnail(self, slot, image):
+        """필름스트립 썸네일 설정"""
+        self.thumbnails[slot] = QPixmap.fromImage(image)
+        self.invalidate_background()
+
+    def clear_thumbnails(self):
+        """필름스트립 썸네일 초기화"""
+        self.thumbnails = {}
+        self.preview_popup.hide()
+        self.invalidate_background()
+
+    def show_preview(self, x):
+        """마우스 위치의 썸네일 미리보기 표시 (이미 생성된 썸네일만 사용)"""
+        frame = int(self.x_to_frame(x))
+        pixmap = self.thumbnails.get(self.thumbnail_cache.slot_at_frame(frame, self.total_frames))
+        if pixmap is None:
+            self.preview_popup.hide()
+            return
+
+        self.preview_popup.setPixmap(pixmap)
+        self.preview_popup.adjustSize()
+        pos = self.mapToGlobal(QPoint(x - self.preview_popup.width() // 2, -self.preview_popup.height() - 6))
+        self.preview_popup.move(pos)
+        self.preview_popup.show()
+
+    def leaveEvent(self, event):
+        self.preview_popup.hide()
+        super().leaveEvent(event)
+
+    def invalidate_background(self):
+        """정적 레이어 캐시 무효화 후 전체 다시 그리기"""
+        self._background = None
+        self.update()
+
+    def set_segments(self, segments):
+        """세그먼트 목록 설정 (인덱스 전체 재구성)"""
+        self.segments = segments
+        self.segment_index.rebuild(segments)
+        self.invalidate_background()
+
+    def segment_added(self, segment):
+        """세그먼트 추가 반영"""
+        self.segment_index.add(segment)
+        self.invalidate_background()
+
+    def segment_removed(self, segment):
+        """세그먼트 삭제 반영"""
+        self.segment_index.remove(segment)
+        self.invalidate_background()
 
-        # 그림자 효과 추가
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        self.setGraphicsEffect(shadow)
+    def segment_changed(self, segment):
+        """세그먼트 수정 반영"""
+        self.segment_index.update(segment)
+        self.invalidate_background()
+
+    def segments_at_x(self, x):
+        """x 좌표(픽셀 한 칸)에 걸치는 세그먼트 목록"""
+        return self.segment_index.overlapping(self.x_to_frame(x), self.x_to_frame(x + 1))
+
+    def frame_to_x(self, frame):
+        """프레임 번호를 x 좌표로 변환 (현재 확대/이동 상태 기준)"""
+        if not self.view_span:
+            return 0
+        return int((frame - self.view_start) / self.view_span * self.width())
+
+    def x_to_frame(self, x):
+        """x 좌표를 프레임 번호(실수)로 변환"""
+        return self.view_start + x / max(self.width(), 1) * self.view_span
+
+    def visible_range(self):
+        """화면에 보이는 프레임 구간"""
+        return self.view_start, self.view_start + self.view_span
+
+    def is_zoomed(self):
+        return self.view_span < self.total_frames
+
+    def set_view(self, start, span):
+        """보이는 구간 설정 (전체 범위 안으로 제한)"""
+        span = max(min(TIMELINE_MIN_VISIBLE_FRAMES, self.total_frames), min(span, self.total_frames))
+        start = max(0.0, min(start, self.total_frames - span))
+        if (start, span) != (self.view_start, self.view_span):
+            self.view_start = start
+            self.view_span = span
+            self.invalidate_background()
+
+    def zoom(self, factor, anchor_x):
+        """anchor_x 위치의 프레임을 고정한 채 확대/축소"""
+        anchor_frame = self.x_to_frame(anchor_x)
+        span = self.view_span / factor
+        self.set_view(anchor_frame - anchor_x / max(self.width(), 1) * span, span)
+
+    def reset_view(self):
+        """전체 보기로 되돌리기"""
+        self.set_view(0, self.total_frames)
+
+    def ensure_visible(self, frame):
+        """프레임이 화면 밖이면 보이도록 이동"""
+        view_start, view_end = self.visible_range()
+        if frame < view_start or frame > view_end:
+            self.set_view(frame - self.view_span * 0.1, self.view_span)
+
+    def playhead_rect(self, frame):
+        """현재 프레임 마커가 차지하는 영역"""
+        x = self.frame_to_x(frame)
+        return QRect(x - 7, self.height() - 10, 15, 10)
 
     def set_current_frame(self, frame):
-        """현재 프레임 설정"""
+        """현재 프레임 설정 (이전/새 마커 영역만 다시 그리기)"""
+        if frame == self.current_frame:
+            return
+        old_rect = self.playhead_rect(self.current_frame)
         self.current_frame = frame
-        self.update()
+        if self.is_zoomed():
+            # 확대 상태에서 재생 위치가 화면을 벗어나면 따라가기
+            self.ensure_visible(frame)
+        self.update(old_rect)
+        self.update(self.playhead_rect(frame))
 
     def set_total_frames(self, total):
-        """전체 프레임 수 설정"""
+        """전체 프레임 수 설정 (전체 보기로 초기화)"""
+        if total == self.total_frames:
+            return
         self.total_frames = total
-        self.update()
+        self.view_start = 0.0
+        self.view_span = float(total)
+        self.invalidate_background()
 
     def set_marking_start(self, frame):
         """구간 표시 시작점 설정"""
         self.marking_start = frame
-        self.update()
+        self.invalidate_background()
 
     def clear_marking_start(self):
         """구간 표시 시작점 초기화"""
         self.marking_start = None
-        self.update()
+        self.invalidate_background()
+
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+
+    def wheelEvent(self, event):
+        """휠: 마우스 위치 기준 확대/축소, Shift+휠: 좌우 이동"""
+        try:
+            if not self.total_frames:
+                return
+
+            steps = event.angleDelta().y() / 120
+            if not steps:
+                steps = event.angleDelta().x() / 120
+            if event.modifiers() & Qt.ShiftModifier:
+                self.set_view(self.view_start - steps * self.view_span * 0.1, self.view_span)
+            else:
+                self.zoom(1.25 ** steps, event.pos().x())
+            event.accept()
+
+        except Exception as e:
+            logger.error(f"Error in wheelEvent: {str(e)}")
 
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트 처리"""
@@ -111,50 +1739,58 @@ class TimelineWidget(QFrame):
             if self.total_frames == 0 or not self.segments:
                 return
 
-            x = event.pos().x()
-            width = self.width()
-
             # 세그먼트 선택 확인
-            for i, segment in enumerate(self.segments):
-                start_x = int((segment.start_frame / self.total_frames) * width)
-                end_x = int((segment.end_frame / self.total_frames) * width)
-                
-                if start_x <= x <= end_x:
-                    # 직접 부모 객체의 edit_segment 메서드 호출
-                    window = self.window()
-                    if hasattr(window, 'edit_segment'):
-                        window.edit_segment(i)
-                    return
+            hits = self.segments_at_x(event.pos().x())
+            if hits:
+                # 직접 부모 객체의 edit_segment 메서드 호출
+                window = self.window()
+                if hasattr(window, 'edit_segment'):
+                    window.edit_segment(self.segments.index(hits[0]))
 
         except Exception as e:
             logger.error(f"Error in mousePressEvent: {str(e)}", exc_info=True)
 
+    def mouseDoubleClickEvent(self, event):
+        """빈 곳 더블클릭: 전체 보기로 되돌리기"""
+        try:
+            if self.total_frames and not self.segments_at_x(event.pos().x()):
+                self.reset_view()
+                event.accept()
+
+        except Exception as e:
+            logger.error(f"Error in mouseDoubleClickEvent: {str(e)}")
+
     def mouseMoveEvent(self, event):
         """마우스 이동 이벤트 처리"""
         try:
-            if self.total_frames == 0 or not self.segments:
+            if self.total_frames == 0:
                 return
 
             x = event.pos().x()
-            width = self.width()
+
+            # 썸네일 미리보기
+            self.show_preview(x)
+
+            if not self.segments:
+                return
             
             # 타임라인 내에서 마우스 이동 시 세그먼트 정보 표시
-            for segment in self.segments:
-                start_x = int((segment.start_frame / self.total_frames) * width)
-                end_x = int((segment.end_frame / self.total_frames) * width)
+            hits = self.segments_at_x(x)
+            if hits:
+                segment = hits[0]
+                fps = getattr(self.window(), 'fps', 15)
+                start_time = segment.start_frame / fps
+                end_time = segment.end_frame / fps
+                duration = segment.duration / fps
                 
-                if start_x <= x <= end_x:
-                    fps = getattr(self.window(), 'fps', 15)
-                    start_time = segment.start_frame / fps
-                    end_time = segment.end_frame / fps
-                    duration = segment.duration / fps
-                    
-                    tooltip = (f"시작: {segment.start_frame}프레임 ({start_time:.2f}초)\n"
-                             f"종료: {segment.end_frame}프레임 ({end_time:.2f}초)\n"
-                             f"길이: {duration:.2f}초\n"
-                             f"타입: {self.action_names[segment.action_type]}")
-                    QToolTip.showText(event.globalPos(), tooltip)
-                    return
+                tooltip = (f"시작: {segment.start_frame}프레임 ({start_time:.2f}초)\n"
+                         f"종료: {segment.end_frame}프레임 ({end_time:.2f}초)\n"
+                         f"길이: {duration:.2f}초\n"
+                         f"타입: {self.action_names[segment.action_type]}")
+                if len(hits) > 1:
+                    tooltip += f"\n겹친 구간: {len(hits) - 1}개"
+                QToolTip.showText(event.globalPos(), tooltip)
+                return
             
             QToolTip.hideText()
             
@@ -162,96 +1798,371 @@ class TimelineWidget(QFrame):
             logger.error(f"Error in mouseMoveEvent: {str(e)}")
 
     def paintEvent(self, event):
-        """타임라인 렌더링"""
+        """타임라인 렌더링 (캐시된 정적 레이어 + 현재 프레임 마커)"""
         try:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
 
-            width = self.width()
-            height = self.height()
+            if self._background is None or self._background_size != self.size():
+                self._background = self.render_background()
+                self._background_size = self.size()
 
-            # 배경 그리기
-            painter.fillRect(0, 0, width, height, QColor("white"))
+            # 갱신 영역만 캐시에서 복사 (페인터가 갱신 영역으로 클리핑됨)
+            painter.drawPixmap(0, 0, self._background)
 
             if not self.total_frames:
                 return
 
-            # 그리드 라인 그리기 (10% 간격)
-            pen = QPen(QColor("#f0f0f0"))
+            # 현재 프레임 위치 표시
+            view_start, view_end = self.visible_range()
+            if self.current_frame > 0 and view_start <= self.current_frame <= view_end:
+                try:
+                    painter.setRenderHint(QPainter.Antialiasing)
+                    marker_x = self.frame_to_x(self.current_frame)
+                    height = self.height()
+                    painter.setPen(QPen(QColor(THEME_COLORS['accent']), 2))
+                    painter.setBrush(QColor(THEME_COLORS['accent']))  # 채우기 색상 설정
+                    
+                    # 삼각형 그리기
+                    points = [
+                        QPoint(marker_x, height),
+                        QPoint(marker_x - 5, height - 8),
+                        QPoint(marker_x + 5, height - 8)
+                    ]
+                    painter.drawPolygon(QPolygon(points))
+                except Exception as e:
+                    logger.error(f"Error drawing current frame marker: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Error in paintEvent: {str(e)}")
+
+    def render_background(self):
+        """정적 레이어(필름스트립, 그리드, 세그먼트, 키프레임 마커, 구간 시작점)를 픽스맵으로 렌더링"""
+        width = self.width()
+        height = self.height()
+
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+
+        # 배경 그리기
+        pixmap.fill(QColor(THEME_COLORS['surface']))
+
+        if not self.total_frames:
+            self.draw_frame(pixmap, width, height)
+            return pixmap
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        try:
+            # 필름스트립 그리기
+            if self.thumbnails:
+                self.draw_filmstrip(painter, width, height)
+
+            # 그리드 라인 그리기 (보이는 구간의 10% 간격)
+            pen = QPen(QColor(THEME_COLORS['hover']))
             pen.setWidth(1)
             painter.setPen(pen)
             for i in range(1, 10):
                 x = int(width * i / 10)
                 painter.drawLine(x, 0, x, height)
 
-            # 세그먼트 그리기
-            for i, segment in enumerate(self.segments):
+            # 보이는 구간과 겹치는 세그먼트만 그리기
+            view_start, view_end = self.visible_range()
+            scale = width / self.view_span
+            density = {}  # 픽셀 열 -> {액션 타입: 개수}
+            for segment in self.segment_index.overlapping(view_start, view_end):
                 try:
-                    start_x = int((segment.start_frame / self.total_frames) * width)
-                    end_x = int((segment.end_frame / self.total_frames) * width)
-                    
-                    # 세그먼트 색상
-                    color = QColor(self.colors.get(segment.action_type, "#9e9e9e"))
-                    
-                    # 그라데이션 설정
-                    gradient = QLinearGradient(start_x, 0, end_x, 0)
-                    gradient.setColorAt(0, color.lighter(120))
-                    gradient.setColorAt(1, color)
-                    
-                    # 세그먼트 영역 그리기
-                    path = QPainterPath()
-                    rect = QRectF(start_x, height/3, end_x - start_x, height/3)
-                    path.addRoundedRect(rect, 3, 3)  # 둥근 모서리
-                    painter.fillPath(path, gradient)
-
-                    # 테두리 그리기
-                    painter.setPen(QPen(color.darker(110), 1))
-                    painter.drawPath(path)
-                    
-                    # 키프레임 마커 그리기 부분 수정
-                    keyframe_x = int((segment.keyframe / self.total_frames) * width)
-                    marker_height = int(height/6)
-                    painter.setPen(QPen(Qt.white, 2))
-                    painter.drawLine(
-                        keyframe_x, 
-                        int(height/3 + marker_height), 
-                        keyframe_x, 
-                        int(2*height/3 - marker_height)
-                    )
+                    start_x = (segment.start_frame - view_start) * scale
+                    end_x = (segment.end_frame - view_start) * scale
+
+                    # 너무 좁은 세그먼트는 밀도 막대로 합치기
+                    if end_x - start_x < TIMELINE_LOD_MIN_WIDTH:
+                        column = max(0, min(int(start_x), width - 1))
+                        counts = density.setdefault(column, {})
+                        counts[segment.action_type] = counts.get(segment.action_type, 0) + 1
+                        continue
+
+                    self.draw_segment(painter, segment, int(start_x), int(end_x), height)
                     
                 except Exception as e:
-                    logger.error(f"Error drawing segment {i}: {str(e)}")
+                    logger.error(f"Error drawing segment: {str(e)}")
+
+            if density:
+                self.draw_density(painter, density, height)
 
             # 구간 표시 시작점 그리기
-            if self.marking_start is not None:
+            if self.marking_start is not None and view_start <= self.marking_start <= view_end:
                 try:
-                    marker_x = int((self.marking_start / self.total_frames) * width)
-                    pen = QPen(QColor("#ffd700"), 2)  # 굵기 2의 황금색 선
+                    marker_x = self.frame_to_x(self.marking_start)
+                    pen = QPen(QColor(THEME_COLORS['marker']), 2)  # 굵기 2의 황금색 선
                     pen.setStyle(Qt.SolidLine)  # 실선으로 설정
                     painter.setPen(pen)
                     painter.drawLine(marker_x, 0, marker_x, height)  # 전체 높이로 그리기
                 except Exception as e:
                     logger.error(f"Error drawing marking line: {str(e)}")
 
-            # 현재 프레임 위치 표시
-            if self.current_frame > 0:
-                try:
-                    marker_x = int((self.current_frame / self.total_frames) * width)
-                    painter.setPen(QPen(QColor("#fe3c72"), 2))
-                    painter.setBrush(QColor("#fe3c72"))  # 채우기 색상 설정
-                    
-                    # 삼각형 그리기
-                    points = [
-                        QPoint(marker_x, height),
-                        QPoint(marker_x - 5, height - 8),
-                        QPoint(marker_x + 5, height - 8)
-                    ]
-                    painter.drawPolygon(QPolygon(points))
-                except Exception as e:
-                    logger.error(f"Error drawing current frame marker: {str(e)}")
+            # 확대 상태면 전체 중 보이는 위치를 상단에 표시
+            if self.is_zoomed():
+                bar_x = int(self.view_start / self.total_frames * width)
+                bar_width = max(int(self.view_span / self.total_frames * width), 4)
+                painter.fillRect(0, 0, width, 3, QColor(THEME_COLORS['hover']))
+                painter.fillRect(bar_x, 0, bar_width, 3, QColor(THEME_COLORS['accent']))
+        finally:
+            painter.end()
+
+        self.draw_frame(pixmap, width, height)
+        return pixmap
+
+    def draw_frame(self, pixmap, width, height):
+        """테두리를 정적 레이어에 함께 그림
+
+        그래픽 효과(그림자)는 마커만 움직여도 위젯 전체를 다시 그리므로 쓰지 않는다.
+        """
+        painter = QPainter(pixmap)
+        try:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(QColor(THEME_COLORS['border']), 1))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(QRectF(0.5, 0.5, width - 1, height - 1), 6, 6)
+        finally:
+            painter.end()
+
+    def draw_segment(self, painter, segment, start_x, end_x, height):
+        """세그먼트 막대와 키프레임 마커 그리기"""
+        # 세그먼트 색상
+        color = QColor(self.colors.get(segment.action_type, ACTION_COLORS[4]))
+        
+        # 그라데이션 설정
+        gradient = QLinearGradient(start_x, 0, end_x, 0)
+        gradient.setColorAt(0, color.lighter(120))
+        gradient.setColorAt(1, color)
+        
+        # 세그먼트 영역 그리기
+        path = QPainterPath()
+        rect = QRectF(start_x, height/3, end_x - start_x, height/3)
+        path.addRoundedRect(rect, 3, 3)  # 둥근 모서리
+        painter.fillPath(path, gradient)
+
+        # 테두리 그리기
+        painter.setPen(QPen(color.darker(110), 1))
+        painter.drawPath(path)
+        
+        # 키프레임 마커 그리기
+        keyframe_x = self.frame_to_x(segment.keyframe)
+        marker_height = int(height/6)
+        painter.setPen(QPen(QColor(THEME_COLORS['surface']), 2))
+        painter.drawLine(
+            keyframe_x, 
+            int(height/3 + marker_height), 
+            keyframe_x, 
+            int(2*height/3 - marker_height)
+        )
+
+    def draw_density(self, painter, density, height):
+        """픽셀보다 좁은 세그먼트들을 열 단위 밀도 막대로 그리기"""
+        max_count = max(sum(counts.values()) for counts in density.values())
+        for column, counts in density.items():
+            total = sum(counts.values())
+            action_type = max(counts, key=counts.get)
+            bar_height = height / 3 * (0.4 + 0.6 * total / max_count)
+            painter.fillRect(
+                QRectF(column, (height - bar_height) / 2, 1, bar_height),
+                QColor(self.colors.get(action_type, ACTION_COLORS[4]))
+            )
+
+    def draw_filmstrip(self, painter, width, height):
+        """썸네일 필름스트립을 타임라인 배경으로 그리기 (보이는 슬롯만)"""
+        painter.save()
+        painter.setOpacity(0.35)
+        slot_frames = self.total_frames / self.thumbnail_cache.count
+        tile_width = slot_frames / self.view_span * width
+        for slot, pixmap in self.thumbnails.items():
+            tile_x = (slot * slot_frames - self.view_start) / self.view_span * width
+            if tile_x + tile_width < 0 or tile_x > width:
+                continue
+            target = QRectF(tile_x, 0, tile_width, height)
+
+            # 타일 비율에 맞춰 썸네일 가운데 부분만 사용
+            source_width = min(pixmap.width(), pixmap.height() * tile_width / height)
+            source_height = min(pixmap.height(), pixmap.width() * height / tile_width)
+            source = QRectF(
+                (pixmap.width() - source_width) / 2,
+                (pixmap.height() - source_height) / 2,
+                source_width,
+                source_height
+            )
+            painter.drawPixmap(target, pixmap, source)
+        painter.restore()
+
+def iter_keypoints(keypoints):
+    """저장된 keypoints 구조에서 (object_id, x, y) 좌표 추출
+
+    객체별 {'object_id', 'keypoints'} 목록, [x, y(, v)] 목록, COCO 형식의
+    평탄한 [x1, y1, v1, ...] 목록을 모두 허용한다.
+    """
+    for i, entry in enumerate(keypoints or []):
+        if isinstance(entry, dict):
+            if 'keypoints' in entry:
+                object_id = entry.get('object_id', i)
+                points = entry['keypoints'] or []
+                if points and all(isinstance(v, (int, float)) for v in points):
+                    step = 3 if len(points) % 3 == 0 else 2
+                    for j in range(0, len(points) - 1, step):
+                        if step == 3 and points[j + 2] == 0:
+                            continue  # 표시되지 않은 점
+                        yield object_id, points[j], points[j + 1]
+                else:
+                    for point in points:
+                        if isinstance(point, dict) and 'x' in point and 'y' in point:
+                            yield object_id, point['x'], point['y']
+                        elif isinstance(point, (list, tuple)) and len(point) >= 2:
+                            yield object_id, point[0], point[1]
+            elif 'x' in entry and 'y' in entry:
+                yield 0, entry['x'], entry['y']
+        elif isinstance(entry, (list, tuple)) and len(entry) >= 2:
+            yield 0, entry[0], entry[1]
+
+class VideoCanvas(QWidget):
+    """최신 프레임을 paintEvent에서 직접 그리는 비디오 표시 위젯
+
+    영상 비율에 맞춘 표시 영역은 크기나 해상도가 바뀔 때만 다시 계산하고,
+    현재 프레임의 세그먼트 이름, 키프레임 keypoints, 구간 시작 표시를
+    같은 그리기 단계에서 겹쳐 그린다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.image = None
+        self.frame_index = 0
+        self.smooth = True
+        self.video_size = QSize()   # 원본 해상도 (keypoint 좌표 기준)
+        self.frame_rect = QRect()   # 위젯 안에서 영상이 그려지는 영역
+        self.marking_start = None
+        self.segment_index = None
+        self.colors = {}
+        self.action_names = {}
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(1, 1)
+
+    def set_overlay_source(self, segment_index, colors, action_names):
+        """오버레이에 사용할 세그먼트 인덱스와 색상/이름"""
+        self.segment_index = segment_index
+        self.colors = colors
+        self.action_names = action_names
+
+    def set_video_size(self, width, height):
+        """원본 해상도 설정 (표시 영역 재계산)"""
+        self.video_size = QSize(width, height)
+        self.update_frame_rect()
+
+    def set_frame(self, image, frame_index, smooth=True):
+        """표시할 프레임 지정 (다음 그리기에서 반영)"""
+        self.image = image
+        self.frame_index = frame_index
+        self.smooth = smooth
+        if not self.video_size.isValid() or self.video_size.isEmpty():
+            self.set_video_size(image.width(), image.height())
+        self.update()
+
+    def clear(self):
+        self.image = None
+        self.marking_start = None
+        self.update()
+
+    def set_marking_start(self, frame):
+        self.marking_start = frame
+        self.update()
+
+    def clear_marking_start(self):
+        self.marking_start = None
+        self.update()
+
+    def update_frame_rect(self):
+        """영상 비율을 유지하며 위젯 중앙에 들어가는 최대 영역"""
+        if not self.video_size.isValid() or self.video_size.isEmpty():
+            self.frame_rect = QRect(self.rect())
+        else:
+            size = self.video_size.scaled(self.size(), Qt.KeepAspectRatio)
+            self.frame_rect = QRect(
+                (self.width() - size.width()) // 2,
+                (self.height() - size.height()) // 2,
+                size.width(), size.height()
+            )
+        self.update()
+
+    def resizeEvent(self, event):
+        self.update_frame_rect()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        try:
+            painter.fillRect(event.rect(), QColor(THEME_COLORS['video']))
+            if self.image is None:
+                return
+
+            # 프레임은 이미 표시 크기로 변환되어 오므로 보통은 1:1로 그려짐
+            if self.image.size() != self.frame_rect.size():
+                painter.setRenderHint(QPainter.SmoothPixmapTransform, self.smooth)
+            painter.drawImage(self.frame_rect, self.image)
+
+            self.draw_overlays(painter)
+        finally:
+            painter.end()
+
+    def draw_overlays(self, painter):
+        """세그먼트 이름, keypoints, 구간 시작 표시"""
+        painter.setRenderHint(QPainter.Antialiasing)
+        font = painter.font()
+        font.setPointSize(10)
+        font.setBold(True)
+        painter.setFont(font)
+        metrics = painter.fontMetrics()
 
-        except Exception as e:
-            logger.error(f"Error in paintEvent: {str(e)}")
+        x = self.frame_rect.left() + 8
+        y = self.frame_rect.top() + 8
+        segments = self.segment_index.at(self.frame_index) if self.segment_index is not None else []
+
+        # 현재 프레임을 포함하는 세그먼트 이름 (시작이 빠른 순)
+        for segment in reversed(segments):
+            color = QColor(self.colors.get(segment.action_type, ACTION_COLORS[4]))
+            text = (f"{self.action_names.get(segment.action_type, segment.action_type)} "
+                    f"{segment.start_frame}-{segment.end_frame}")
+            box = QRect(x, y, metrics.horizontalAdvance(text) + 12, metrics.height() + 6)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(box, 4, 4)
+            painter.setPen(QColor(THEME_COLORS['surface']))
+            painter.drawText(box, Qt.AlignCenter, text)
+            y += box.height() + 4
+
+        # 키프레임에서는 저장된 keypoints 표시 (원본 해상도 좌표)
+        if self.video_size.isValid() and not self.video_size.isEmpty():
+            sx = self.frame_rect.width() / self.video_size.width()
+            sy = self.frame_rect.height() / self.video_size.height()
+            for segment in segments:
+                if segment.keyframe != self.frame_index or not segment.keypoints:
+                    continue
+                color = QColor(self.colors.get(segment.action_type, ACTION_COLORS[4]))
+                painter.setPen(QPen(QColor(THEME_COLORS['surface']), 1))
+                painter.setBrush(color)
+                for _, px, py in iter_keypoints(segment.keypoints):
+                    center = QPointF(self.frame_rect.left() + px * sx, self.frame_rect.top() + py * sy)
+                    painter.drawEllipse(center, 4, 4)
+
+        # 구간 표시 중이면 시작 프레임과 현재까지의 길이 표시
+        if self.marking_start is not None:
+            text = f"● 구간 시작 {self.marking_start} (+{self.frame_index - self.marking_start})"
+            box = QRect(0, 0, metrics.horizontalAdvance(text) + 12, metrics.height() + 6)
+            box.moveTopRight(QPoint(self.frame_rect.right() - 8, self.frame_rect.top() + 8))
+            painter.setPen(Qt.NoPen)
+            accent = QColor(THEME_COLORS['accent'])
+            accent.setAlpha(220)
+            painter.setBrush(accent)
+            painter.drawRoundedRect(box, 4, 4)
+            painter.setPen(QColor(THEME_COLORS['surface']))
+            painter.drawText(box, Qt.AlignCenter, text)
 
 class SegmentDialog(QDialog):
     def __init__(self, segment, editing=False, parent=None):
@@ -266,33 +2177,10 @@ class SegmentDialog(QDialog):
         try:
             self.setWindowTitle('구간 정보')
             self.setMinimumWidth(400)
+            self.setObjectName('segmentDialog')
             layout = QVBoxLayout()
             layout.setSpacing(12)
 
-            # 틴더 스타일 적용
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: white;
-                }
-                QLabel {
-                    color: #424242;
-                    font-size: 13px;
-                }
-                QSpinBox {
-                    padding: 8px;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    min-height: 20px;
-                }
-                QPushButton {
-                    padding: 10px;
-                    border: none;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    min-height: 20px;
-                }
-            """)
-
             # 프레임 입력 영역
             frames_group = QGridLayout()
             frames_group.setSpacing(10)
@@ -316,7 +2204,7 @@ class SegmentDialog(QDialog):
             frames_group.addWidget(self.end_frame_input, 1, 1)
 
             # 시간 정보 표시
-            fps = math.ceil(getattr(self.parent(), 'fps', 15))
+            fps = getattr(self.parent(), 'fps', 15.0)
             duration = (self.segment.end_frame - self.segment.start_frame) / fps
             self.duration_label = QLabel(f'길이: {duration:.2f}초')
             frames_group.addWidget(self.duration_label, 2, 0, 1, 2)
@@ -327,7 +2215,7 @@ class SegmentDialog(QDialog):
             action_group = QVBoxLayout()
             action_group.setSpacing(8)
             action_label = QLabel('액션 타입:')
-            action_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+            action_label.setProperty('variant', 'section')
             action_group.addWidget(action_label)
             
             self.action_button_group = QButtonGroup()
@@ -341,16 +2229,6 @@ class SegmentDialog(QDialog):
 
             for action_type, label in actions.items():
                 radio = QRadioButton(label)
-                radio.setStyleSheet("""
-                    QRadioButton {
-                        padding: 5px;
-                        color: #424242;
-                    }
-                    QRadioButton::indicator {
-                        width: 18px;
-                        height: 18px;
-                    }
-                """)
                 radio.setChecked(action_type == self.segment.action_type)
                 radio.clicked.connect(lambda checked, t=action_type: self.set_action_type(t))
                 self.action_button_group.addButton(radio)
@@ -365,40 +2243,16 @@ class SegmentDialog(QDialog):
             # 편집 모드일 때만 삭제 버튼 표시
             if self.editing:
                 delete_btn = QPushButton('삭제')
-                delete_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #ff4444;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #ff6666;
-                    }
-                """)
+                delete_btn.setProperty('variant', 'danger')
                 delete_btn.clicked.connect(self.request_delete)
                 buttons.addWidget(delete_btn)
 
             save_btn = QPushButton('저장')
-            save_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #fe3c72;
-                    color: white;
-                }
-                QPushButton:hover {
-                    background-color: #ff4f81;
-                }
-            """)
+            save_btn.setProperty('variant', 'primary')
             save_btn.clicked.connect(self.accept)
             
             cancel_btn = QPushButton('취소')
-            cancel_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    color: #424242;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-            """)
+            cancel_btn.setProperty('variant', 'secondary')
             cancel_btn.clicked.connect(self.reject)
             
             buttons.addWidget(save_btn)
@@ -422,7 +2276,7 @@ class SegmentDialog(QDialog):
                 self.end_frame_input.setValue(start + 1)
             
             # 길이 업데이트
-            fps = math.ceil(getattr(self.parent(), 'fps', 15))
+            fps = getattr(self.parent(), 'fps', 15.0)
             duration = (self.end_frame_input.value() - self.start_frame_input.value()) / fps
             self.duration_label.setText(f'길이: {duration:.2f}초')
             
@@ -436,7 +2290,6 @@ class SegmentDialog(QDialog):
                 self.segment.start_frame = self.start_frame_input.value()
                 self.segment.end_frame = self.end_frame_input.value()
                 self.segment.action_type = self.selected_action
-                self.segment.duration = self.segment.end_frame - self.segment.start_frame
             super().accept()
         except Exception as e:
             logger.error(f"Error accepting dialog: {str(e)}")
@@ -464,8 +2317,1150 @@ class SegmentDialog(QDialog):
         except Exception as e:
             logger.error(f"Error requesting segment deletion: {str(e)}")
 
+def annotation_status(data):
+    """어노테이션 데이터의 완료 여부와 구간 수"""
+    complete = (isinstance(data, dict) and 'meta_data' in data and 'annotations' in data and
+                'segmentation' in data['annotations'])
+    return {
+        'complete': complete,
+        'segments': len(data['annotations']['segmentation']) if complete else 0
+    }
+
+def validate_annotation(data):
+    """어노테이션 데이터 검사 - {'level': 'error'|'warning', 'code', 'message'} 목록
+
+    구조 오류, 범위를 벗어난 구간, 구간 겹침, 값 불일치를 보고한다.
+    """
+    issues = []
+
+    def report(level, code, message):
+        issues.append({'level': level, 'code': code, 'message': message})
+
+    if not isinstance(data, dict):
+        report('error', 'schema', 'top level is not an object')
+        return issues
+    missing = [key for key in ANNOTATION_REQUIRED_KEYS if key not in data]
+    if missing:
+        report('error', 'schema', f"missing keys: {', '.join(missing)}")
+        if 'annotations' in missing:
+            return issues
+
+    annotations = data['annotations']
+    segmentation = annotations.get('segmentation') if isinstance(annotations, dict) else None
+    if not isinstance(segmentation, list):
+        report('error', 'schema', 'annotations.segmentation is missing or not a list')
+        return issues
+
+    meta_data = data.get('meta_data') or {}
+    total_frames = meta_data.get('total_frames') if isinstance(meta_data, dict) else None
+    if not isinstance(total_frames, int) or total_frames <= 0:
+        total_frames = None
+
+    user_num = annotations.get('user_num')
+    target_objects = annotations.get('target_objects')
+    if isinstance(user_num, int) and isinstance(target_objects, list) and len(target_objects) != user_num:
+        report('warning', 'user_num', f"user_num {user_num} but {len(target_objects)} target_objects")
+
+    valid = []
+    for i, seg in enumerate(segmentation):
+        if not isinstance(seg, dict):
+            report('error', 'schema', f"segment {i}: not an object")
+            continue
+        missing = [key for key in SEGMENT_REQUIRED_KEYS if key not in seg]
+        if missing:
+            report('error', 'schema', f"segment {i}: missing keys: {', '.join(missing)}")
+            continue
+        if not all(isinstance(seg[key], int) for key in SEGMENT_REQUIRED_KEYS):
+            report('error', 'schema', f"segment {i}: frame fields and action_type must be integers")
+            continue
+
+        start, end = seg['start_frame'], seg['end_frame']
+        if seg['action_type'] not in ACTION_NAMES:
+            report('error', 'action_type', f"segment {i}: unknown action_type {seg['action_type']}")
+        if start < 0 or end <= start:
+            report('error', 'range', f"segment {i}: invalid range {start}-{end}")
+            continue
+        if total_frames is not None and end >= total_frames:
+            report('error', 'range', f"segment {i}: end_frame {end} beyond total_frames {total_frames}")
+        if not start <= seg['keyframe'] <= end:
+            report('error', 'range', f"segment {i}: keyframe {seg['keyframe']} outside {start}-{end}")
+        if seg['duration'] != end - start:
+            report('warning', 'duration', f"segment {i}: duration {seg['duration']} != {end - start}")
+        valid.append((start, end, i))
+
+    # 시작 프레임 순으로 훑으며 앞선 구간의 최대 끝 프레임과 비교
+    valid.sort()
+    max_end, max_index = -1, None
+    for start, end, i in valid:
+        if start <= max_end:
+            report('warning', 'overlap', f"segment {i} ({start}-{end}) overlaps segment {max_index}")
+        if end > max_end:
+            max_end, max_index = end, i
+
+    return issues
+
+def loads_json(raw):
+    """JSON 디코딩 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, bytes):
+        raw = raw.decode('utf-8')
+    return json.loads(raw)
+
+def dumps_json(obj, indent=True):
+    """JSON을 UTF-8 바이트로 인코딩 (한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # orjson이 처리하지 못하는 값은 표준 json으로
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+class AnnotationError(ValueError):
+    """어노테이션 문서 구조 오류"""
+
+class MetaData:
+    """어노테이션 meta_data (알 수 없는 키는 extra에 보관하여 그대로 저장)"""
+    __slots__ = ('file_name', 'format', 'size', 'width_height', 'environment', 'frame_rate',
+                 'total_frames', 'camera_height', 'camera_angle', 'extra')
+    FIELDS = __slots__[:-1]
+
+    def __init__(self, file_name='', format='', size=0, width_height=(0, 0),
+                 environment=DEFAULT_META_DATA['environment'], frame_rate=15.0, total_frames=0,
+                 camera_height=DEFAULT_META_DATA['camera_height'],
+                 camera_angle=DEFAULT_META_DATA['camera_angle'], extra=None):
+        self.file_name = file_name
+        self.format = format
+        self.size = size
+        self.width_height = list(width_height)
+        self.environment = environment
+        self.frame_rate = frame_rate
+        self.total_frames = total_frames
+        self.camera_height = camera_height
+        self.camera_angle = camera_angle
+        self.extra = extra or {}
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict):
+            raise AnnotationError('meta_data is not an object')
+        known = {key: data[key] for key in cls.FIELDS if key in data}
+        extra = {key: value for key, value in data.items() if key not in cls.FIELDS}
+        return cls(extra=extra, **known)
+
+    def to_dict(self):
+        data = {key: getattr(self, key) for key in self.FIELDS}
+        data.update(self.extra)
+        return data
+
+class TargetObject:
+    """어노테이션 대상 사용자 정보"""
+    __slots__ = ('object_id', 'age', 'gender', 'disability', 'extra')
+    FIELDS = __slots__[:-1]
+
+    def __init__(self, object_id, age=DEFAULT_TARGET_OBJECT['age'], gender=DEFAULT_TARGET_OBJECT['gender'],
+                 disability=DEFAULT_TARGET_OBJECT['disability'], extra=None):
+        self.object_id = object_id
+        self.age = age
+        self.gender = gender
+        self.disability = disability
+        self.extra = extra or {}
+
+    @classmethod
+    def from_dict(cls, data, object_id=0):
+        if not isinstance(data, dict):
+            raise AnnotationError('target_objects entry is not an object')
+        known = {key: data[key] for key in cls.FIELDS if key in data}
+        known.setdefault('object_id', object_id)
+        extra = {key: value for key, value in data.items() if key not in cls.FIELDS}
+        return cls(extra=extra, **known)
+
+    def to_dict(self):
+        data = {key: getattr(self, key) for key in self.FIELDS}
+        data.update(self.extra)
+        return data
+
+class AnnotationDocument:
+    """비디오 하나의 어노테이션 문서 (GUI, 배치 명령, 내보내기가 공유)
+
+    읽을 때 한 번 구조를 검사하고, 형식이 잘못된 구간은 건너뛰며 그 수를
+    skipped에 남긴다. 저장 시 segment_id는 목록 순서대로 다시 매긴다.
+    """
+    __slots__ = ('meta_data', 'additional_info', 'space_context', 'user_num',
+                 'target_objects', 'segments', 'extra', 'skipped')
+
+    def __init__(self, meta_data=None, additional_info=None, space_context='', user_num=1,
+                 target_objects=None, segments=None, extra=None):
+        self.meta_data = meta_data or MetaData()
+        self.additional_info = additional_info if additional_info is not None else dict(DEFAULT_ADDITIONAL_INFO)
+        self.space_context = space_context
+        self.user_num = user_num
+        self.target_objects = target_objects if target_objects is not None else []
+        self.segments = segments if segments is not None else []
+        self.extra = extra or {}
+        self.skipped = 0
+
+    @classmethod
+    def new(cls, video_path, width, height, fps, total_frames):
+        """비디오 정보로 빈 문서 생성"""
+        document = cls()
+        document.update_video_info(video_path, width, height, fps, total_frames)
+        document.set_users(1)
+        return document
+
+    def update_video_info(self, video_path, width, height, fps, total_frames):
+        """meta_data의 비디오 정보 갱신 (촬영 환경 값은 유지)"""
+        video_path = Path(video_path)
+        self.meta_data.file_name = video_path.name
+        self.meta_data.format = video_path.suffix[1:]
+        self.meta_data.size = video_path.stat().st_size
+        self.meta_data.width_height = [width, height]
+        self.meta_data.frame_rate = fps
+        self.meta_data.total_frames = total_frames
+
+    def set_users(self, user_num, target_objects=None):
+        """사용 인원 설정 (정보가 없는 사용자는 기존 값 또는 기본값 사용)"""
+        if target_objects is None:
+            target_objects = [
+                self.target_objects[i] if i < len(self.target_objects) else TargetObject(i)
+                for i in range(user_num)
+            ]
+        self.user_num = user_num
+        self.target_objects = target_objects
+
+    def fill_keypoint_skeletons(self):
+        """keypoints가 비어 있는 구간에 사용자별 빈 keypoints 구조 채우기"""
+        for segment in self.segments:
+            if not segment.keypoints:
+                segment.keypoints = [{'object_id': j, 'keypoints': []} for j in range(self.user_num)]
+
+    @classmethod
+    def from_dict(cls, data):
+        """딕셔너리에서 문서 생성 (필수 구조가 없으면 AnnotationError)"""
+        if not isinstance(data, dict):
+            raise AnnotationError('top level is not an object')
+        missing = [key for key in ANNOTATION_REQUIRED_KEYS if key not in data]
+        if missing:
+            raise AnnotationError(f"missing keys: {', '.join(missing)}")
+        annotations = data['annotations']
+        if not isinstance(annotations, dict) or not isinstance(annotations.get('segmentation'), list):
+            raise AnnotationError('annotations.segmentation is missing or not a list')
+
+        target_objects = [
+            TargetObject.from_dict(entry, i) for i, entry in enumerate(annotations.get('target_objects') or [])
+        ]
+        document = cls(
+            meta_data=MetaData.from_dict(data['meta_data']),
+            additional_info=data['additional_info'],
+            space_context=annotations.get('space_context', ''),
+            user_num=annotations.get('user_num', len(target_objects) or 1),
+            target_objects=target_objects,
+            extra={key: value for key, value in data.items() if key not in ANNOTATION_REQUIRED_KEYS}
+        )
+
+        for seg in annotations['segmentation']:
+            try:
+                document.segments.append(VideoSegment.from_dict(seg))
+            except (KeyError, TypeError, ValueError):
+                document.skipped += 1
+        return document
+
+    def to_dict(self):
+        data = {
+            'meta_data': self.meta_data.to_dict(),
+            'additional_info': self.additional_info,
+            'annotations': {
+                'space_context': self.space_context,
+                'user_num': self.user_num,
+                'target_objects': [target.to_dict() for target in self.target_objects],
+                'segmentation': [segment.to_dict(i) for i, segment in enumerate(self.segments)]
+            }
+        }
+        data.update(self.extra)
+        return data
+
+    @classmethod
+    def load(cls, json_path):
+        with open(json_path, 'rb') as f:
+            return cls.from_dict(loads_json(f.read()))
+
+    def save(self, json_path):
+        """파일로 원자적으로 저장하고 저장한 딕셔너리 반환"""
+        data = self.to_dict()
+        write_atomic(json_path, dumps_json(data))
+        return data
+
+    def columns(self):
+        """구간 목록의 열 단위 배열 (SEGMENT_DTYPE)"""
+        return segment_columns(self.segments)
+
+    def segment_rows(self, raw_segments=None):
+        """내보내기용 구간 행 목록
+
+        raw_segments(파일의 segmentation 목록)를 주면 저장된 값을 그대로 쓰고,
+        없으면 읽으면서 정규화한 구간(duration 재계산, keyframe 기본값)을 쓴다.
+        """
+        fps = self.meta_data.frame_rate if isinstance(self.meta_data.frame_rate, (int, float)) else 0
+
+        def seconds(frame):
+            return round(frame / fps, 3) if fps > 0 and isinstance(frame, (int, float)) else None
+
+        if raw_segments is None:
+            segments = [segment.to_dict(i) for i, segment in enumerate(self.segments)]
+        else:
+            segments = [seg if isinstance(seg, dict) else {} for seg in raw_segments]
+
+        rows = []
+        for i, seg in enumerate(segments):
+            action_type = seg.get('action_type')
+            rows.append({
+                'segment_id': seg.get('segment_id', i),
+                'action_type': action_type,
+                'action_name': ACTION_NAMES.get(action_type, '') if isinstance(action_type, int) else '',
+                'start_frame': seg.get('start_frame'),
+                'end_frame': seg.get('end_frame'),
+                'duration': seg.get('duration'),
+                'keyframe': seg.get('keyframe'),
+                'start_time': seconds(seg.get('start_frame')),
+                'end_time': seconds(seg.get('end_frame'))
+            })
+        return rows
+
+class AnnotationStatusIndex(PersistentIndex):
+    """어노테이션 파일별 완료 여부/구간 수 인덱스 (바뀐 파일만 다시 읽음)"""
+
+    def __init__(self, index_path=None):
+        super().__init__(index_path or CACHE_DIR / 'annotation_status.json')
+
+    def status(self, json_path):
+        """{'complete': bool, 'segments': int}"""
+        signature = self.file_signature(json_path)
+        if signature is None:
+            return {'complete': False, 'segments': 0}
+
+        entry = self.lookup(json_path, signature)
+        if entry is not None:
+            return entry
+
+        try:
+            with open(json_path, 'rb') as f:
+                values = annotation_status(loads_json(f.read()))
+        except Exception:
+            values = {'complete': False, 'segments': 0}
+        self.store(json_path, values, signature)
+        return values
+
+    def record(self, json_path, data):
+        """방금 저장한 데이터로 항목 갱신 (파일을 다시 읽지 않음)"""
+        self.store(json_path, annotation_status(data))
+
+class EditJournal:
+    """어노테이션 파일별 추가 전용 편집 기록
+
+    마지막으로 저장된 파일 이후의 편집만 한 줄에 하나씩 JSON으로 남긴다.
+    첫 줄에는 기준이 되는 파일의 (크기, 수정 시각)을 기록하여, 비정상 종료 후
+    파일이 그대로일 때만 편집을 다시 적용한다. 저장이 끝나면 저장된 편집까지 지운다.
+    append는 메모리에만 쌓고, 파일 쓰기(write, sync, committed)는 저장 스레드가 한다.
+    """
+
+    def __init__(self, journal_dir=None):
+        self.journal_dir = Path(journal_dir) if journal_dir else CACHE_DIR / 'journal'
+        self._seq = {}  # 어노테이션 경로 -> 마지막 편집 번호
+        self._synced = {}  # 어노테이션 경로 -> 디스크에 확정(fsync)된 마지막 편집 번호
+        self._unwritten = {}  # 어노테이션 경로 -> 아직 파일에 쓰지 않은 편집 목록
+        self._lock = threading.Lock()     # 메모리 상태 보호 (디스크 I/O 중에는 잡지 않음)
+        self._io_lock = threading.Lock()  # 기록 파일 쓰기 순서 보장
+
+    def journal_path(self, json_path):
+        key = str(Path(json_path).resolve())
+        return self.journal_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.jsonl"
+
+    def last_seq(self, json_path):
+        return self._seq.get(str(json_path), 0)
+
+    def unsynced(self, json_path):
+        """디스크에 확정되지 않은 편집 수"""
+        json_path = str(json_path)
+        return self._seq.get(json_path, 0) - self._synced.get(json_path, 0)
+
+    def append(self, json_path, op, **values):
+        """편집 기록 추가 후 편집 번호 반환 (파일에는 write에서 기록)"""
+        json_path = str(json_path)
+        with self._lock:
+            seq = self._seq.get(json_path, 0) + 1
+            self._seq[json_path] = seq
+            self._unwritten.setdefault(json_path, []).append(dict(values, seq=seq, op=op))
+        return seq
+
+    def write(self, json_path=None):
+        """쌓인 편집을 기록 파일에 추가 (json_path가 없으면 모든 파일)"""
+        with self._io_lock:
+            self._write_unlocked(json_path)
+
+    def sync(self, json_path):
+        """마지막 확정 이후 추가된 편집을 디스크에 확정하고 그 수를 반환"""
+        json_path = str(json_path)
+        with self._lock:
+            seq = self._seq.get(json_path, 0)
+            count = seq - self._synced.get(json_path, 0)
+        if count <= 0:
+            return 0
+        with self._io_lock:
+            self._write_unlocked(json_path)
+            try:
+                path = self.journal_path(json_path)
+                if path.exists():
+                    with open(path, 'ab') as f:
+                        os.fsync(f.fileno())
+            except Exception as e:
+                logger.error(f"Error syncing edit journal for {json_path}: {str(e)}")
+                return 0
+        with self._lock:
+            self._synced[json_path] = max(self._synced.get(json_path, 0), seq)
+        return count
+
+    def committed(self, json_path, seq):
+        """seq까지의 편집이 파일에 저장됨 - 남은 편집만 새 기준으로 다시 기록"""
+        json_path = str(json_path)
+        with self._io_lock:
+            with self._lock:
+                unwritten = self._unwritten.get(json_path)
+                if unwritten:
+                    self._unwritten[json_path] = [entry for entry in unwritten if entry['seq'] > seq]
+            path = self.journal_path(json_path)
+            remaining = [entry for entry in self._read(path)[1] if entry['seq'] > seq]
+            try:
+                if not remaining:
+                    if path.exists():
+                        path.unlink()
+                    synced = seq
+                else:
+                    lines = [{'base': PersistentIndex.file_signature(json_path)}] + remaining
+                    write_atomic(path, b''.join(dumps_json(line, indent=False) + b'\n' for line in lines))
+                    synced = remaining[-1]['seq']
+            except Exception as e:
+                logger.error(f"Error compacting edit journal for {json_path}: {str(e)}")
+                return
+        with self._lock:
+            self._synced[json_path] = max(self._synced.get(json_path, 0), synced)
+
+    def pending(self, json_path):
+        """저장되지 않은 편집 목록 (기준 파일이 바뀌었으면 적용할 수 없으므로 빈 목록)"""
+        self.write(json_path)
+        base, entries = self._read(self.journal_path(json_path))
+        if not entries:
+            return []
+        signature = PersistentIndex.file_signature(json_path)
+        if (list(signature) if signature else None) != base:
+            logger.warning(f"Discarding stale edit journal for {json_path}")
+            self.discard(json_path)
+            return []
+        # 복구 후 이어지는 편집은 기존 기록 뒤에 번호를 이어서 추가
+        with self._lock:
+            self._seq[str(json_path)] = max(self._seq.get(str(json_path), 0), entries[-1]['seq'])
+            self._synced[str(json_path)] = self._seq[str(json_path)]
+        return entries
+
+    def discard(self, json_path):
+        """편집 기록 삭제 (사용자가 변경 사항을 버린 경우)"""
+        with self._io_lock:
+            with self._lock:
+                self._seq.pop(str(json_path), None)
+                self._synced.pop(str(json_path), None)
+                self._unwritten.pop(str(json_path), None)
+            try:
+                self.journal_path(json_path).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Error removing edit journal for {json_path}: {str(e)}")
+
+    @staticmethod
+    def _read(path):
+        """(기준 파일 서명, 편집 목록) - 마지막 줄이 잘려 있으면 그 줄만 버림"""
+        base, entries = None, []
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = loads_json(line)
+                    except ValueError:
+                        break
+                    if 'base' in entry:
+                        base = entry['base']
+                    else:
+                        entries.append(entry)
+        except FileNotFoundError:
+            pass
+        return base, entries
+
+    def _write_unlocked(self, json_path):
+        """_io_lock을 잡은 상태에서 쌓인 편집을 파일에 추가"""
+        with self._lock:
+            if json_path is None:
+                batches, self._unwritten = self._unwritten, {}
+            else:
+                batches = {str(json_path): self._unwritten.pop(str(json_path), [])}
+        for path_key, entries in batches.items():
+            if not entries:
+                continue
+            try:
+                path = self.journal_path(path_key)
+                lines = []
+                if not path.exists():
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    lines.append({'base': PersistentIndex.file_signature(path_key)})
+                lines.extend(entries)
+                with open(path, 'ab') as f:
+                    f.write(b''.join(dumps_json(line, indent=False) + b'\n' for line in lines))
+            except Exception as e:
+                logger.error(f"Error writing edit journal for {path_key}: {str(e)}")
+
+def segment_key(segment):
+    """편집 대상 확인용 구간 값 (시작, 끝, 행동 유형)"""
+    return [segment.start_frame, segment.end_frame, segment.action_type]
+
+def journal_target(segments, entry):
+    """기록이 가리키는 구간의 현재 위치
+
+    저장된 위치의 구간이 기록한 구간(expect)과 다르면 같은 값의 구간을 찾고,
+    없으면 ValueError (기록 이후 파일이 바뀐 경우 엉뚱한 구간을 지우지 않도록).
+    """
+    index = entry['index']
+    expect = entry.get('expect')
+    if expect is None:
+        return index
+    if 0 <= index < len(segments) and segment_key(segments[index]) == expect:
+        return index
+    for i, segment in enumerate(segments):
+        if segment_key(segment) == expect:
+            logger.warning(f"Journal entry for segment {index} matched segment {i}")
+            return i
+    raise ValueError(f"segment {index} does not match the journaled segment {expect}")
+
+def apply_journal_entry(segments, entry):
+    """편집 기록 한 건을 구간 목록에 적용"""
+    op = entry['op']
+    if op == 'add':
+        segments.insert(entry.get('index', len(segments)), VideoSegment.from_dict(entry['segment']))
+    elif op == 'remove':
+        segments.pop(journal_target(segments, entry))
+    elif op == 'update':
+        segments[journal_target(segments, entry)] = VideoSegment.from_dict(entry['segment'])
+    else:
+        raise ValueError(f"unknown journal op: {op}")
+
+class SegmentEdit:
+    """되돌리기 기록 한 건 - 목록 복사 대신 바뀐 세그먼트와 위치, 수정 전후 필드 값만 보관"""
+    __slots__ = ('op', 'index', 'segment', 'before', 'after')
+
+    def __init__(self, op, index, segment, before=None, after=None):
+        self.op = op            # 'add', 'remove', 'update'
+        self.index = index      # self.segments 안의 위치
+        self.segment = segment
+        self.before = before    # update: 수정 전 snapshot()
+        self.after = after      # update: 수정 후 snapshot()
+
+    def inverse(self):
+        """반대 방향 편집"""
+        if self.op == 'update':
+            return SegmentEdit('update', self.index, self.segment, self.after, self.before)
+        return SegmentEdit('remove' if self.op == 'add' else 'add', self.index, self.segment)
+
+class EditHistory:
+    """되돌리기/다시 실행 기록 (오래된 기록부터 최대 depth개까지만 유지)"""
+
+    def __init__(self, depth=UNDO_DEPTH):
+        self._undo = deque(maxlen=depth)
+        self._redo = []
+
+    def push(self, edit):
+        """새 편집 추가 (다시 실행 기록은 버림)"""
+        self._undo.append(edit)
+        self._redo.clear()
+
+    def undo(self):
+        """되돌릴 편집의 반대 편집 (없으면 None)"""
+        if not self._undo:
+            return None
+        edit = self._undo.pop()
+        self._redo.append(edit)
+        return edit.inverse()
+
+    def redo(self):
+        """다시 실행할 편집 (없으면 None)"""
+        if not self._redo:
+            return None
+        edit = self._redo.pop()
+        self._undo.append(edit)
+        return edit
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+
+class AnnotationSaver(QThread):
+    """어노테이션 저장과 편집 기록 파일 쓰기를 맡는 작업 스레드 (GUI 스레드는 디스크를 기다리지 않음)
+
+    같은 파일에 대한 저장 요청이 이어지면 마지막 요청 후 SAVE_COALESCE_MS 동안
+    (최대 SAVE_MAX_DELAY_MS) 기다렸다가 가장 최근 데이터만 한 번 기록한다.
+    편집 기록은 쌓이는 대로 파일에 추가하고, 자동 저장이 요청한 파일은 fsync까지 한다.
+    """
+    saved = pyqtSignal(str, object)       # 어노테이션 경로, 저장한 데이터
+    save_failed = pyqtSignal(str, str)    # 어노테이션 경로, 오류 메시지
+
+    def __init__(self, journal, status_index, indexes=(), parent=None):
+        super().__init__(parent)
+        self.journal = journal
+        self.status_index = status_index
+        self.indexes = indexes         # 주기적으로 기록할 디스크 인덱스 (PersistentIndex)
+        self._index_flush = False
+        self._pending = OrderedDict()  # 경로 -> [데이터, 편집 번호, 첫 요청 시각, 마지막 요청 시각]
+        self._journal_dirty = False    # 파일에 쓸 편집 기록이 있음
+        self._sync_paths = set()       # 편집 기록을 fsync할 어노테이션 경로 (자동 저장)
+        self._writing = False
+        self._flushing = False
+        self._running = True
+        self._cond = threading.Condition()
+
+    def submit(self, json_path, data, journal_seq=0):
+        """저장 요청 (이미 대기 중인 요청은 새 데이터로 교체)"""
+        now = time.monotonic()
+        with self._cond:
+            entry = self._pending.get(str(json_path))
+            if entry is None:
+                self._pending[str(json_path)] = [data, journal_seq, now, now]
+            else:
+                entry[0], entry[1], entry[3] = data, journal_seq, now
+            self._cond.notify_all()
+
+    def journal_changed(self):
+        """편집 기록이 추가됨 - 백그라운드에서 파일에 기록"""
+        with self._cond:
+            self._journal_dirty = True
+            self._cond.notify_all()
+
+    def request_index_flush(self):
+        """디스크 인덱스 기록 요청 (직렬화와 쓰기 모두 이 스레드에서)"""
+        with self._cond:
+            self._index_flush = True
+            self._cond.notify_all()
+
+    def request_sync(self, json_path):
+        """편집 기록을 디스크에 확정 (자동 저장)"""
+        with self._cond:
+            self._sync_paths.add(str(json_path))
+            self._cond.notify_all()
+
+    def is_pending(self, json_path):
+        with self._cond:
+            return str(json_path) in self._pending
+
+    def flush(self):
+        """대기 중인 저장을 바로 기록하고 끝날 때까지 대기"""
+        with self._cond:
+            self._flushing = True
+            self._cond.notify_all()
+            while self._has_work() or self._writing:
+                self._cond.wait()
+            self._flushing = False
+
+    def stop(self):
+        self.flush()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._has_work():
+                    self._cond.wait()
+                if not self._has_work():
+                    return
+                job = self._next_job()
+                if job is None:
+                    continue  # 저장 요청이 잠잠해질 때까지 대기 중
+                self._writing = True
+
+            try:
+                kind, args = job
+                if kind == 'journal':
+                    self.write_journal(*args)
+                elif kind == 'indexes':
+                    self.save_indexes()
+                else:
+                    self.save(*args)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def write_journal(self, sync_paths):
+        self.journal.write()
+        for json_path in sync_paths:
+            count = self.journal.sync(json_path)
+            if count:
+                logger.info(f"Autosaved {count} edit(s) for {json_path}")
+
+    def save_indexes(self):
+        for index in self.indexes:
+            try:
+                index.save()
+            except Exception as e:
+                logger.error(f"Error flushing index {index.index_path}: {str(e)}")
+
+    def save(self, json_path, data, journal_seq):
+        try:
+            write_atomic(json_path, dumps_json(data))
+            self.journal.committed(json_path, journal_seq)
+            self.status_index.record(json_path, data)
+            logger.info(f"Successfully saved annotations to {json_path}")
+            self.saved.emit(json_path, data)
+        except Exception as e:
+            logger.error(f"Error saving annotations to {json_path}: {str(e)}")
+            self.save_failed.emit(json_path, str(e))
+
+    def _has_work(self):
+        return bool(self._pending or self._journal_dirty or self._sync_paths or self._index_flush)
+
+    def _next_job(self):
+        """다음 작업 (편집 기록 우선, _cond를 잡은 상태에서 호출, 대기해야 하면 None)"""
+        if self._journal_dirty or self._sync_paths:
+            sync_paths, self._sync_paths = self._sync_paths, set()
+            self._journal_dirty = False
+            return 'journal', (sync_paths,)
+
+        # 가장 오래된 요청부터, 요청이 잠잠해지면 저장
+        wait = None
+        if self._pending:
+            json_path = next(iter(self._pending))
+            entry = self._pending[json_path]
+            deadline = min(entry[3] + SAVE_COALESCE_MS / 1000, entry[2] + SAVE_MAX_DELAY_MS / 1000)
+            wait = deadline - time.monotonic()
+            if self._flushing or wait <= 0:
+                data, journal_seq, _, _ = self._pending.pop(json_path)
+                return 'save', (json_path, data, journal_seq)
+
+        # 어노테이션 저장이 급하지 않을 때 인덱스 기록
+        if self._index_flush:
+            self._index_flush = False
+            return 'indexes', ()
+
+        self._cond.wait(wait)
+        return None
+
+class FileListModel(QAbstractTableModel):
+    """파일 목록 테이블 모델 (보이는 행만 뷰가 요청하므로 상태도 필요할 때 계산)"""
+    COLUMN_NAME, COLUMN_STATUS, COLUMN_ACTION = range(3)
+    headers = ['파일명', '상태', '동작']
+
+    def __init__(self, files, status_index, parent=None):
+        super().__init__(parent)
+        self.files = files  # VideoLabeler.current_files 와 같은 리스트
+        self.status_index = status_index
+        self.current_index = -1
+        self._status = {}  # 파일 경로 -> 상태 인덱스 항목 (보이는 행만 조회)
+        self._rows = {}    # 어노테이션 경로 -> 행 번호 목록 (저장된 파일의 행만 갱신)
+        self._index_rows(0)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.files)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        file = self.files[row]
+        is_current = row == self.current_index
+
+        if role == Qt.DisplayRole:
+            if column == self.COLUMN_NAME:
+                return file.name
+            if column == self.COLUMN_STATUS:
+                return '✓' if self.status(file)['complete'] else ''
+            if column == self.COLUMN_ACTION and is_current:
+                return '현재 파일'
+        elif role == Qt.ToolTipRole and column == self.COLUMN_NAME:
+            return str(file)
+        elif role == Qt.ToolTipRole and column == self.COLUMN_STATUS:
+            status = self.status(file)
+            return f"구간 {status['segments']}개" if status['complete'] else None
+        elif role == Qt.TextAlignmentRole and column != self.COLUMN_NAME:
+            return Qt.AlignCenter
+        elif role == Qt.BackgroundRole and is_current:
+            # 현재 실행 중인 파일 행 색상 변경
+            return QBrush(QColor(THEME_COLORS['accent_hover']))
+        elif role == Qt.ForegroundRole and is_current and column == self.COLUMN_ACTION:
+            return QBrush(QColor(THEME_COLORS['surface']))
+        return None
+
+    def status(self, file):
+        """어노테이션 상태 (처음 요청될 때만 상태 인덱스 조회)"""
+        key = str(file)
+        if key not in self._status:
+            self._status[key] = self.status_index.status(file.with_suffix('.json'))
+        return self._status[key]
+
+    def append_files(self, new_files):
+        """파일 추가 (새 행만 삽입)"""
+        if not new_files:
+            return
+        first = len(self.files)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_files) - 1)
+        self.files.extend(new_files)
+        self._index_rows(first)
+        self.endInsertRows()
+
+    def _index_rows(self, first):
+        for row in range(first, len(self.files)):
+            self._rows.setdefault(str(self.files[row].with_suffix('.json')), []).append(row)
+
+    def set_current_index(self, row):
+        """현재 파일 변경 (이전/현재 행만 갱신)"""
+        previous = self.current_index
+        self.current_index = row
+        for changed in {previous, row}:
+            self.refresh_row(changed)
+
+    def refresh_annotation(self, json_path):
+        """어노테이션 파일에 해당하는 비디오 행의 상태 다시 확인"""
+        for row in self._rows.get(str(json_path), ()):
+            self._status.pop(str(self.files[row]), None)
+            self.refresh_row(row)
+
+    def refresh_row(self, row):
+        if 0 <= row < len(self.files):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+class LoadButtonDelegate(QStyledItemDelegate):
+    """파일 목록의 '로드' 버튼을 위젯 없이 직접 그리는 델리게이트"""
+    load_requested = pyqtSignal(int)
+
+    BUTTON_SIZE = QSize(60, 24)
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.hover_row = -1
+        self.pressed_row = -1
+        # 다른 열로 이동하거나 목록을 벗어날 때도 호버 상태를 해제하기 위해 뷰포트 이벤트 감시
+        view.viewport().installEventFilter(self)
+
+    def button_rect(self, cell_rect):
+        rect = QRect(QPoint(0, 0), self.BUTTON_SIZE)
+        rect.moveCenter(cell_rect.center())
+        return rect
+
+    def paint(self, painter, option, index):
+        if index.row() == index.model().current_index:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = self.button_rect(option.rect)
+        if index.row() == self.pressed_row:
+            background = THEME_COLORS['pressed']
+        elif index.row() == self.hover_row:
+            background = THEME_COLORS['hover']
+        else:
+            background = THEME_COLORS['surface']
+        painter.setPen(QPen(QColor(THEME_COLORS['border']), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        painter.setPen(QColor(THEME_COLORS['text']))
+        painter.drawText(rect, Qt.AlignCenter, '로드')
+        painter.restore()
+
+    def set_hover_row(self, row):
+        if row != self.hover_row:
+            previous, self.hover_row = self.hover_row, row
+            model = self.view.model()
+            model.refresh_row(previous)
+            model.refresh_row(row)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseMove:
+            index = self.view.indexAt(event.pos())
+            row = -1
+            if (index.isValid() and index.column() == FileListModel.COLUMN_ACTION
+                    and index.row() != index.model().current_index
+                    and self.button_rect(self.view.visualRect(index)).contains(event.pos())):
+                row = index.row()
+            self.set_hover_row(row)
+        elif event.type() == QEvent.Leave:
+            self.set_hover_row(-1)
+        return False
+
+    def editorEvent(self, event, model, option, index):
+        if index.row() == model.current_index or event.type() not in (
+                QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+
+        inside = self.button_rect(option.rect).contains(event.pos())
+        row = index.row() if inside else -1
+        if event.type() == QEvent.MouseButtonPress and inside:
+            self.pressed_row = row
+            model.refresh_row(row)
+            return True
+        elif event.type() == QEvent.MouseButtonRelease:
+            pressed, self.pressed_row = self.pressed_row, -1
+            model.refresh_row(pressed)
+            if inside and pressed == row:
+                self.load_requested.emit(row)
+                return True
+        return False
+
+# 앱 전체 스타일시트 ($역할 이름은 THEME_COLORS 값으로 치환)
+# 위젯은 objectName 또는 variant 속성으로 구분하고, 생성 시 스타일시트를 따로 지정하지 않는다.
+APP_STYLESHEET = Template("""
+    QMainWindow {
+        background-color: $window;
+    }
+    QWidget {
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    }
+    QPushButton {
+        font-weight: 500;
+    }
+    QLabel {
+        color: $text;
+    }
+
+    /* 비디오 영역과 타임라인 */
+    QWidget#videoContainer {
+        background-color: $video;
+        border: 1px solid $border;
+        border-radius: 4px;
+    }
+    QFrame#timeline {
+        background-color: $surface;
+        border: 1px solid $border;
+        border-radius: 6px;
+    }
+    QLabel#thumbnailPreview {
+        border: 1px solid $border;
+        background-color: $video;
+    }
+    QSlider#videoSlider::groove:horizontal {
+        border: 1px solid $border;
+        height: 8px;
+        background: $surface;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    QSlider#videoSlider::handle:horizontal {
+        background: $accent;
+        border: 1px solid $border;
+        width: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+    QSlider#videoSlider::handle:horizontal:hover {
+        background: $accent_hover;
+    }
+
+    /* 재생 컨트롤 */
+    QPushButton[variant="control"], QPushButton[variant="control-primary"] {
+        background-color: $surface;
+        color: $text;
+        padding: 8px 15px;
+        border: 1px solid $border;
+        border-radius: 6px;
+        min-height: 20px;
+        font-size: 13px;
+    }
+    QPushButton[variant="control"]:hover {
+        background-color: $hover;
+    }
+    QPushButton[variant="control-primary"] {
+        background-color: $accent;
+        color: $surface;
+    }
+    QPushButton[variant="control-primary"]:hover {
+        background-color: $accent_hover;
+        color: $surface;
+    }
+    QPushButton[variant="control"]:disabled, QPushButton[variant="control-primary"]:disabled {
+        background-color: $disabled;
+        color: $text_disabled;
+    }
+    QComboBox#speedCombo {
+        background-color: $surface;
+        color: $text;
+        padding: 8px 10px;
+        border: 1px solid $border;
+        border-radius: 6px;
+        min-height: 20px;
+        font-size: 13px;
+    }
+    QWidget#userNumContainer {
+        background-color: $surface;
+        border: 1px solid $border;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QWidget#userNumContainer QLabel {
+        border: none;
+        color: $text;
+    }
+    QWidget#userNumContainer QSpinBox {
+        border: none;
+        background: transparent;
+        min-width: 50px;
+    }
+    QLabel#timeLabel {
+        background-color: $surface;
+        color: $text;
+        padding: 0 15px;
+        border: 1px solid $border;
+        border-radius: 6px;
+        min-height: 20px;
+        min-width: 250px;
+    }
+
+    /* 파일 목록 영역 */
+    QMainWindow QLineEdit {
+        padding: 5px;
+        border: 1px solid $border;
+        border-radius: 4px;
+    }
+    QPushButton[variant="tool"] {
+        padding: 5px 10px;
+        border: 1px solid $border;
+        border-radius: 4px;
+        background-color: $surface;
+    }
+    QPushButton[variant="tool"]:hover {
+        background-color: $hover;
+    }
+    QProgressBar {
+        border: 1px solid $border;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: $success;
+    }
+    QLabel#fileListTitle {
+        font-weight: bold;
+        padding: 5px;
+    }
+    QTableView#fileList {
+        border: 1px solid $border;
+        border-radius: 4px;
+        background-color: $surface;
+    }
+    QTableView#fileList::item {
+        padding: 5px;
+    }
+    QTableView#fileList QHeaderView::section {
+        background-color: $disabled;
+        padding: 5px;
+        border: none;
+        border-right: 1px solid $border;
+        border-bottom: 1px solid $border;
+    }
+    QPushButton#completeButton {
+        padding: 10px;
+        background-color: $accent;
+        color: $surface;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#completeButton:hover {
+        background-color: $accent_hover;
+    }
+    QPushButton#completeButton:disabled {
+        background-color: $disabled_strong;
+    }
+
+    /* 구간 정보 / 사용자 정보 대화상자 */
+    QDialog#segmentDialog, QDialog#userInfoDialog {
+        background-color: $surface;
+    }
+    QDialog#segmentDialog QLabel, QDialog#userInfoDialog QLabel {
+        color: $text;
+        font-size: 13px;
+    }
+    QLabel[variant="section"] {
+        font-weight: bold;
+    }
+    QDialog#segmentDialog QLabel[variant="section"] {
+        margin-top: 10px;
+    }
+    QDialog#segmentDialog QSpinBox {
+        padding: 8px;
+        border: 1px solid $border;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QDialog#segmentDialog QRadioButton, QDialog#userInfoDialog QRadioButton {
+        padding: 5px;
+        color: $text;
+    }
+    QDialog#segmentDialog QRadioButton::indicator, QDialog#userInfoDialog QRadioButton::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QDialog#segmentDialog QPushButton, QDialog#userInfoDialog QPushButton {
+        padding: 10px;
+        border: none;
+        border-radius: 6px;
+        font-weight: bold;
+        min-height: 20px;
+    }
+    QPushButton[variant="primary"] {
+        background-color: $accent;
+        color: $surface;
+    }
+    QPushButton[variant="primary"]:hover {
+        background-color: $accent_light;
+    }
+    QPushButton[variant="secondary"] {
+        background-color: $hover;
+        color: $text;
+    }
+    QPushButton[variant="secondary"]:hover {
+        background-color: $pressed;
+    }
+    QPushButton[variant="danger"] {
+        background-color: $danger;
+        color: $surface;
+    }
+    QPushButton[variant="danger"]:hover {
+        background-color: $danger_hover;
+    }
+""")
+
+def build_stylesheet(colors=None):
+    """색상 테마로 앱 전체 스타일시트 생성"""
+    return APP_STYLESHEET.substitute(colors or THEME_COLORS)
+
+def apply_theme(app):
+    """앱 전체 스타일시트 적용 (이미 적용된 경우 다시 파싱하지 않음)"""
+    if app is None or app.property('themeApplied'):
+        return
+    app.setStyleSheet(build_stylesheet())
+    app.setProperty('themeApplied', True)
+
 class VideoLabeler(QMainWindow):
-    def __init__(self):
+    def __init__(self, autosave_interval=AUTOSAVE_INTERVAL_SEC, frame_cache_bytes=FRAME_CACHE_BYTES):
         super().__init__()
         self.setWindowTitle('비디오 라벨링 도구')
         # 전체 창 크기를 화면의 80%로 설정
@@ -475,27 +3470,14 @@ class VideoLabeler(QMainWindow):
         # 메인 위젯이 키보드 포커스를 가지도록 설정
         self.setFocusPolicy(Qt.StrongFocus)
         
-        # 틴더 스타일 전역 설정
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f6f7f8;
-            }
-            QWidget {
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-            }
-            QPushButton {
-                font-weight: 500;
-            }
-            QLabel {
-                color: #424242;
-            }
-        """)
+        # 틴더 스타일 테마 (앱 전체에 한 번만 적용)
+        apply_theme(QApplication.instance())
         
         # 변수 초기화
         self.current_files = []
         self.current_file_index = -1
         self.cap = None
-        self.fps = 15
+        self.fps = 15.0
         self.current_frame = 0
         self.total_frames = 0
         self.is_playing = False
@@ -504,45 +3486,85 @@ class VideoLabeler(QMainWindow):
         self.current_segment = None
         self.timeline = None
         self.has_unsaved_changes = False
+        self.decoder = None
+        self.frame_buffer = None
+        self.seek_engine = None
+        self.prefetched = None  # 미리 열어 둔 상태로 넘겨받은 현재 비디오
+        self.document = None    # 현재 비디오의 AnnotationDocument
+        self.video_width = 0
+        self.video_height = 0
+        self.frame_cache = FrameCache(frame_cache_bytes)
+        self.frame_converter = FrameConverter()  # 일시정지/탐색 화면 표시용
+        self.status_index = AnnotationStatusIndex()
+        self.metadata_cache = VideoMetadataCache()
+        self.current_file_set = set()  # 중복 확인용 파일 경로 집합
+        self.scanner = None
+        self.retired_scanners = set()  # 교체/취소 후 아직 끝나지 않은 검색 스레드 (끝날 때까지 참조 유지)
+        self.thumbnail_worker = None
+        self.scrub_target = None
+
+        # 스크럽 타이머 (슬라이더 이벤트를 모아 가장 최근 위치만 디코딩)
+        self.scrub_timer = QTimer()
+        self.scrub_timer.setSingleShot(True)
+        self.scrub_timer.setInterval(SCRUB_INTERVAL_MS)
+        self.scrub_timer.timeout.connect(self.process_scrub)
+
+        # 디스크 인덱스 주기적 기록
+        self.index_flush_timer = QTimer()
+        self.index_flush_timer.timeout.connect(self.flush_indexes)
+        self.index_flush_timer.start(INDEX_FLUSH_INTERVAL_MS)
+
+        # 어노테이션 백그라운드 저장 및 편집 기록
+        self.journal = EditJournal()
+        self.history = EditHistory()
+        self.completion_paths = set()  # 저장이 끝나면 완료 안내를 띄울 어노테이션 경로
+        self.saver = AnnotationSaver(self.journal, self.status_index, (self.status_index, self.metadata_cache))
+        self.saver.saved.connect(self.on_annotations_saved)
+        self.saver.save_failed.connect(self.on_annotations_save_failed)
+        self.saver.start()
+
+        # 자동 저장 - 변경된 편집 기록만 주기적으로 디스크에 확정
+        self.autosave_interval_ms = int(autosave_interval * 1000)
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        if self.autosave_interval_ms > 0:
+            self.autosave_timer.start(self.autosave_interval_ms)
+
+        # 비디오 메타데이터 백그라운드 조사
+        self.prober = MetadataProber(self.metadata_cache)
+        self.prober.metadata_ready.connect(self.on_metadata_ready)
+        self.prober.start(QThread.LowPriority)
+
+        # 다음 비디오 미리 열기
+        self.prefetcher = VideoPrefetcher(self.frame_cache, self.metadata_cache, ThumbnailCache())
+        self.prefetcher.start(QThread.LowPriority)
+
+        # 재생 시계 (표시할 프레임은 경과 시간으로 결정)
+        self.playback_clock = PlaybackClock(self.fps)
+        self.playback_direction = 1  # 1: 정방향, -1: 역방향
+        self.last_presented_frame = -1
+        self.dropped_frames = 0
 
         # 타이머 초기화
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update_frame)
-        
-        # 메인 위젯과 레이아웃 설정
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        
-        layout = QHBoxLayout()
-        layout.setSpacing(16)  # 섹션 간 간격
-        layout.setContentsMargins(16, 16, 16, 16)  # 전체 여백
-
-        # 좌우 섹션 초기화
-        left_section = self.init_left_section()
-        right_section = self.init_right_section()
-        
-        # 섹션 너비 비율 설정
-        layout.addLayout(left_section, stretch=75)  # 75%
-        layout.addLayout(right_section, stretch=25)  # 25%
-        
-        main_widget.setLayout(layout)
-        
-        # 초기 버튼 상태 설정
-        self.enable_video_controls(False)
+        startup_profiler.mark('window: state and workers')
 
         # 키보드 단축키 설정
+        self.setup_shortcuts()
         QShortcut(QKeySequence.Save, self, self.save_annotations)
         QShortcut(QKeySequence(Qt.Key_Space), self, self.toggle_play)
         QShortcut(QKeySequence(Qt.Key_M), self, self.mark_segment)
-        self.play_shortcut = Qt.Key_Space
-        self.prev_sec_shortcut = Qt.Key_Left
-        self.next_sec_shortcut = Qt.Key_Right
-        self.prev_frame_shortcut = Qt.Key_Left | Qt.ControlModifier
-        self.next_frame_shortcut = Qt.Key_Right | Qt.ControlModifier
-        self.mark_shortcut = Qt.Key_M
-
-        # UI 초기화
+        QShortcut(QKeySequence.Undo, self, self.undo_edit)
+        QShortcut(QKeySequence.Redo, self, self.redo_edit)
+        QShortcut(QKeySequence(Qt.Key_J), self, lambda: self.shuttle(-1))
+        QShortcut(QKeySequence(Qt.Key_K), self, self.pause_playback)
+        QShortcut(QKeySequence(Qt.Key_L), self, lambda: self.shuttle(1))
+
+        # UI 초기화 (한 번만 구성)
         self.init_ui()
+        startup_profiler.mark('window: ui')
 
     def setup_shortcuts(self):
         """키보드 단축키 설정"""
@@ -601,23 +3623,15 @@ class VideoLabeler(QMainWindow):
             # 비디오 컨테이너 생성 및 설정
             video_container = QWidget()
             video_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # 가능한 크게 확장
-            video_container.setStyleSheet("""
-                QWidget {
-                    background-color: black;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }
-            """)
+            video_container.setObjectName('videoContainer')
             
-            # 비디오 레이블 설정
-            self.video_label = QLabel(video_container)
-            self.video_label.setAlignment(Qt.AlignCenter)
-            self.video_label.setStyleSheet("border: none;")  # 레이블 자체의 테두리 제거
+            # 비디오 캔버스 설정 (프레임과 오버레이를 직접 그림)
+            self.video_canvas = VideoCanvas(video_container)
             
-            # 비디오 레이블을 컨테이너의 중앙에 위치시키는 레이아웃
+            # 비디오 캔버스를 컨테이너에 꽉 채우는 레이아웃
             video_layout = QVBoxLayout(video_container)
             video_layout.setContentsMargins(0, 0, 0, 0)  # 여백 제거
-            video_layout.addWidget(self.video_label)
+            video_layout.addWidget(self.video_canvas)
             
             left_section.addWidget(video_container, stretch=1)  # stretch=1로 설정하여 최대한의 공간 사용
             
@@ -628,6 +3642,9 @@ class VideoLabeler(QMainWindow):
             # 타임라인 초기화
             self.timeline = TimelineWidget(parent=self)
             left_section.addWidget(self.timeline)
+            self.video_canvas.set_overlay_source(
+                self.timeline.segment_index, self.timeline.colors, self.timeline.action_names
+            )
             
             return left_section
                 
@@ -643,25 +3660,7 @@ class VideoLabeler(QMainWindow):
 
             # 비디오 슬라이더 추가
             self.video_slider = QSlider(Qt.Horizontal)
-            self.video_slider.setStyleSheet("""
-                QSlider::groove:horizontal {
-                    border: 1px solid #ddd;
-                    height: 8px;
-                    background: #ffffff;
-                    margin: 2px 0;
-                    border-radius: 4px;
-                }
-                QSlider::handle:horizontal {
-                    background: #fe3c72;
-                    border: 1px solid #ddd;
-                    width: 18px;
-                    margin: -5px 0;
-                    border-radius: 9px;
-                }
-                QSlider::handle:horizontal:hover {
-                    background: #f28cb1;
-                }
-            """)
+            self.video_slider.setObjectName('videoSlider')
             self.video_slider.setFocusPolicy(Qt.ClickFocus)  # 키보드 포커스 정책 설정
             self.video_slider.sliderMoved.connect(self.slider_moved)
             self.video_slider.sliderPressed.connect(self.slider_pressed)
@@ -671,100 +3670,64 @@ class VideoLabeler(QMainWindow):
             # 기존 컨트롤 버튼들을 담을 수평 레이아웃
             buttons_layout = QHBoxLayout()
             
-            # 틴더 스타일 버튼 기본 스타일
-            button_style = """
-                QPushButton {
-                    background-color: white;
-                    color: #424242;
-                    padding: 8px 15px;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    min-height: 20px;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #f0f0f0;
-                }
-                QPushButton:disabled {
-                    background-color: #f5f5f5;
-                    color: #999;
-                }
-            """
-            
             # 이전 프레임
             self.prev_frame_btn = QPushButton('◀◀ 이전 프레임')
-            self.prev_frame_btn.setStyleSheet(button_style)
+            self.prev_frame_btn.setProperty('variant', 'control')
             self.prev_frame_btn.clicked.connect(lambda: self.move_frame(-1))
             buttons_layout.addWidget(self.prev_frame_btn)
             
             # 이전 초
             self.prev_sec_btn = QPushButton('◀ 이전 초')
-            self.prev_sec_btn.setStyleSheet(button_style)
+            self.prev_sec_btn.setProperty('variant', 'control')
             self.prev_sec_btn.clicked.connect(lambda: self.move_second(-1))
             buttons_layout.addWidget(self.prev_sec_btn)
             
             # 재생/일시정지
             self.play_btn = QPushButton('재생')
-            self.play_btn.setStyleSheet(button_style.replace('background-color: white', 'background-color: #fe3c72') \
-                                .replace('color: #424242', 'color: white') + """
-                QPushButton:hover {
-                    background-color: #f28cb1;
-                    color: white;
-                }
-            """)
+            self.play_btn.setProperty('variant', 'control-primary')
             self.play_btn.clicked.connect(self.toggle_play)
             buttons_layout.addWidget(self.play_btn)
             
             # 다음 초
             self.next_sec_btn = QPushButton('다음 초 ▶')
-            self.next_sec_btn.setStyleSheet(button_style)
+            self.next_sec_btn.setProperty('variant', 'control')
             self.next_sec_btn.clicked.connect(lambda: self.move_second(1))
             buttons_layout.addWidget(self.next_sec_btn)
             
             # 다음 프레임
             self.next_frame_btn = QPushButton('다음 프레임 ▶▶')
-            self.next_frame_btn.setStyleSheet(button_style)
+            self.next_frame_btn.setProperty('variant', 'control')
             self.next_frame_btn.clicked.connect(lambda: self.move_frame(1))
             buttons_layout.addWidget(self.next_frame_btn)
             
             # 구간 표시
             self.mark_btn = QPushButton('구간 표시')
-            mark_button_style = button_style.replace('background-color: white', 'background-color: #fe3c72') \
-                                .replace('color: #424242', 'color: white') + """
-                QPushButton:hover {
-                    background-color: #f28cb1;
-                    color: white;
-                }
-            """
-            self.mark_btn.setStyleSheet(mark_button_style)
+            self.mark_btn.setProperty('variant', 'control-primary')
             self.mark_btn.clicked.connect(self.mark_segment)
             buttons_layout.addWidget(self.mark_btn)
             
+            # 재생 속도
+            self.speed_combo = QComboBox()
+            for speed in PLAYBACK_SPEEDS:
+                self.speed_combo.addItem(f'{speed:g}x', speed)
+            self.speed_combo.setCurrentIndex(PLAYBACK_SPEEDS.index(1.0))
+            self.speed_combo.setObjectName('speedCombo')
+            self.speed_combo.setFocusPolicy(Qt.ClickFocus)  # 키보드 포커스 정책 설정
+            self.speed_combo.currentIndexChanged.connect(
+                lambda i: self.set_playback_speed(self.speed_combo.itemData(i))
+            )
+            buttons_layout.addWidget(self.speed_combo)
+            
             # 사용자 수
             user_num_container = QWidget()
-            user_num_container.setStyleSheet("""
-                QWidget {
-                    background-color: white;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    min-height: 20px;
-                }
-            """)
+            user_num_container.setObjectName('userNumContainer')
             user_num_layout = QHBoxLayout(user_num_container)
             user_num_layout.setContentsMargins(10, 0, 10, 0)
             
             user_num_label = QLabel('사용 인원:')
-            user_num_label.setStyleSheet("border: none; color: #424242;")
             self.user_num_spin = QSpinBox()
             self.user_num_spin.setRange(1, 10)
             self.user_num_spin.setValue(1)
-            self.user_num_spin.setStyleSheet("""
-                QSpinBox {
-                    border: none;
-                    background: transparent;
-                    min-width: 50px;
-                }
-            """)
             self.user_num_spin.setFocusPolicy(Qt.ClickFocus)  # 키보드 포커스 정책 설정
             user_num_layout.addWidget(user_num_label)
             user_num_layout.addWidget(self.user_num_spin)
@@ -772,18 +3735,8 @@ class VideoLabeler(QMainWindow):
             
             # 시간 표시
             self.time_label = QLabel('프레임: 0/0 | 시간: 0.00s')
-            self.time_label.setStyleSheet("""
-                QLabel {
-                    background-color: white;
-                    color: #424242;
-                    padding: 0 15px;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    min-height: 20px;
-                    min-width: 250px;
-                    qproperty-alignment: AlignCenter;
-                }
-            """)
+            self.time_label.setObjectName('timeLabel')
+            self.time_label.setAlignment(Qt.AlignCenter)
             buttons_layout.addWidget(self.time_label)
             
             # buttons_layout을 controls에 추가
@@ -807,26 +3760,9 @@ class VideoLabeler(QMainWindow):
             path_layout = QHBoxLayout()
             self.path_input = QLineEdit()
             self.path_input.setPlaceholderText("비디오 파일 경로 입력")
-            self.path_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 5px;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }
-            """)
             
             self.load_path_btn = QPushButton('경로 로드')
-            self.load_path_btn.setStyleSheet("""
-                QPushButton {
-                    padding: 5px 10px;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    background-color: white;
-                }
-                QPushButton:hover {
-                    background-color: #f0f0f0;
-                }
-            """)
+            self.load_path_btn.setProperty('variant', 'tool')
             self.load_path_btn.clicked.connect(self.load_path)
             
             path_layout.addWidget(self.path_input)
@@ -839,17 +3775,7 @@ class VideoLabeler(QMainWindow):
             self.load_file_btn = QPushButton('파일 로드')
             
             for btn in [self.load_dir_btn, self.load_file_btn]:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        padding: 5px 10px;
-                        border: 1px solid #ddd;
-                        border-radius: 4px;
-                        background-color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #f0f0f0;
-                    }
-                """)
+                btn.setProperty('variant', 'tool')
             
             self.load_dir_btn.clicked.connect(self.load_directory)
             self.load_file_btn.clicked.connect(self.load_files)
@@ -858,81 +3784,69 @@ class VideoLabeler(QMainWindow):
             btn_layout.addWidget(self.load_file_btn)
             file_input.addLayout(btn_layout)
             
+            # 폴더 검색 포함/제외 패턴
+            pattern_layout = QHBoxLayout()
+            self.include_input = QLineEdit()
+            self.include_input.setPlaceholderText("포함 패턴 (예: *cam1*)")
+            self.exclude_input = QLineEdit()
+            self.exclude_input.setPlaceholderText("제외 패턴 (예: */backup/*)")
+            for pattern_input in [self.include_input, self.exclude_input]:
+                pattern_layout.addWidget(pattern_input)
+            file_input.addLayout(pattern_layout)
+            
             # 프로그레스바
+            progress_layout = QHBoxLayout()
             self.progress_bar = QProgressBar()
-            self.progress_bar.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    text-align: center;
-                }
-                QProgressBar::chunk {
-                    background-color: #4CAF50;
-                }
-            """)
             self.progress_bar.hide()
-            file_input.addWidget(self.progress_bar)
+            
+            # 폴더 검색 취소 버튼
+            self.cancel_scan_btn = QPushButton('취소')
+            self.cancel_scan_btn.setProperty('variant', 'tool')
+            self.cancel_scan_btn.clicked.connect(self.cancel_scan)
+            self.cancel_scan_btn.hide()
+            
+            progress_layout.addWidget(self.progress_bar)
+            progress_layout.addWidget(self.cancel_scan_btn)
+            file_input.addLayout(progress_layout)
             
             right_section.addLayout(file_input)
             
             # 파일 목록
             list_container = QVBoxLayout()
             list_label = QLabel("파일 목록")
-            list_label.setStyleSheet("""
-                QLabel {
-                    font-weight: bold;
-                    padding: 5px;
-                }
-            """)
+            list_label.setObjectName('fileListTitle')
             list_container.addWidget(list_label)
             
-            self.file_list = QTableWidget()
-            self.file_list.setColumnCount(3)
-            self.file_list.setHorizontalHeaderLabels(['파일명', '상태', '동작'])
+            self.file_model = FileListModel(self.current_files, self.status_index, self)
+            
+            self.file_list = QTableView()
+            self.file_list.setModel(self.file_model)
+            self.load_delegate = LoadButtonDelegate(self.file_list, self)
+            self.load_delegate.load_requested.connect(self.load_video)
+            self.file_list.setItemDelegateForColumn(FileListModel.COLUMN_ACTION, self.load_delegate)
+            self.file_list.setMouseTracking(True)
+            self.file_list.setSelectionMode(QTableView.NoSelection)
+            
+            # 모든 행을 같은 높이로 고정 (보이는 행만 계산)
+            vertical_header = self.file_list.verticalHeader()
+            vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+            vertical_header.setDefaultSectionSize(30)
+            
             header = self.file_list.horizontalHeader()
             header.setSectionResizeMode(0, QHeaderView.Stretch)
-            header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-            header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-            
-            self.file_list.setStyleSheet("""
-                QTableWidget {
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    background-color: white;
-                }
-                QTableWidget::item {
-                    padding: 5px;
-                }
-                QHeaderView::section {
-                    background-color: #f5f5f5;
-                    padding: 5px;
-                    border: none;
-                    border-right: 1px solid #ddd;
-                    border-bottom: 1px solid #ddd;
-                }
-            """)
+            header.setSectionResizeMode(1, QHeaderView.Fixed)
+            header.setSectionResizeMode(2, QHeaderView.Fixed)
+            self.file_list.setColumnWidth(1, 40)   # 상태 열 너비
+            self.file_list.setColumnWidth(2, 80)   # 버튼 열 너비
+            
+            self.file_list.setObjectName('fileList')
             
             list_container.addWidget(self.file_list)
             right_section.addLayout(list_container, stretch=1)
             
             # 작성 완료 버튼
             self.complete_btn = QPushButton('작성 완료')
-            self.complete_btn.setStyleSheet("""
-                QPushButton {
-                    padding: 10px;
-                    background-color: #fe3c72;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #f28cb1;
-                }
-                QPushButton:disabled {
-                    background-color: #cccccc;
-                }
-            """)
+            self.complete_btn.setObjectName('completeButton')
             self.complete_btn.clicked.connect(self.complete_annotation)
             right_section.addWidget(self.complete_btn)
             
@@ -959,24 +3873,111 @@ class VideoLabeler(QMainWindow):
                 self.mark_segment()
                 
         except Exception as e:
-            logger.error(f"Error handling key press: {str(e)}")
+            logger.error(f"Error handling key press: {str(e)}")
+
+    def toggle_play(self):
+        """재생/일시정지 전환"""
+        try:
+            if not self.cap:
+                return
+                
+            if self.is_playing:
+                self.pause_playback()
+            else:
+                self.start_playback(1)
+                
+        except Exception as e:
+            logger.error(f"Error toggling play state: {str(e)}")
+
+    def start_playback(self, direction=1):
+        """현재 위치에서 direction 방향으로 재생 시작"""
+        if not self.cap:
+            return
+        self.is_playing = True
+        self.playback_direction = direction
+        self.play_btn.setText('일시정지')
+        self.start_decoder(self.current_frame + direction, direction)
+        self.timer.start(self.playback_clock.tick_interval())
+
+    def pause_playback(self):
+        """재생 일시정지 (현재 프레임 유지)"""
+        try:
+            if not self.is_playing:
+                return
+            self.is_playing = False
+            self.play_btn.setText('재생')
+            self.timer.stop()
+            self.stop_decoder()
+        except Exception as e:
+            logger.error(f"Error pausing playback: {str(e)}")
 
-    def toggle_play(self):
-        """재생/일시정지 전환"""
+    def shuttle(self, direction):
+        """J/L 셔틀 - 같은 방향으로 재생 중이면 배속을 올리고, 아니면 1배속으로 그 방향 재생"""
         try:
             if not self.cap:
                 return
-                
-            self.is_playing = not self.is_playing
-            if self.is_playing:
-                self.play_btn.setText('일시정지')
-                self.timer.start(int(1000 / self.fps))  # fps에 맞춰 타이머 간격 설정
+
+            if self.is_playing and self.playback_direction == direction:
+                faster = [s for s in SHUTTLE_SPEEDS if s > self.playback_clock.speed]
+                speed = faster[0] if faster else SHUTTLE_SPEEDS[-1]
             else:
-                self.play_btn.setText('재생')
-                self.timer.stop()
-                
+                speed = SHUTTLE_SPEEDS[0]
+            self.speed_combo.setCurrentIndex(PLAYBACK_SPEEDS.index(speed))
+
+            if not self.is_playing or self.playback_direction != direction:
+                self.pause_playback()
+                self.start_playback(direction)
         except Exception as e:
-            logger.error(f"Error toggling play state: {str(e)}")
+            logger.error(f"Error in shuttle playback: {str(e)}")
+
+    def start_decoder(self, start_frame, direction=1):
+        """재생용 백그라운드 디코더 시작 (direction이 -1이면 역재생 디코더)"""
+        self.stop_decoder()
+        if self.current_file_index < 0:
+            return
+
+        # start_frame이 한 프레임 간격 뒤에 표시되도록 시계 시작
+        self.playback_clock.start(start_frame - direction, direction)
+        self.last_presented_frame = start_frame - direction
+        self.frame_buffer = FrameRingBuffer(PLAYBACK_BUFFER_SIZE)
+        if direction < 0:
+            self.decoder = ReverseFrameDecoder(
+                self.current_files[self.current_file_index],
+                start_frame,
+                self.frame_buffer,
+                self.video_canvas.size(),
+                keyframe_index=self.seek_engine.keyframe_index if self.seek_engine else None,
+                clock=self.playback_clock
+            )
+        else:
+            self.decoder = FrameDecoder(
+                self.current_files[self.current_file_index],
+                start_frame,
+                self.frame_buffer,
+                self.video_canvas.size(),
+                clock=self.playback_clock
+            )
+        self.decoder.start()
+
+    def stop_decoder(self):
+        """백그라운드 디코더 중지"""
+        if self.decoder is not None:
+            self.decoder.stop()
+            if self.decoder.skipped or self.dropped_frames:
+                logger.info(f"Playback dropped {self.decoder.skipped + self.dropped_frames} late frame(s)")
+            self.decoder = None
+        self.frame_buffer = None
+        self.dropped_frames = 0
+
+    def set_playback_speed(self, speed):
+        """재생 배속 변경 (재생 중이면 현재 위치에서 바로 적용)"""
+        try:
+            self.playback_clock.set_speed(speed)
+            if self.is_playing:
+                self.timer.setInterval(self.playback_clock.tick_interval())
+            logger.info(f"Playback speed: {speed}x")
+        except Exception as e:
+            logger.error(f"Error setting playback speed: {str(e)}")
 
     def move_frame(self, delta):
         """프레임 단위 이동"""
@@ -986,8 +3987,10 @@ class VideoLabeler(QMainWindow):
                 
             target_frame = self.current_frame + delta
             if 0 <= target_frame < self.total_frames:
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-                self.update_frame()
+                if self.is_playing:
+                    self.start_decoder(target_frame, self.playback_direction)
+                    return
+                self.show_frame(target_frame)
                 
         except Exception as e:
             logger.error(f"Error moving frame: {str(e)}")
@@ -998,10 +4001,12 @@ class VideoLabeler(QMainWindow):
             if not self.cap:
                 return
                 
-            target_frame = self.current_frame + (seconds * self.fps)
+            target_frame = self.current_frame + int(round(seconds * self.fps))
             if 0 <= target_frame < self.total_frames:
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-                self.update_frame()
+                if self.is_playing:
+                    self.start_decoder(target_frame, self.playback_direction)
+                    return
+                self.show_frame(target_frame)
                 
         except Exception as e:
             logger.error(f"Error moving second: {str(e)}")
@@ -1013,79 +4018,108 @@ class VideoLabeler(QMainWindow):
                 logger.warning("Video capture is not initialized or opened")
                 return
 
-            ret, frame = self.cap.read()
-            if not ret:
-                # 마지막 프레임에 도달한 경우
-                if self.current_frame >= self.total_frames - 1:
-                    self.is_playing = False
-                    self.timer.stop()
-                    self.play_btn.setText('재생')
-                    logger.info("Reached end of video")
-                    return
-                
-                # 그 외의 경우 처음으로 되감기
-                logger.info("Rewinding video to start")
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = self.cap.read()
-                if not ret:
-                    raise Exception("Failed to read video frame after rewind")
-            
-            try:
-                # OpenCV BGR to RGB 변환
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_frame.shape
-                bytes_per_line = ch * w
-                
-                # QImage 생성
-                qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                
-                # 비디오 레이블의 현재 크기 가져오기
-                label_size = self.video_label.size()
-                
-                # 영상 비율을 유지하면서 최대한 큰 크기로 스케일링
-                scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                    label_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                
-                # 비디오 레이블 중앙에 표시
-                self.video_label.setPixmap(scaled_pixmap)
-                
-                # 프레임 정보 업데이트
-                self.current_frame = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES)) - 1  # -1 because read() advances frame
-                current_time = self.current_frame / self.fps
-                total_time = self.total_frames / self.fps
-                
-                # 시간 표시 업데이트
-                if self.total_frames > 0:  # 0으로 나누기 방지
-                    self.time_label.setText(
-                        f'프레임: {self.current_frame}/{self.total_frames} | '
-                        f'시간: {current_time:.2f}/{total_time:.2f}s'
-                    )
-
-                # 슬라이더 업데이트
-                self.video_slider.setMaximum(self.total_frames - 1)
-                if not self.video_slider.isSliderDown():  # 드래그 중이 아닐 때만 업데이트
-                    self.video_slider.setValue(self.current_frame)
-                
-                # 타임라인 업데이트
-                if self.timeline:
-                    self.timeline.set_current_frame(self.current_frame)
-                    self.timeline.set_total_frames(self.total_frames)
-                    self.timeline.update()
-                    
-                logger.debug(f"Frame updated: {self.current_frame}/{self.total_frames}")
-                
-            except cv2.error as e:
-                logger.error(f"OpenCV error while processing frame: {str(e)}")
-                raise
+            # 재생 중에는 디코더가 준비한 프레임만 꺼내서 표시
+            if self.is_playing and self.frame_buffer is not None:
+                self.present_buffered_frame()
+                return
+
+            # 마지막 프레임에 도달한 경우
+            if self.current_frame >= self.total_frames - 1:
+                self.finish_playback()
+                return
+
+            self.show_frame(self.current_frame + 1)
                 
         except Exception as e:
             logger.error(f"Error updating frame: {str(e)}", exc_info=True)
             self.stop_playback()
             QMessageBox.critical(self, '오류', f'프레임 업데이트 실패: {str(e)}')
 
+    def show_frame(self, frame_index):
+        """탐색 엔진으로 지정한 프레임을 읽어 표시"""
+        frame = self.seek_engine.read_frame(frame_index)
+        if frame is None:
+            raise Exception(f"Failed to read video frame {frame_index}")
+
+        try:
+            qt_image = self.frame_converter.convert(frame, self.video_canvas.size(), PAUSED_DISPLAY_QUALITY)
+        except cv2.error as e:
+            logger.error(f"OpenCV error while processing frame: {str(e)}")
+            raise
+
+        self.display_frame(qt_image, frame_index)
+
+    def present_buffered_frame(self):
+        """재생 시계가 가리키는 프레임을 링 버퍼에서 꺼내 표시 (늦은 프레임은 버림)"""
+        due = self.playback_clock.frame()
+        direction = self.playback_direction
+        if (due - self.last_presented_frame) * direction <= 0:
+            # 아직 다음 프레임을 표시할 시각이 아님
+            return
+
+        item = self.frame_buffer.pop()
+        if item is None:
+            # 디코더가 아직 따라오지 못한 경우 이번 틱은 건너뜀
+            return
+
+        # 시계보다 뒤처진 프레임은 건너뛰고 가장 최근 준비된 프레임까지 따라감
+        while item[1] is not None and (due - item[0]) * direction > 0:
+            next_item = self.frame_buffer.pop()
+            if next_item is None:
+                break
+            self.dropped_frames += 1
+            item = next_item
+
+        frame_index, qt_image = item
+        if qt_image is None:
+            self.finish_playback()
+            return
+
+        self.last_presented_frame = frame_index
+        self.display_frame(qt_image, frame_index)
+
+        # 캔버스 크기가 바뀐 경우 이후 프레임부터 새 크기로 변환
+        canvas_size = self.video_canvas.size()
+        if self.decoder is not None and self.decoder.target_size != canvas_size:
+            self.decoder.set_target_size(canvas_size)
+
+    def finish_playback(self):
+        """마지막(역재생 시 첫) 프레임 도달 시 재생 종료"""
+        self.is_playing = False
+        self.timer.stop()
+        self.stop_decoder()
+        self.play_btn.setText('재생')
+        logger.info("Reached start of video" if self.playback_direction < 0 else "Reached end of video")
+
+    def display_frame(self, qt_image, frame_index, smooth=True):
+        """변환된 프레임을 화면에 표시하고 프레임 정보 갱신"""
+        # 비디오 캔버스에 표시 (다음 그리기에서 오버레이와 함께 그려짐)
+        self.video_canvas.set_frame(qt_image, frame_index, smooth)
+        
+        # 프레임 정보 업데이트
+        self.current_frame = frame_index
+        current_time = self.current_frame / self.fps
+        total_time = self.total_frames / self.fps
+        
+        # 시간 표시 업데이트
+        if self.total_frames > 0:  # 0으로 나누기 방지
+            self.time_label.setText(
+                f'프레임: {self.current_frame}/{self.total_frames} | '
+                f'시간: {current_time:.2f}/{total_time:.2f}s'
+            )
+
+        # 슬라이더 업데이트
+        self.video_slider.setMaximum(self.total_frames - 1)
+        if not self.video_slider.isSliderDown():  # 드래그 중이 아닐 때만 업데이트
+            self.video_slider.setValue(self.current_frame)
+        
+        # 타임라인 업데이트
+        if self.timeline:
+            self.timeline.set_total_frames(self.total_frames)
+            self.timeline.set_current_frame(self.current_frame)
+            
+        logger.debug(f"Frame updated: {self.current_frame}/{self.total_frames}")
+
     def slider_pressed(self):
         """슬라이더 드래그 시작"""
         try:
@@ -1095,22 +4129,43 @@ class VideoLabeler(QMainWindow):
             logger.error(f"Error in slider_pressed: {str(e)}")
 
     def slider_moved(self):
-        """슬라이더 이동 중"""
+        """슬라이더 이동 중 (목표 위치만 기록하고 디코딩은 스크럽 타이머에서 처리)"""
         try:
             if self.cap:
-                frame = self.video_slider.value()
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
-                self.update_frame()
+                self.scrub_target = self.video_slider.value()
+                if not self.scrub_timer.isActive():
+                    self.scrub_timer.start()
         except Exception as e:
             logger.error(f"Error in slider_moved: {str(e)}")
 
+    def process_scrub(self):
+        """모인 슬라이더 이벤트 중 가장 최근 위치의 미리보기 표시"""
+        try:
+            target = self.scrub_target
+            self.scrub_target = None
+            if target is None or not self.cap or not self.video_slider.isSliderDown():
+                return
+            if target == self.current_frame:
+                return
+
+            frame = self.seek_engine.read_preview(target)
+            if frame is None:
+                return
+
+            # 드래그 중에는 저해상도로 빠르게 변환
+            preview_size = self.video_canvas.size() * SCRUB_PREVIEW_SCALE
+            qt_image = self.frame_converter.convert(frame, preview_size, 'fast')
+            self.display_frame(qt_image, target, smooth=False)
+        except Exception as e:
+            logger.error(f"Error in process_scrub: {str(e)}")
+
     def slider_released(self):
-        """슬라이더 드래그 종료"""
+        """슬라이더 드래그 종료 (최종 위치를 원본 화질로 표시)"""
         try:
+            self.scrub_timer.stop()
+            self.scrub_target = None
             if self.cap:
-                frame = self.video_slider.value()
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
-                self.update_frame()
+                self.show_frame(self.video_slider.value())
         except Exception as e:
             logger.error(f"Error in slider_released: {str(e)}")
 
@@ -1119,8 +4174,11 @@ class VideoLabeler(QMainWindow):
         try:
             self.is_playing = False
             self.timer.stop()
+            self.stop_decoder()
             self.play_btn.setText('재생')
             
+            self.stop_thumbnail_worker()
+            self.seek_engine = None
             if self.cap is not None:
                 self.cap.release()
                 self.cap = None
@@ -1181,126 +4239,117 @@ class VideoLabeler(QMainWindow):
             QMessageBox.critical(self, '오류', f'파일 로드 실패: {str(e)}')
 
     def load_video_files(self, path):
-        """비디오 파일 목록 로드"""
+        """비디오 파일 목록 로드 (폴더는 백그라운드에서 검색)"""
         try:
-            video_files = []
             if path.is_file():
-                if self.is_video_file(path):
-                    video_files.append(path)
-            else:
-                for file in path.rglob('*'):
-                    if self.is_video_file(file):
-                        video_files.append(file)
-                        
-            if not video_files:
-                QMessageBox.warning(self, '경고', '비디오 파일을 찾을 수 없습니다.')
+                if not self.is_video_file(path):
+                    QMessageBox.warning(self, '경고', '비디오 파일을 찾을 수 없습니다.')
+                    return
+                self.add_video_files([path])
                 return
-                
-            self.add_video_files(video_files)
+
+            self.start_scan(path)
             
         except Exception as e:
             logger.error(f"Error loading video files: {str(e)}")
             raise
 
+    def start_scan(self, path):
+        """폴더 백그라운드 검색 시작"""
+        self.stop_scan(wait=False)
+        self.scanner = DirectoryScanner(
+            path,
+            parse_patterns(self.include_input.text()),
+            parse_patterns(self.exclude_input.text())
+        )
+        self.scanner.files_found.connect(self.on_files_found)
+        self.scanner.progress.connect(self.on_scan_progress)
+        self.scanner.scan_finished.connect(self.on_scan_finished)
+
+        self.progress_bar.setRange(0, 0)  # 전체 개수를 알 수 없으므로 진행 중 표시
+        self.progress_bar.setFormat('검색 중...')
+        self.progress_bar.show()
+        self.cancel_scan_btn.setEnabled(True)
+        self.cancel_scan_btn.show()
+        self.scanner.start()
+
+    def stop_scan(self, wait=True):
+        """진행 중인 폴더 검색 중지 (wait=False면 취소만 요청하고 스레드 종료는 기다리지 않음)"""
+        if self.scanner is not None:
+            self.scanner.cancel()
+            self.retire_scanner()
+        if wait:
+            for scanner in list(self.retired_scanners):
+                scanner.stop()
+            self.retired_scanners.clear()
+        self.progress_bar.hide()
+        self.cancel_scan_btn.hide()
+
+    def retire_scanner(self):
+        """현재 검색 스레드를 내려놓되, 스레드가 끝날 때까지는 참조 유지"""
+        scanner = self.scanner
+        self.scanner = None
+        if scanner.isRunning():
+            self.retired_scanners.add(scanner)
+            scanner.finished.connect(lambda: self.retired_scanners.discard(scanner))
+
+    def cancel_scan(self):
+        """폴더 검색 취소 버튼 처리 (느린 폴더 읽기를 기다리지 않고, 정리는 on_scan_finished에서)"""
+        try:
+            if self.scanner is not None:
+                self.scanner.cancel()
+                self.progress_bar.setFormat('취소 중...')
+                self.cancel_scan_btn.setEnabled(False)
+        except Exception as e:
+            logger.error(f"Error cancelling scan: {str(e)}")
+
+    def on_files_found(self, files):
+        """검색된 비디오 묶음을 파일 목록에 추가 (이전 검색 결과는 무시)"""
+        if self.sender() is self.scanner:
+            self.add_video_files(files)
+
+    def on_scan_progress(self, scanned, found):
+        """폴더 검색 진행 상황 표시 (취소 중이면 표시 유지)"""
+        if self.sender() is self.scanner and self.cancel_scan_btn.isEnabled():
+            self.progress_bar.setFormat(f'검색 중... {scanned:,}개 확인 / 비디오 {found:,}개')
+
+    def on_scan_finished(self, found, cancelled):
+        """폴더 검색 완료 처리"""
+        try:
+            if self.sender() is not self.scanner:
+                return
+            self.retire_scanner()
+            self.progress_bar.hide()
+            self.cancel_scan_btn.hide()
+            logger.info(f"Directory scan finished: {found} videos (cancelled={cancelled})")
+            if found == 0 and not cancelled:
+                QMessageBox.warning(self, '경고', '비디오 파일을 찾을 수 없습니다.')
+        except Exception as e:
+            logger.error(f"Error finishing scan: {str(e)}")
+
     def is_video_file(self, path):
         """비디오 파일 여부 확인"""
-        return path.suffix.lower() in ['.mp4', '.avi', '.mov', '.mkv']
+        return path.suffix.lower() in VIDEO_EXTENSIONS
 
     def add_video_files(self, files):
         """비디오 파일 목록에 파일 추가"""
         try:
-            # 중복 제거
-            existing_paths = {str(f) for f in self.current_files}
-            new_files = [f for f in files if str(f) not in existing_paths]
+            # 중복 제거 (경로 집합으로 확인)
+            new_files = []
+            for f in files:
+                key = str(f)
+                if key not in self.current_file_set:
+                    self.current_file_set.add(key)
+                    new_files.append(f)
             
             if new_files:
-                self.current_files.extend(new_files)
-                self.update_file_list()
+                self.file_model.append_files(new_files)
+                self.prober.enqueue(new_files)
                 
         except Exception as e:
             logger.error(f"Error adding video files: {str(e)}")
             raise
 
-    def update_file_list(self):
-        """파일 목록 테이블 업데이트"""
-        try:
-            # 테이블 기본 설정
-            self.file_list.setRowCount(len(self.current_files))
-            self.file_list.setColumnWidth(0, 200)  # 파일명 열 너비
-            self.file_list.setColumnWidth(1, 40)   # 상태 열 너비
-            
-            # 마지막 열 고정 크기 설정
-            self.file_list.horizontalHeader().setSectionResizeMode(2, QHeaderView.Fixed)
-            self.file_list.setColumnWidth(2, 80)   # 버튼 열 너비를 80으로 증가
-            
-            for i, file in enumerate(self.current_files):
-                # 행 높이 설정
-                self.file_list.setRowHeight(i, 30)  # 행 높이를 30으로 증가
-                
-                # 파일명
-                name_item = QTableWidgetItem(file.name)
-                name_item.setToolTip(str(file))
-                self.file_list.setItem(i, 0, name_item)
-                
-                # 상태 (어노테이션 존재 여부)
-                json_path = file.with_suffix('.json')
-                status_item = QTableWidgetItem()
-                if json_path.exists():
-                    try:
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            if ('meta_data' in data and 'annotations' in data and 
-                                'segmentation' in data['annotations']):
-                                status_item.setText('✓')
-                    except:
-                        pass
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.file_list.setItem(i, 1, status_item)
-                
-                # 현재 실행 중인 파일 행 색상 변경
-                if i == self.current_file_index:
-                    for col in range(3):
-                        item = self.file_list.item(i, col)
-                        if item:
-                            item.setBackground(QBrush(QColor("#f28cb1")))
-                
-                # 로드 버튼
-                if i != self.current_file_index:
-                    container = QWidget()
-                    container_layout = QHBoxLayout(container)
-                    container_layout.setContentsMargins(5, 0, 5, 0)
-                    container_layout.setSpacing(0)
-                    
-                    load_btn = QPushButton('로드')
-                    load_btn.setFixedSize(60, 24)
-                    load_btn.setStyleSheet("""
-                        QPushButton {
-                            border: 1px solid #ddd;
-                            border-radius: 3px;
-                            background-color: white;
-                            padding: 0px;
-                        }
-                        QPushButton:hover {
-                            background-color: #f0f0f0;
-                        }
-                        QPushButton:pressed {
-                            background-color: #e0e0e0;
-                        }
-                    """)
-                    load_btn.clicked.connect(lambda x, idx=i: self.load_video(idx))
-                    
-                    container_layout.addWidget(load_btn, alignment=Qt.AlignCenter)
-                    self.file_list.setCellWidget(i, 2, container)
-                else:
-                    current_item = QTableWidgetItem('현재 파일')
-                    current_item.setTextAlignment(Qt.AlignCenter)
-                    current_item.setForeground(QBrush(QColor("#ffffff")))
-                    self.file_list.setItem(i, 2, current_item)
-                    
-        except Exception as e:
-            logger.error(f"Error updating file list: {str(e)}")
-            raise
-
     def load_video(self, index):
         """선택한 비디오 파일 로드"""
         try:
@@ -1319,10 +4368,28 @@ class VideoLabeler(QMainWindow):
                     return
                 elif reply == QMessageBox.Yes:
                     self.save_annotations()
+                else:
+                    self.discard_journal()
 
             file_path = self.current_files[index]
             
+            # 재생 중이던 디코더 정리
+            self.is_playing = False
+            self.timer.stop()
+            self.stop_decoder()
+            self.play_btn.setText('재생')
+            
+            logger.info(f"Frame cache stats: {self.frame_cache.stats()}")
+            
+            # 이전 비디오의 프레임은 캐시에서 비움 (곧 미리 열 파일이면 유지)
+            if 0 <= self.current_file_index < len(self.current_files):
+                previous_path = self.current_files[self.current_file_index]
+                if previous_path != file_path and previous_path not in self.current_files[index + 1:index + 1 + self.prefetcher.depth]:
+                    self.frame_cache.discard_file(previous_path)
+
             # 기존 비디오 캡처 해제
+            self.stop_thumbnail_worker()
+            self.seek_engine = None
             if self.cap is not None:
                 self.cap.release()
                 self.cap = None
@@ -1330,46 +4397,80 @@ class VideoLabeler(QMainWindow):
             # 세그먼트와 타임라인 초기화
             self.segments = []
             if self.timeline:
-                self.timeline.segments = []
-                self.timeline.update()
+                self.timeline.set_segments([])
+                self.timeline.reset_view()
+            self.video_canvas.clear()
             
             # 파일 존재 확인
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            # VideoCapture 생성
-            self.cap = cv2.VideoCapture(str(file_path))
+            # VideoCapture 생성 (미리 열어 둔 비디오가 있으면 그대로 사용)
+            self.prefetched = self.prefetcher.take(file_path)
+            if self.prefetched is not None:
+                self.cap = self.prefetched.cap
+                self.prefetched.cap = None
+            else:
+                self.cap = cv2.VideoCapture(str(file_path))
             
             if not self.cap.isOpened():
                 raise Exception("Failed to open video file")
             
-            # 비디오 정보 가져오기
-            self.fps = int(self.cap.get(cv2.CAP_PROP_FPS))
+            # 비디오 정보 가져오기 (캐시에 있으면 컨테이너를 다시 조사하지 않음)
+            metadata = self.metadata_cache.get(file_path)
+            if metadata is None and self.prefetched is not None:
+                metadata = self.prefetched.metadata
+            if metadata is None:
+                metadata = {
+                    'fps': self.cap.get(cv2.CAP_PROP_FPS),
+                    'frame_count': int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                    'width': int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    'height': int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                }
+            if not VideoMetadataCache.has_keyframe_index(metadata):
+                # 키프레임 인덱스 등 나머지 정보는 백그라운드에서 우선 조사
+                self.prober.enqueue([file_path], front=True, keyframes=True)
+            
+            self.fps = float(metadata['fps'])
             if self.fps <= 0:
-                self.fps = 15  # 기본값 설정
+                self.fps = 15.0  # 기본값 설정
+            self.playback_clock.set_fps(self.fps)
                 
-            self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self.total_frames = metadata['frame_count']
+            self.video_width = metadata['width']
+            self.video_height = metadata['height']
+            self.video_canvas.set_video_size(self.video_width, self.video_height)
             self.current_frame = 0
             self.current_file_index = index
             
-            # 첫 프레임 테스트
-            ret, test_frame = self.cap.read()
-            if not ret or test_frame is None:
-                raise Exception("Failed to read first frame")
+            # 탐색 엔진 생성 (키프레임 인덱스는 메타데이터 캐시에서 가져옴)
+            self.seek_engine = SeekEngine(
+                self.cap, file_path, self.frame_cache, VideoMetadataCache.keyframe_index(metadata)
+            )
+            if self.prefetched is not None:
+                self.seek_engine.position = self.prefetched.position
             
-            # 처음으로 되감기
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            # 첫 프레임 테스트 (프레임 캐시에 남으므로 표시 시 다시 디코딩하지 않음)
+            if self.seek_engine.read_frame(0) is None:
+                raise Exception("Failed to read first frame")
             
             # UI 업데이트
             self.enable_video_controls(True)
-            self.update_frame()
-            self.update_file_list()
+            self.show_frame(0)
+            self.file_model.set_current_index(index)
             
+            # 필름스트립 썸네일 생성 시작
+            self.start_thumbnail_worker(file_path)
+            
+            # 변경사항 초기화 (편집 기록을 복구하면 load_annotations에서 다시 표시)
+            self.has_unsaved_changes = False
+
             # 어노테이션 로드
             self.load_annotations()
+            self.prefetched = None
             
-            # 변경사항 초기화
-            self.has_unsaved_changes = False
+            # 목록의 다음 비디오 미리 열기
+            self.prefetch_next(index)
             
             logger.info("Video loaded successfully")
             
@@ -1378,135 +4479,211 @@ class VideoLabeler(QMainWindow):
             self.stop_playback()
             QMessageBox.critical(self, '오류', f'비디오 로드 실패: {str(e)}')
 
+    def prefetch_next(self, index):
+        """현재 비디오 다음 파일들을 백그라운드에서 미리 열기"""
+        next_files = self.current_files[index + 1:index + 1 + self.prefetcher.depth]
+        self.prober.enqueue(next_files, front=True, keyframes=True)
+        self.prefetcher.request(next_files)
+
+    def read_annotation_file(self, json_path):
+        """어노테이션 문서 읽기 (미리 읽어 둔 문서가 최신이면 그대로 사용)"""
+        if self.prefetched is not None:
+            document = self.prefetched.annotation_for(json_path)
+            if document is not None:
+                return document
+        return AnnotationDocument.load(json_path)
+
+    def start_thumbnail_worker(self, file_path):
+        """타임라인 썸네일 백그라운드 생성 시작"""
+        self.stop_thumbnail_worker()
+        if not self.timeline or self.total_frames <= 0:
+            return
+
+        self.thumbnail_worker = ThumbnailWorker(file_path, self.total_frames, self.timeline.thumbnail_cache)
+        self.thumbnail_worker.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_worker.start(QThread.LowPriority)
+
+    def stop_thumbnail_worker(self):
+        """진행 중인 썸네일 생성 취소"""
+        if self.thumbnail_worker is not None:
+            self.thumbnail_worker.stop()
+            self.thumbnail_worker = None
+        if self.timeline:
+            self.timeline.clear_thumbnails()
+
+    def on_thumbnail_ready(self, video_path, slot, image):
+        """생성된 썸네일을 타임라인에 반영"""
+        if (0 <= self.current_file_index < len(self.current_files)
+                and str(self.current_files[self.current_file_index]) == video_path):
+            self.timeline.set_thumbnail(slot, image)
+
+    def on_metadata_ready(self, video_path, metadata):
+        """메타데이터 조사 완료 처리 (현재 비디오면 키프레임 인덱스 적용)"""
+        try:
+            if (self.seek_engine is not None and self.seek_engine.keyframe_index is None
+                    and self.seek_engine.video_path == video_path):
+                keyframe_index = VideoMetadataCache.keyframe_index(metadata)
+                if keyframe_index is not None:
+                    self.seek_engine.set_keyframe_index(keyframe_index)
+                    logger.info(f"Keyframe index ready: {len(keyframe_index.keyframes)} keyframes in {video_path}")
+        except Exception as e:
+            logger.error(f"Error applying video metadata: {str(e)}")
+
     def load_annotations(self):
-        """어노테이션 파일 로드"""
+        """어노테이션 파일 로드 (없거나 읽을 수 없으면 빈 문서로 시작)"""
         try:
             if self.current_file_index < 0:
                 return
 
-            json_path = self.current_files[self.current_file_index].with_suffix('.json')
-            if json_path.exists():
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                    # 필요한 키들이 모두 있는지 확인
-                    if ('meta_data' in data and 'annotations' in data and 
-                        'segmentation' in data['annotations']):
-                        
-                        self.segments = []
-                        for seg in data['annotations'].get('segmentation', []):
-                            if all(key in seg for key in ['start_frame', 'end_frame', 'action_type']):
-                                segment = VideoSegment(
-                                    seg['start_frame'],
-                                    seg['end_frame'],
-                                    seg['action_type']
-                                )
-                                segment.duration = seg.get('duration', 
-                                    segment.end_frame - segment.start_frame)
-                                segment.keyframe = seg.get('keyframe', 
-                                    (segment.start_frame + segment.end_frame) // 2)
-                                segment.keypoints = seg.get('keypoints', [])
-                                self.segments.append(segment)
-
-                        if 'user_num' in data['annotations']:
-                            self.user_num_spin.setValue(data['annotations']['user_num'])
-
-                        logger.info(f"Loaded {len(self.segments)} segments from {json_path}")
-                    else:
-                        self.segments = []
-                        logger.info("Invalid JSON structure")
+            file_path = self.current_files[self.current_file_index]
+            json_path = file_path.with_suffix('.json')
+            self.document = None
+            self.segments = []
+            self.history.clear()
 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error loading annotations: {str(e)}")
-                    self.segments = []
-                except Exception as e:
-                    logger.error(f"Error processing annotations: {str(e)}")
-                    self.segments = []
+            if not json_path.exists():
+                logger.info(f"No annotation file exists: {json_path}")
             else:
-                self.segments = []
+                try:
+                    self.document = self.read_annotation_file(json_path)
+                    self.segments = self.document.segments
+                    if self.document.skipped:
+                        logger.warning(f"Skipped {self.document.skipped} malformed segment(s) in {json_path}")
+                    overlaps = count_overlaps(self.document.columns())
+                    if overlaps:
+                        logger.warning(f"{overlaps} overlapping segment(s) in {json_path}")
+                    self.user_num_spin.setValue(self.document.user_num)
+                    logger.info(f"Loaded {len(self.segments)} segments from {json_path}")
+                except AnnotationError as e:
+                    logger.error(f"Invalid annotation file {json_path}: {str(e)}")
+                except ValueError as e:
+                    logger.error(f"Error parsing JSON file: {str(e)}")
+                except Exception as e:
+                    logger.error(f"Error loading annotations: {str(e)}")
+
+            if self.document is None:
+                self.document = AnnotationDocument.new(
+                    file_path, self.video_width, self.video_height, self.fps, self.total_frames
+                )
+                self.segments = self.document.segments
+
+            # 비정상 종료로 저장되지 못한 편집 복구
+            self.recover_journal(json_path)
 
             # Timeline 업데이트
             if self.timeline:
-                self.timeline.segments = self.segments
-                self.timeline.update()
+                self.timeline.set_segments(self.segments)
+            self.video_canvas.update()
 
         except Exception as e:
             logger.error(f"Error in load_annotations: {str(e)}")
             self.segments = []
 
-    def load_annotations(self):
-        """어노테이션 파일 로드"""
-        try:
-            if self.current_file_index < 0:
-                return
+    def recover_journal(self, json_path):
+        """편집 기록에 남은 저장되지 않은 편집을 확인하고 복구"""
+        if self.saver.is_pending(json_path):
+            return  # 이번 세션에서 아직 저장 중인 편집
+        entries = self.journal.pending(json_path)
+        if not entries:
+            return
 
-            json_path = self.current_files[self.current_file_index].with_suffix('.json')
-            if not json_path.exists():
-                logger.info(f"No annotation file exists: {json_path}")
-                self.segments = []
-                return
+        reply = QMessageBox.question(
+            self,
+            '복구',
+            f'이전 세션에서 저장되지 않은 편집 {len(entries)}건이 있습니다. 복구하시겠습니까?',
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            self.journal.discard(json_path)
+            return
 
+        applied = 0
+        for entry in entries:
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # 데이터 구조 검증
-                required_keys = ['meta_data', 'additional_info', 'annotations']
-                if not all(key in data for key in required_keys):
-                    logger.error("Missing required keys in JSON data")
-                    self.segments = []
-                    return
-
-                annotations = data['annotations']
-                if 'segmentation' not in annotations:
-                    logger.error("Missing segmentation data in annotations")
-                    self.segments = []
-                    return
+                apply_journal_entry(self.segments, entry)
+                applied += 1
+            except Exception as e:
+                logger.error(f"Error replaying journal entry {entry}: {str(e)}")
+                break
+        if applied < len(entries):
+            # 중간에 적용할 수 없는 기록이 있으면 이후 편집은 이어 붙이지 않음
+            self.journal.discard(json_path)
+        if applied:
+            self.has_unsaved_changes = True
+        logger.info(f"Recovered {applied} journaled edit(s) for {json_path}")
 
-                # 세그먼트 데이터 로드
-                self.segments = []
-                for seg in annotations['segmentation']:
-                    try:
-                        required_seg_keys = ['start_frame', 'end_frame', 'action_type', 'duration', 'keyframe']
-                        if not all(key in seg for key in required_seg_keys):
-                            logger.warning(f"Skipping segment due to missing keys: {seg}")
-                            continue
+    def record_edit(self, op, **values):
+        """현재 어노테이션의 편집 기록 추가"""
+        if self.current_file_index < 0:
+            return
+        json_path = self.current_files[self.current_file_index].with_suffix('.json')
+        self.journal.append(json_path, op, **values)
+        self.saver.journal_changed()
 
-                        segment = VideoSegment(
-                            seg['start_frame'],
-                            seg['end_frame'],
-                            seg['action_type']
-                        )
-                        segment.duration = seg['duration']
-                        segment.keyframe = seg['keyframe']
-                        segment.keypoints = seg.get('keypoints', [])
-                        self.segments.append(segment)
-                    except Exception as e:
-                        logger.error(f"Error processing segment: {str(e)}")
-                        continue
+    def discard_journal(self):
+        """현재 어노테이션의 저장되지 않은 편집 기록 버리기"""
+        if self.current_file_index < 0:
+            return
+        self.journal.discard(self.current_files[self.current_file_index].with_suffix('.json'))
 
-                # user_num 설정
-                if 'user_num' in annotations:
-                    self.user_num_spin.setValue(annotations['user_num'])
+    def autosave(self):
+        """자동 저장 - 마지막 저장 이후의 편집 기록만 디스크에 확정
 
-                logger.info(f"Loaded {len(self.segments)} segments from {json_path}")
+        어노테이션 파일 자체는 작성 완료/편집 시에만 기록하고(파일 존재 여부가 작업 상태를
+        나타냄), 자동 저장은 비정상 종료 시 복구에 쓰이는 편집 기록을 확정한다.
+        재생 중에는 디코딩과 겹치지 않도록 미루고 짧은 간격으로 다시 확인한다.
+        """
+        try:
+            if self.current_file_index < 0 or not self.has_unsaved_changes:
+                return
+            json_path = self.current_files[self.current_file_index].with_suffix('.json')
+            if not self.journal.unsynced(json_path):
+                return
 
-                # Timeline 업데이트
-                if self.timeline:
-                    self.timeline.segments = self.segments
-                    self.timeline.update()
+            if self.is_playing:
+                if self.autosave_timer.interval() != AUTOSAVE_RETRY_MS:
+                    self.autosave_timer.start(AUTOSAVE_RETRY_MS)
+                return
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON file: {str(e)}")
-                self.segments = []
-            except Exception as e:
-                logger.error(f"Error loading annotations: {str(e)}")
-                self.segments = []
+            self.saver.request_sync(json_path)
+            if self.autosave_timer.interval() != self.autosave_interval_ms:
+                self.autosave_timer.start(self.autosave_interval_ms)
+        except Exception as e:
+            logger.error(f"Error during autosave: {str(e)}")
 
+    def on_annotations_saved(self, json_path, data):
+        """백그라운드 저장 완료 처리"""
+        try:
+            self.file_model.refresh_annotation(json_path)
+            if json_path in self.completion_paths:
+                self.completion_paths.discard(json_path)
+                QMessageBox.information(self, '완료', '어노테이션이 저장되었습니다.')
         except Exception as e:
-            logger.error(f"Error in load_annotations: {str(e)}")
-            self.segments = []
+            logger.error(f"Error handling saved annotations: {str(e)}")
+
+    def on_annotations_save_failed(self, json_path, message):
+        """백그라운드 저장 실패 처리 (편집 기록은 남아 있으므로 다시 저장 가능)"""
+        self.completion_paths.discard(json_path)
+        if (0 <= self.current_file_index < len(self.current_files)
+                and str(self.current_files[self.current_file_index].with_suffix('.json')) == json_path):
+            self.has_unsaved_changes = True
+        QMessageBox.critical(self, '오류', f'어노테이션 저장 실패: {message}')
+
+    def sync_document(self):
+        """화면의 편집 상태(구간, 사용 인원, 비디오 정보)를 어노테이션 문서에 반영"""
+        file_path = self.current_files[self.current_file_index]
+        if self.document is None:
+            self.document = AnnotationDocument.new(
+                file_path, self.video_width, self.video_height, self.fps, self.total_frames
+            )
+        else:
+            self.document.update_video_info(
+                file_path, self.video_width, self.video_height, self.fps, self.total_frames
+            )
+        self.document.segments = self.segments
+        if self.document.user_num != self.user_num_spin.value() or not self.document.target_objects:
+            self.document.set_users(self.user_num_spin.value())
+        return self.document
 
     # VideoLabeler의 mark_segment 메서드 수정
     def mark_segment(self):
@@ -1522,6 +4699,7 @@ class VideoLabeler(QMainWindow):
                 self.marking_segment = True
                 if self.timeline:
                     self.timeline.set_marking_start(self.current_frame)
+                self.video_canvas.set_marking_start(self.current_frame)
             else:
                 # 구간 종료
                 if self.current_frame <= self.current_segment.start_frame:
@@ -1529,24 +4707,23 @@ class VideoLabeler(QMainWindow):
                     return
                     
                 self.current_segment.end_frame = self.current_frame
-                self.current_segment.duration = self.current_segment.end_frame - self.current_segment.start_frame
-                self.current_segment.keyframe = (self.current_segment.start_frame + self.current_segment.end_frame) // 2
                 
                 # 세그먼트 정보 입력 다이얼로그 표시
                 dialog = SegmentDialog(self.current_segment, parent=self)
                 if dialog.exec_():
-                    self.segments.append(dialog.segment)
+                    self.execute_edit(SegmentEdit('add', len(self.segments), dialog.segment))
                     if self.timeline:
-                        self.timeline.segments = self.segments
-                        self.timeline.update()
-                    self.has_unsaved_changes = True  # 저장 필요 표시
-                    # 자동 저장 제거 - 작성 완료 버튼을 눌러야만 저장되도록 변경
+                        overlaps = self.timeline.segment_index.overlaps_of(dialog.segment)
+                        if overlaps:
+                            logger.warning(f"New segment overlaps {len(overlaps)} existing segment(s)")
+                    # 파일은 작성 완료 버튼을 눌러야만 저장 - 편집 기록은 자동 저장(autosave)으로 확정
                 
                 self.mark_btn.setText('구간 표시')
                 self.marking_segment = False
                 self.current_segment = None
                 if self.timeline:
                     self.timeline.clear_marking_start()
+                self.video_canvas.clear_marking_start()
                         
         except Exception as e:
             logger.error(f"Error marking segment: {str(e)}")
@@ -1557,34 +4734,96 @@ class VideoLabeler(QMainWindow):
             logger.info(f"Editing segment at index {index}")
             if 0 <= index < len(self.segments):
                 segment = self.segments[index]
+                before = segment.snapshot()  # 다이얼로그가 세그먼트를 직접 수정하므로 미리 보관
                 dialog = SegmentDialog(segment, editing=True, parent=self)
                 
                 if dialog.exec_():
                     if dialog.delete_requested:
-                        # 세그먼트 삭제
-                        self.segments.pop(index)
+                        # 세그먼트 삭제 (수정 중이던 값은 되돌린 뒤 삭제)
+                        segment.restore(before)
+                        self.execute_edit(SegmentEdit('remove', index, segment))
                         logger.info(f"Deleted segment at index {index}")
                     else:
                         # 세그먼트 업데이트
-                        self.segments[index] = dialog.segment
-                        # duration 재계산
-                        self.segments[index].duration = (
-                            self.segments[index].end_frame - self.segments[index].start_frame
-                        )
+                        self.execute_edit(SegmentEdit('update', index, segment, before, segment.snapshot()))
                         logger.info(f"Updated segment at index {index}")
                     
-                    self.has_unsaved_changes = True
-                    self.save_annotations()  # 자동 저장
-                    
-                    # Timeline 업데이트
-                    if self.timeline:
-                        self.timeline.segments = self.segments
-                        self.timeline.update()
+                    self.save_annotations()  # 자동 저장 (백그라운드에서 모아서 기록)
+                else:
+                    # 취소 - 다이얼로그에서 바꾼 값 되돌리기
+                    segment.restore(before)
                     
         except Exception as e:
             logger.error(f"Error editing segment: {str(e)}")
             QMessageBox.critical(self, '오류', f'세그먼트 편집 실패: {str(e)}')
 
+    def execute_edit(self, edit):
+        """세그먼트 편집 실행 후 되돌리기 기록에 추가"""
+        if self.apply_edit(edit):
+            self.history.push(edit)
+
+    def edit_index(self, edit):
+        """편집 대상의 현재 위치 (기록한 위치에 다른 구간이 있으면 같은 객체를 찾고, 없으면 None)"""
+        in_list = any(s is edit.segment for s in self.segments)
+        if edit.op == 'add':
+            return None if in_list else min(edit.index, len(self.segments))
+        if 0 <= edit.index < len(self.segments) and self.segments[edit.index] is edit.segment:
+            return edit.index
+        if not in_list:
+            return None
+        return next(i for i, s in enumerate(self.segments) if s is edit.segment)
+
+    def apply_edit(self, edit):
+        """세그먼트 편집 하나를 목록, 타임라인 인덱스, 편집 기록에 반영 (적용하지 못하면 False)"""
+        segment = edit.segment
+        index = self.edit_index(edit)
+        if index is None:
+            logger.warning(f"Skipping {edit.op} edit: segment {edit.index} is no longer in the list")
+            return False
+        if edit.op == 'add':
+            self.segments.insert(index, segment)
+            self.record_edit('add', index=index, segment=segment.to_dict(index))
+            if self.timeline:
+                self.timeline.segment_added(segment)
+        elif edit.op == 'remove':
+            self.segments.pop(index)
+            self.record_edit('remove', index=index, expect=segment_key(segment))
+            if self.timeline:
+                self.timeline.segment_removed(segment)
+        else:
+            segment.restore(edit.after)
+            self.record_edit('update', index=index, expect=list(edit.before[:3]), segment=segment.to_dict(index))
+            if self.timeline:
+                self.timeline.segment_changed(segment)
+        self.video_canvas.update()
+        self.has_unsaved_changes = True
+        return True
+
+    def can_replay_edit(self):
+        """되돌리기/다시 실행 가능 여부 (구간 표시 중이면 기록을 건드리지 않음)"""
+        return self.cap is not None and not self.marking_segment
+
+    def undo_edit(self):
+        """마지막 세그먼트 편집 되돌리기"""
+        if self.can_replay_edit():
+            self.replay_edit(self.history.undo())
+
+    def redo_edit(self):
+        """되돌린 세그먼트 편집 다시 실행"""
+        if self.can_replay_edit():
+            self.replay_edit(self.history.redo())
+
+    def replay_edit(self, edit):
+        try:
+            if edit is None or not self.apply_edit(edit):
+                return
+            # 이미 저장된 어노테이션이면 편집과 마찬가지로 자동 저장
+            json_path = self.current_files[self.current_file_index].with_suffix('.json')
+            if json_path.exists():
+                self.save_annotations()
+        except Exception as e:
+            logger.error(f"Error replaying edit: {str(e)}")
+
     def save_annotations(self):
         """어노테이션 저장"""
         try:
@@ -1592,56 +4831,11 @@ class VideoLabeler(QMainWindow):
                 logger.warning("No file selected for saving annotations")
                 return False
 
-            file_path = self.current_files[self.current_file_index]
-            json_path = file_path.with_suffix('.json')
+            json_path = self.current_files[self.current_file_index].with_suffix('.json')
             
-            annotations_data = {
-                'meta_data': {
-                    'file_name': file_path.name,
-                    'format': file_path.suffix[1:],
-                    'size': file_path.stat().st_size,
-                    'width_height': [
-                        int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                        int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    ],
-                    'environment': 0,
-                    'frame_rate': self.fps,
-                    'total_frames': self.total_frames,
-                    'camera_height': 170,
-                    'camera_angle': 15
-                },
-                'additional_info': {
-                    'InteractionType': 'Touchscreen'
-                },
-                'annotations': {
-                    'space_context': '',
-                    'user_num': self.user_num_spin.value(),
-                    'target_objects': [
-                        {
-                            'object_id': i,
-                            'age': 1,
-                            'gender': 1,
-                            'disability': 2
-                        } for i in range(self.user_num_spin.value())
-                    ],
-                    'segmentation': [
-                        {
-                            'segment_id': i,
-                            'action_type': segment.action_type,
-                            'start_frame': segment.start_frame,
-                            'end_frame': segment.end_frame,
-                            'duration': segment.duration,
-                            'keyframe': segment.keyframe,
-                            'keypoints': segment.keypoints
-                        } for i, segment in enumerate(self.segments)
-                    ]
-                }
-            }
-
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(annotations_data, f, ensure_ascii=False, indent=2)
-                
-            logger.info(f"Successfully saved annotations to {json_path}")
+            # 현재 상태를 스냅샷으로 넘기고 기록은 저장 스레드에서 처리
+            self.saver.submit(json_path, self.sync_document().to_dict(), self.journal.last_seq(json_path))
+            self.has_unsaved_changes = False
             return True
 
         except Exception as e:
@@ -1665,91 +4859,43 @@ class VideoLabeler(QMainWindow):
 
             if reply == QMessageBox.Yes:
                 user_num = self.user_num_spin.value()
+                document = self.sync_document()
                 target_objects = []
 
                 # 각 사용자별 정보 입력
                 for i in range(user_num):
                     existing_data = None
-                    if hasattr(self, 'current_json') and self.current_json:
-                        if ('annotations' in self.current_json and 
-                            'target_objects' in self.current_json['annotations'] and 
-                            i < len(self.current_json['annotations']['target_objects'])):
-                            existing_data = self.current_json['annotations']['target_objects'][i]
+                    if i < len(document.target_objects):
+                        existing_data = document.target_objects[i].to_dict()
 
                     dialog = UserInfoDialog(i, existing_data, self)
                     if dialog.exec_():
-                        user_info = dialog.get_user_info()
-                        target_objects.append(user_info)
+                        target_objects.append(TargetObject.from_dict(dialog.get_user_info(), i))
                     else:
                         return  # 사용자가 취소한 경우
 
-                # 기존 JSON 데이터가 없으면 새로 생성
-                if not hasattr(self, 'current_json') or self.current_json is None:
-                    file_path = self.current_files[self.current_file_index]
-                    self.current_json = {
-                        'meta_data': {
-                            'file_name': file_path.name,
-                            'format': file_path.suffix[1:],
-                            'size': file_path.stat().st_size,
-                            'width_height': [
-                                int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                            ],
-                            'environment': 3,
-                            'frame_rate': self.fps,
-                            'total_frames': self.total_frames,
-                            'camera_height': 165,
-                            'camera_angle': 50
-                        },
-                        'additional_info': {
-                            'InteractionType': 'Touchscreen'
-                        },
-                        'annotations': {
-                            'space_context': '',
-                            'user_num': user_num,
-                            'target_objects': target_objects,
-                            'segmentation': []
-                        }
-                    }
-
-                # JSON 데이터 업데이트
-                self.current_json['annotations']['user_num'] = user_num
-                self.current_json['annotations']['target_objects'] = target_objects
+                document.set_users(user_num, target_objects)
                 
-                # 세그먼트 정보 업데이트
-                segment_data = []
-                for i, segment in enumerate(self.segments):
-                    # 각 사용자별 빈 keypoints 배열을 포함하는 구조 생성
-                    keypoints_data = []
-                    for j in range(user_num):
-                        keypoints_data.append({
-                            "object_id": j,
-                            "keypoints": []  # 기존 keypoints가 있다면 여기에 포함
-                        })
-
-                    segment_data.append({
-                        'segment_id': i,
-                        'action_type': segment.action_type,
-                        'start_frame': segment.start_frame,
-                        'end_frame': segment.end_frame,
-                        'duration': segment.duration,
-                        'keyframe': segment.keyframe,
-                        'keypoints': keypoints_data
-                    })
-                self.current_json['annotations']['segmentation'] = segment_data
-
-                # 파일 저장
-                json_path = self.current_files[self.current_file_index].with_suffix('.json')
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.current_json, f, ensure_ascii=False, indent=2)
+                # keypoints가 없는 구간은 사용자별 빈 keypoints 구조로 저장
+                document.fill_keypoint_skeletons()
 
+                # 파일 저장 (저장 스레드가 기록을 마치면 on_annotations_saved에서 완료 안내)
+                json_path = self.current_files[self.current_file_index].with_suffix('.json')
+                self.completion_paths.add(str(json_path))
+                self.saver.submit(json_path, document.to_dict(), self.journal.last_seq(json_path))
                 self.has_unsaved_changes = False
-                QMessageBox.information(self, '완료', '어노테이션이 저장되었습니다.')
 
         except Exception as e:
             logger.error(f"Error completing annotation: {str(e)}")
             QMessageBox.critical(self, '오류', f'작성 완료 실패: {str(e)}')
 
+    def flush_indexes(self):
+        """변경된 디스크 인덱스 기록 요청 (저장 스레드가 직렬화하고 기록)"""
+        try:
+            self.saver.request_index_flush()
+        except Exception as e:
+            logger.error(f"Error flushing indexes: {str(e)}")
+
     def enable_video_controls(self, enable=True):
         """비디오 컨트롤 버튼들의 활성화/비활성화"""
         controls = [
@@ -1758,7 +4904,8 @@ class VideoLabeler(QMainWindow):
             self.next_frame_btn,
             self.prev_sec_btn,
             self.next_sec_btn,
-            self.mark_btn
+            self.mark_btn,
+            self.speed_combo
         ]
         for control in controls:
             control.setEnabled(enable)
@@ -1779,7 +4926,21 @@ class VideoLabeler(QMainWindow):
                     return
                 elif reply == QMessageBox.Yes:
                     self.save_annotations()
+                else:
+                    self.discard_journal()
+
+            self.autosave_timer.stop()
+            self.index_flush_timer.stop()
+            self.timer.stop()
+            self.stop_decoder()
+            self.stop_thumbnail_worker()
+            self.stop_scan()
+            self.prober.stop()
+            self.prefetcher.stop()
 
+            # 대기 중인 저장과 인덱스를 모두 기록한 뒤 종료
+            self.flush_indexes()
+            self.saver.stop()
             if self.cap:
                 self.cap.release()
             event.accept()
@@ -1797,39 +4958,14 @@ class UserInfoDialog(QDialog):
 
     def init_ui(self):
         self.setWindowTitle(f'사용자 {self.user_id + 1} 정보')
+        self.setObjectName('userInfoDialog')
         layout = QVBoxLayout()
         self.setMinimumWidth(300)
-        
-        # 틴더 스타일 적용
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QLabel {
-                color: #424242;
-                font-size: 13px;
-            }
-            QRadioButton {
-                padding: 5px;
-                color: #424242;
-            }
-            QRadioButton::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QPushButton {
-                padding: 10px;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-        """)
 
         # 성별 선택
         gender_group = QVBoxLayout()
         gender_label = QLabel('성별:')
-        gender_label.setStyleSheet("font-weight: bold;")
+        gender_label.setProperty('variant', 'section')
         gender_group.addWidget(gender_label)
         
         self.gender_buttons = QButtonGroup()
@@ -1845,7 +4981,7 @@ class UserInfoDialog(QDialog):
         # 연령대 선택
         age_group = QVBoxLayout()
         age_label = QLabel('연령대:')
-        age_label.setStyleSheet("font-weight: bold;")
+        age_label.setProperty('variant', 'section')
         age_group.addWidget(age_label)
         
         self.age_buttons = QButtonGroup()
@@ -1861,7 +4997,7 @@ class UserInfoDialog(QDialog):
         # 장애 유무
         disability_group = QVBoxLayout()
         disability_label = QLabel('장애 유무:')
-        disability_label.setStyleSheet("font-weight: bold;")
+        disability_label.setProperty('variant', 'section')
         disability_group.addWidget(disability_label)
         
         self.disability_buttons = QButtonGroup()
@@ -1876,15 +5012,7 @@ class UserInfoDialog(QDialog):
 
         # 확인 버튼
         confirm_btn = QPushButton('확인')
-        confirm_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #fe3c72;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #ff4f81;
-            }
-        """)
+        confirm_btn.setProperty('variant', 'primary')
         confirm_btn.clicked.connect(self.accept)
         layout.addWidget(confirm_btn)
 
@@ -1898,15 +5026,179 @@ class UserInfoDialog(QDialog):
             "disability": self.disability_buttons.checkedId()
         }
 
+# ---------------------------------------------------------------------------
+# 배치 명령 (GUI 없이 실행: python main.py validate|export|stats <폴더>)
+# ---------------------------------------------------------------------------
+
+CLI_COMMANDS = ('validate', 'export', 'stats')
+EXPORT_FIELDS = ('file', 'segment_id', 'action_type', 'action_name', 'start_frame', 'end_frame',
+                 'duration', 'keyframe', 'start_time', 'end_time')
+
+def iter_annotation_files(root, pattern='*.json'):
+    """폴더 아래의 어노테이션 JSON 경로 (하위 폴더 포함, 이름순)"""
+    root = Path(root)
+    if root.is_file():
+        yield root
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if fnmatch.fnmatch(name, pattern):
+                yield Path(dirpath) / name
+
+def inspect_annotation_file(json_path, normalize=False):
+    """작업 프로세스에서 실행: 파일 하나를 읽어 검사 결과와 구간 행 반환
+
+    구간 행은 파일에 저장된 값 그대로이며, normalize=True면 정규화한 값을 쓴다.
+    """
+    result = {'file': str(json_path), 'issues': [], 'rows': [], 'summary': {}}
+    try:
+        with open(json_path, 'rb') as f:
+            data = loads_json(f.read())
+    except Exception as e:
+        result['issues'].append({'level': 'error', 'code': 'json', 'message': str(e)})
+        return result
+    result['issues'] = validate_annotation(data)
+    try:
+        document = AnnotationDocument.from_dict(data)
+    except AnnotationError:
+        return result
+    result['rows'] = document.segment_rows(None if normalize else data['annotations']['segmentation'])
+    result['summary'] = action_summary(document.columns())
+    return result
+
+def iter_results(paths, jobs, chunksize=64, normalize=False):
+    """파일별 검사 결과를 입력 순서대로 바로바로 반환 (jobs가 1이면 현재 프로세스에서 처리)"""
+    inspect = partial(inspect_annotation_file, normalize=normalize)
+    if jobs == 1:
+        for path in paths:
+            yield inspect(path)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(inspect, paths, chunksize=chunksize)
+
+def cli_validate(results, out):
+    files = failed = warned = 0
+    for result in results:
+        files += 1
+        levels = {issue['level'] for issue in result['issues']}
+        failed += 'error' in levels
+        warned += 'warning' in levels and 'error' not in levels
+        for issue in result['issues']:
+            print(f"{result['file']}: {issue['level'].upper()} [{issue['code']}] {issue['message']}", file=out)
+        out.flush()
+    print(f"{files} files, {failed} with errors, {warned} with warnings only", file=sys.stderr)
+    return 1 if failed else 0
+
+def cli_export(results, out, fmt):
+    writer = None
+    if fmt == 'csv':
+        writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+    for result in results:
+        for row in result['rows']:
+            row = dict(row, file=result['file'])
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                out.write(json.dumps({key: row[key] for key in EXPORT_FIELDS}, ensure_ascii=False) + '\n')
+    return 0
+
+def cli_stats(results, out):
+    files = invalid = 0
+    stats = {}  # action_type -> {'segments', 'frames', 'files'}
+    for result in results:
+        files += 1
+        # 오류가 있는 파일은 집계에서 빼고 따로 센다
+        if any(issue['level'] == 'error' for issue in result['issues']):
+            invalid += 1
+            continue
+        for action_type, (segments, frames) in result['summary'].items():
+            entry = stats.setdefault(action_type, {'segments': 0, 'frames': 0, 'files': 0})
+            entry['segments'] += segments
+            entry['frames'] += frames
+            entry['files'] += 1
+
+    print(f"files: {files - invalid} counted, {invalid} with errors excluded", file=out)
+    print(f"{'action':<12}{'segments':>10}{'files':>8}{'frames':>12}{'avg frames':>12}", file=out)
+    for action_type in sorted(stats):
+        entry = stats[action_type]
+        name = f"{action_type} {ACTION_NAMES.get(action_type, '?')}"
+        average = entry['frames'] / entry['segments']
+        print(f"{name:<12}{entry['segments']:>10}{entry['files']:>8}{entry['frames']:>12}{average:>12.1f}", file=out)
+    return 0
+
+def parse_gui_args(argv):
+    """GUI 실행 옵션 해석 (Qt 옵션은 그대로 남김)"""
+    parser = argparse.ArgumentParser(prog='main.py', description='비디오 라벨링 도구')
+    parser.add_argument('--autosave', type=float, default=AUTOSAVE_INTERVAL_SEC, metavar='SECONDS',
+                        help=f'자동 저장 주기 (초, 0이면 사용 안 함, 기본 {AUTOSAVE_INTERVAL_SEC})')
+    parser.add_argument('--frame-cache-mb', type=int, default=FRAME_CACHE_BYTES // (1024 * 1024), metavar='MB',
+                        help=f'디코딩 프레임 캐시 메모리 한도 (MB, 기본 {FRAME_CACHE_BYTES // (1024 * 1024)})')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='창이 뜰 때까지 단계별 소요 시간을 표준 오류로 출력')
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qt_args
+
+def run_cli(argv):
+    """배치 명령 실행 후 종료 코드 반환"""
+    parser = argparse.ArgumentParser(prog='main.py', description='어노테이션 JSON 일괄 검사/내보내기/통계')
+    parser.add_argument('command', choices=CLI_COMMANDS)
+    parser.add_argument('path', help='어노테이션 JSON 폴더 또는 파일')
+    parser.add_argument('--pattern', default='*.json', help='대상 파일 이름 패턴 (기본 *.json)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='작업 프로세스 수')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv', help='export 출력 형식')
+    parser.add_argument('--normalize', action='store_true',
+                        help='export 시 저장된 값 대신 정규화한 duration/keyframe 사용')
+    parser.add_argument('-o', '--output', help='출력 파일 (기본 표준 출력)')
+    args = parser.parse_args(argv)
+
+    # 배치 실행 중에는 경고 이상만 기록
+    logging.getLogger().setLevel(logging.WARNING)
+
+    paths = iter_annotation_files(args.path, args.pattern)
+    results = iter_results(paths, max(args.jobs, 1), normalize=args.normalize)
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        if args.command == 'validate':
+            return cli_validate(results, out)
+        if args.command == 'export':
+            return cli_export(results, out, args.format)
+        return cli_stats(results, out)
+    except BrokenPipeError:
+        # 출력을 받는 쪽이 먼저 끝난 경우 (예: | head)
+        sys.stdout = open(os.devnull, 'w')
+        return 0
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        sys.exit(run_cli(sys.argv[1:]))
+
     try:
-        app = QApplication(sys.argv)
+        startup_profiler.mark('module')
+        args, qt_argv = parse_gui_args(sys.argv)
+        startup_profiler.enabled = args.profile_startup
+        app = QApplication(qt_argv)
         
         # 스타일 설정
         app.setStyle('Fusion')
+        apply_theme(app)
+        startup_profiler.mark('QApplication')
         
-        window = VideoLabeler()
+        window = VideoLabeler(autosave_interval=args.autosave,
+                              frame_cache_bytes=max(args.frame_cache_mb, 0) * 1024 * 1024)
         window.show()
+        startup_profiler.mark('window: show')
+
+        if args.profile_startup:
+            # 첫 이벤트 루프에서 (첫 화면을 그린 뒤) 출력
+            def report_startup():
+                startup_profiler.mark('first paint')
+                startup_profiler.report()
+            QTimer.singleShot(0, report_startup)
         
         sys.exit(app.exec_())
         
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# main은 import 시 홈 디렉터리(캐시)와 현재 폴더(로그 파일)를 사용하므로 임시 폴더로 격리
+_SANDBOX = tempfile.mkdtemp(prefix='video_labeler_test_')
+os.environ['HOME'] = _SANDBOX
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.chdir(_SANDBOX)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QMessageBox  # noqa: E402
+
+import main  # noqa: E402
+
+
+def write_video(path, frames=60, size=(160, 120), fps=15.0):
+    """프레임마다 밝기가 달라지는 테스트용 비디오 생성"""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), fps, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), (i * 4) % 256, np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.fixture(scope='session')
+def app():
+    return QApplication.instance() or QApplication(['test'])
+
+
+@pytest.fixture
+def videos(tmp_path):
+    return [write_video(tmp_path / name) for name in ('a.mp4', 'b.mp4')]
+
+
+@pytest.fixture
+def labeler(app, videos, monkeypatch):
+    """첫 번째 비디오를 연 라벨러 창 (확인 대화상자는 모두 '아니오')"""
+    monkeypatch.setattr(QMessageBox, 'question', staticmethod(lambda *a, **k: QMessageBox.No))
+    monkeypatch.setattr(QMessageBox, 'information', staticmethod(lambda *a, **k: QMessageBox.Ok))
+    errors = []
+    monkeypatch.setattr(QMessageBox, 'critical', staticmethod(lambda *a, **k: errors.append(a[2])))
+    window = main.VideoLabeler(autosave_interval=0)
+    window.add_video_files(list(videos))
+    window.load_video(0)
+    app.processEvents()
+    yield window
+    window.has_unsaved_changes = False
+    window.close()
+    app.processEvents()
+    assert not errors
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+import main
+
+
+def test_saved_annotation_refreshes_file_list_status(labeler, app, videos):
+    model = labeler.file_model
+    assert model.status(videos[0])['complete'] is False
+
+    labeler.segments.append(main.VideoSegment(5, 20, 1))
+    assert labeler.save_annotations()
+    labeler.saver.flush()
+    app.processEvents()  # 저장 스레드의 saved 신호 처리
+
+    assert labeler.status_index.status(videos[0].with_suffix('.json'))['complete'] is True
+    status = model.status(videos[0])
+    assert status['complete'] is True
+    assert status['segments'] == 1
+
+
+def test_journal_append_is_memory_only_until_written(tmp_path):
+    json_path = tmp_path / 'clip.json'
+    journal = main.EditJournal(tmp_path / 'journal')
+
+    seq = journal.append(json_path, 'add', index=0, segment=main.VideoSegment(1, 5).to_dict(0))
+    assert not journal.journal_path(json_path).exists()
+
+    journal.write()
+    assert [entry['seq'] for entry in journal.pending(json_path)] == [seq]
+    assert journal.sync(json_path) == 0  # pending()이 읽은 편집은 이미 디스크에 있음
+
+    journal.committed(json_path, seq)
+    assert not journal.journal_path(json_path).exists()
+
+
+def test_edits_are_journaled_by_saver_thread(labeler, videos):
+    json_path = videos[0].with_suffix('.json')
+    labeler.execute_edit(main.SegmentEdit('add', 0, main.VideoSegment(5, 9, 1)))
+    labeler.saver.flush()
+
+    entries = main.EditJournal(labeler.journal.journal_dir).pending(json_path)
+    assert [entry['op'] for entry in entries] == ['add']
+
+
+def test_refresh_annotation_updates_only_matching_rows(app, tmp_path):
+    files = [tmp_path / f'{i}.mp4' for i in range(5)]
+    model = main.FileListModel([], main.AnnotationStatusIndex(tmp_path / 'status.json'))
+    model.append_files(files[:3])
+    model.append_files(files[3:])
+
+    changed = []
+    model.dataChanged.connect(lambda top, bottom: changed.append((top.row(), bottom.row())))
+    model.refresh_annotation(files[3].with_suffix('.json'))
+    model.refresh_annotation(tmp_path / 'other.json')
+    assert changed == [(3, 3)]
+
+
+def test_file_list_model_marks_only_the_current_row(app, tmp_path):
+    files = [tmp_path / 'a.mp4', tmp_path / 'b.mp4']
+    model = main.FileListModel(files, main.AnnotationStatusIndex(tmp_path / 'status.json'))
+    model.set_current_index(1)
+
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, model.COLUMN_NAME)) == 'a.mp4'
+    assert model.data(model.index(1, model.COLUMN_ACTION)) == '현재 파일'
+    assert model.data(model.index(0, model.COLUMN_ACTION)) is None
+
+    model.append_files([tmp_path / 'c.mp4'])
+    assert model.rowCount() == 3
+    assert model.data(model.index(2, model.COLUMN_NAME)) == 'c.mp4'
+
+
+def test_status_index_rereads_only_changed_files(tmp_path):
+    json_path = tmp_path / 'a.json'
+    json_path.write_text(json.dumps({'meta_data': {}, 'annotations': {'segmentation': [{}, {}]}}))
+    index = main.AnnotationStatusIndex(tmp_path / 'status.json')
+    assert index.status(json_path) == {'complete': True, 'segments': 2}
+    index.save()
+
+    reloaded = main.AnnotationStatusIndex(tmp_path / 'status.json')
+    assert reloaded.lookup(json_path)['segments'] == 2
+    json_path.write_text('{}')
+    assert reloaded.lookup(json_path) is None
+    assert reloaded.status(json_path) == {'complete': False, 'segments': 0}
+
+
+def test_document_round_trip_keeps_unknown_keys(tmp_path):
+    data = {
+        'meta_data': {'file_name': 'a.mp4', 'frame_rate': 15, 'total_frames': 100},
+        'additional_info': {'InteractionType': 'Touchscreen'},
+        'annotations': {'user_num': 1, 'target_objects': [], 'segmentation': [
+            {'start_frame': 10, 'end_frame': 20, 'action_type': 2},
+            {'start_frame': 'x'}
+        ]},
+        'reviewer': '검수자'
+    }
+    document = main.AnnotationDocument.from_dict(data)
+    assert document.skipped == 1
+
+    document.save(tmp_path / 'a.json')
+    saved = main.loads_json((tmp_path / 'a.json').read_bytes())
+    assert saved['reviewer'] == '검수자'
+    assert [(s['segment_id'], s['start_frame'], s['end_frame'], s['duration'])
+            for s in saved['annotations']['segmentation']] == [(0, 10, 20, 10)]
+
+
+def test_segment_columns_count_overlaps_and_summarize_actions():
+    segments = [main.VideoSegment(0, 10, 1), main.VideoSegment(5, 15, 2), main.VideoSegment(20, 30, 1)]
+    columns = main.segment_columns(segments)
+    assert list(columns['start_frame']) == [0, 5, 20]
+    assert main.count_overlaps(columns) == 1
+    assert main.action_summary(columns) == {1: (2, 20), 2: (1, 10)}
+
+    segments[0].end_frame = 12
+    assert (segments[0].duration, segments[0].keyframe) == (12, 6)
+    with pytest.raises(AttributeError):
+        segments[0].note = ''
@@ -0,0 +1,21 @@
+import main
+
+
+def test_lazy_module_imports_on_first_use(monkeypatch):
+    profiler = main.StartupProfiler(0.0)
+    monkeypatch.setattr(main, 'startup_profiler', profiler)
+    module = main.LazyModule('colorsys')
+    assert module._module is None
+
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert module.hsv_to_rgb(0.0, 0.0, 1.0) == (1.0, 1.0, 1.0)
+    assert [name for name, _ in profiler.marks] == ['import colorsys (deferred)']
+
+
+def test_stylesheet_fills_in_every_theme_color():
+    stylesheet = main.build_stylesheet()
+    assert '$' not in stylesheet
+    assert main.THEME_COLORS['accent'] in stylesheet
+
+    custom = dict(main.THEME_COLORS, accent='#123456')
+    assert '#123456' in main.build_stylesheet(custom)
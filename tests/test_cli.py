@@ -0,0 +1,54 @@
+import io
+import json
+
+import main
+
+STORED_SEGMENT = {'segment_id': 0, 'action_type': 1, 'start_frame': 10, 'end_frame': 20,
+                  'duration': 99, 'keyframe': 12, 'keypoints': []}
+
+
+def write_annotations(folder):
+    good = {
+        'meta_data': {'file_name': 'a.mp4', 'frame_rate': 15, 'total_frames': 100},
+        'additional_info': {},
+        'annotations': {'user_num': 0, 'target_objects': [], 'segmentation': [STORED_SEGMENT]}
+    }
+    (folder / 'good.json').write_text(json.dumps(good), encoding='utf-8')
+    (folder / 'bad.json').write_text(json.dumps({'meta_data': {}}), encoding='utf-8')
+
+
+def test_export_keeps_stored_values_unless_normalized(tmp_path):
+    write_annotations(tmp_path)
+    paths = list(main.iter_annotation_files(tmp_path))
+
+    raw = [row for result in main.iter_results(paths, 1) for row in result['rows']]
+    assert [(row['duration'], row['keyframe']) for row in raw] == [(99, 12)]
+
+    normalized = [row for result in main.iter_results(paths, 1, normalize=True) for row in result['rows']]
+    assert [(row['duration'], row['keyframe']) for row in normalized] == [(10, 12)]
+
+
+def test_stats_excludes_files_with_errors(tmp_path):
+    write_annotations(tmp_path)
+    bad = tmp_path / 'bad.json'
+    bad.write_text(json.dumps({
+        'meta_data': {}, 'additional_info': {},
+        'annotations': {'segmentation': [dict(STORED_SEGMENT, start_frame=30, end_frame=10)] * 5}
+    }), encoding='utf-8')
+
+    out = io.StringIO()
+    main.cli_stats(main.iter_results(main.iter_annotation_files(tmp_path), 1), out)
+    lines = out.getvalue().splitlines()
+    assert lines[0] == 'files: 1 counted, 1 with errors excluded'
+    assert lines[2].split()[2:4] == ['1', '1']
+
+
+def test_validate_reports_each_problem_and_fails(tmp_path, capsys):
+    (tmp_path / 'broken.json').write_text('{', encoding='utf-8')
+    (tmp_path / 'partial.json').write_text(json.dumps({'meta_data': {}}), encoding='utf-8')
+
+    assert main.run_cli(['validate', str(tmp_path), '-j', '1']) == 1
+    captured = capsys.readouterr()
+    assert 'broken.json: ERROR [json]' in captured.out
+    assert 'partial.json: ERROR' in captured.out
+    assert captured.err.startswith('2 files, 2 with errors')
@@ -0,0 +1,64 @@
+import pytest
+
+import main
+
+
+def spans(labeler):
+    return [(segment.start_frame, segment.end_frame) for segment in labeler.segments]
+
+
+def test_undo_while_marking_keeps_history(labeler):
+    labeler.execute_edit(main.SegmentEdit('add', 0, main.VideoSegment(10, 20, 1)))
+
+    labeler.marking_segment = True
+    labeler.undo_edit()  # 구간 표시 중에는 무시되고 기록도 그대로
+    labeler.marking_segment = False
+    assert spans(labeler) == [(10, 20)]
+
+    labeler.redo_edit()  # 되돌린 편집이 없으므로 아무 일도 없음
+    assert spans(labeler) == [(10, 20)]
+
+    labeler.undo_edit()
+    assert spans(labeler) == []
+    labeler.redo_edit()
+    assert spans(labeler) == [(10, 20)]
+    assert len(labeler.timeline.segment_index) == 1
+
+
+def test_undo_finds_moved_segment_instead_of_removing_another(labeler):
+    first, second = main.VideoSegment(10, 20, 1), main.VideoSegment(30, 40, 2)
+    labeler.execute_edit(main.SegmentEdit('add', 0, first))
+    labeler.segments.insert(0, second)  # 기록 밖에서 목록이 바뀐 경우
+
+    labeler.undo_edit()
+    assert spans(labeler) == [(30, 40)]
+
+
+def test_journal_entry_for_changed_list_is_rejected():
+    segments = [main.VideoSegment(30, 40, 2)]
+    entry = {'op': 'remove', 'index': 0, 'expect': [10, 20, 1]}
+    with pytest.raises(ValueError):
+        main.apply_journal_entry(segments, entry)
+    assert [(s.start_frame, s.end_frame) for s in segments] == [(30, 40)]
+
+    segments.append(main.VideoSegment(10, 20, 1))
+    main.apply_journal_entry(segments, entry)
+    assert [(s.start_frame, s.end_frame) for s in segments] == [(30, 40)]
+
+
+def test_history_is_bounded_and_new_edits_clear_redo():
+    history = main.EditHistory(depth=2)
+    edits = [main.SegmentEdit('add', i, main.VideoSegment(i * 10, i * 10 + 5)) for i in range(3)]
+    for edit in edits:
+        history.push(edit)
+
+    undone = [history.undo(), history.undo(), history.undo()]
+    assert [(edit.op, edit.segment) for edit in undone[:2]] == [('remove', edits[2].segment),
+                                                                ('remove', edits[1].segment)]
+    assert undone[2] is None
+    assert history.redo() is edits[1]
+
+    history.push(main.SegmentEdit('update', 0, edits[0].segment, before=(0, 5, 1), after=(0, 8, 1)))
+    assert history.redo() is None
+    inverse = history.undo()
+    assert (inverse.before, inverse.after) == ((0, 8, 1), (0, 5, 1))
@@ -0,0 +1,50 @@
+import threading
+
+import main
+
+
+def test_ring_buffer_is_fifo_and_close_releases_blocked_writer():
+    buffer = main.FrameRingBuffer(capacity=2)
+    assert buffer.put(1) and buffer.put(2)
+
+    results = []
+    writer = threading.Thread(target=lambda: results.append(buffer.put(3)))
+    writer.start()
+    assert buffer.pop() == 1
+    writer.join(1)
+    assert results == [True]
+    assert [buffer.pop(), buffer.pop(), buffer.pop()] == [2, 3, None]
+
+    buffer.put(4)
+    buffer.put(5)
+    blocked = threading.Thread(target=lambda: results.append(buffer.put(6)))
+    blocked.start()
+    buffer.close()
+    blocked.join(1)
+    assert results == [True, False]
+    assert len(buffer) == 0
+
+
+def test_clock_follows_elapsed_time_and_speed(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(main.time, 'monotonic', lambda: now[0])
+    clock = main.PlaybackClock(fps=10.0)
+    clock.start(5)
+    now[0] += 1.0
+    assert clock.frame() == 15
+
+    clock.set_speed(2.0)
+    now[0] += 0.5
+    assert clock.frame() == 25
+    assert clock.tick_interval() == 20
+
+
+def test_reverse_decoder_emits_frames_backwards(app, videos):
+    buffer = main.FrameRingBuffer(capacity=40)
+    decoder = main.ReverseFrameDecoder(videos[0], 25, buffer, chunk_frames=10)
+    decoder.run()
+
+    frames = []
+    while len(buffer):
+        frames.append(buffer.pop()[0])
+    assert frames == list(range(25, -1, -1)) + [-1]
@@ -0,0 +1,45 @@
+import os
+import time
+
+import main
+
+
+def test_cancel_scan_does_not_wait_for_slow_directory(labeler, app, tmp_path, monkeypatch):
+    scandir = os.scandir
+
+    def slow_scandir(path):
+        time.sleep(0.5)  # 느린 네트워크 드라이브
+        return scandir(path)
+
+    monkeypatch.setattr(main.os, 'scandir', slow_scandir)
+    labeler.start_scan(tmp_path)
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    labeler.cancel_scan()
+    assert time.monotonic() - started < 0.1
+    assert labeler.scanner is not None
+
+    deadline = time.monotonic() + 5
+    while labeler.scanner is not None:
+        assert time.monotonic() < deadline
+        app.processEvents()
+        time.sleep(0.01)
+    assert labeler.cancel_scan_btn.isHidden()
+
+
+def test_scanner_applies_include_and_exclude_patterns(tmp_path):
+    for relative in ('a.mp4', 'b.MOV', 'notes.txt', 'skip/c.mp4', 'sub/d.mkv', 'sub/e_raw.mp4'):
+        path = tmp_path / relative
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b'')
+
+    scanner = main.DirectoryScanner(tmp_path, main.parse_patterns('*.mp4, *.mkv'),
+                                    main.parse_patterns('skip *_raw*'))
+    found, finished = [], []
+    scanner.files_found.connect(found.extend)
+    scanner.scan_finished.connect(lambda count, cancelled: finished.append((count, cancelled)))
+    scanner.run()
+
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in found) == ['a.mp4', 'sub/d.mkv']
+    assert finished == [(2, False)]
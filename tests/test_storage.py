@@ -0,0 +1,76 @@
+import os
+import stat
+
+import main
+
+
+def test_write_atomic_keeps_existing_permissions(tmp_path):
+    path = tmp_path / 'clip.json'
+    path.write_bytes(b'{}')
+    os.chmod(path, 0o644)
+
+    main.write_atomic(path, b'{"a": 1}')
+
+    assert path.read_bytes() == b'{"a": 1}'
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_write_atomic_new_file_uses_umask(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'UMASK', 0o022)
+    previous = os.umask(0o077)
+    try:
+        path = tmp_path / 'new.json'
+        main.write_atomic(path, b'{}')
+        # 작업 스레드에서 호출되므로 프로세스 umask는 건드리지 않아야 함
+        assert os.umask(0o077) == 0o077
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert [p.name for p in tmp_path.iterdir()] == ['new.json']
+
+
+def test_thumbnails_are_written_atomically(app, tmp_path, videos, monkeypatch):
+    written = []
+    write_atomic = main.write_atomic
+    monkeypatch.setattr(main, 'write_atomic', lambda path, data, durable=True: (
+        written.append((path.name, durable)), write_atomic(path, data, durable)))
+
+    cache = main.ThumbnailCache(tmp_path / 'thumbnails', count=3)
+    cache.generate(videos[0], 60)
+
+    assert written == [('000.jpg', False), ('001.jpg', False), ('002.jpg', False)]
+    video_dir = cache.video_dir(videos[0])
+    assert sorted(p.name for p in video_dir.iterdir()) == ['000.jpg', '001.jpg', '002.jpg']
+
+
+def test_journal_replays_edits_until_they_are_committed(tmp_path):
+    json_path = tmp_path / 'a.json'
+    main.write_atomic(json_path, b'{}')
+    assert json_path.read_bytes() == b'{}'
+    assert [path.name for path in tmp_path.iterdir()] == ['a.json']
+
+    journal = main.EditJournal(tmp_path / 'journal')
+    journal.append(json_path, 'add', segment=main.VideoSegment(10, 20, 2).to_dict(0))
+    seq = journal.append(json_path, 'add', segment=main.VideoSegment(30, 40, 1).to_dict(1))
+    segments = []
+    for entry in journal.pending(json_path):
+        main.apply_journal_entry(segments, entry)
+    assert [(s.start_frame, s.end_frame, s.action_type) for s in segments] == [(10, 20, 2), (30, 40, 1)]
+
+    journal.committed(json_path, seq)
+    assert journal.pending(json_path) == []
+
+
+def test_journal_sync_confirms_only_new_edits(tmp_path):
+    json_path = tmp_path / 'a.json'
+    json_path.write_bytes(b'{}')
+    journal = main.EditJournal(tmp_path / 'journal')
+    for start in (10, 30):
+        journal.append(json_path, 'add', segment=main.VideoSegment(start, start + 10).to_dict(0))
+
+    assert journal.unsynced(json_path) == 2
+    assert journal.sync(json_path) == 2
+    assert journal.unsynced(json_path) == 0
+    assert journal.sync(json_path) == 0
+    assert len(journal.pending(json_path)) == 2
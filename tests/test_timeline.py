@@ -0,0 +1,112 @@
+from PyQt5.QtCore import QPoint, Qt
+from PyQt5.QtTest import QTest
+
+import main
+
+
+def test_playhead_move_repaints_only_marker_area(app):
+    timeline = main.TimelineWidget()
+    timeline.resize(780, 80)
+    timeline.set_total_frames(600)
+    timeline.show()
+    app.processEvents()
+
+    painted = []
+    original = timeline.paintEvent
+
+    def record(event):
+        painted.extend(event.region().rects())
+        original(event)
+
+    timeline.paintEvent = record
+    timeline.set_current_frame(300)
+    app.processEvents()
+    timeline.hide()
+
+    assert timeline.graphicsEffect() is None
+    assert painted
+    assert all(rect.width() < timeline.width() // 4 for rect in painted)
+
+
+def test_double_click_on_empty_timeline_resets_zoom(app):
+    timeline = main.TimelineWidget()
+    timeline.resize(780, 80)
+    timeline.set_total_frames(600)
+    timeline.zoom(4.0, 390)
+    assert timeline.is_zoomed()
+
+    QTest.mouseDClick(timeline, Qt.LeftButton, pos=QPoint(390, 40))
+    assert not timeline.is_zoomed()
+
+
+def test_loading_a_video_resets_zoom(labeler):
+    labeler.timeline.zoom(4.0, 100)
+    assert labeler.timeline.is_zoomed()
+    labeler.load_video(1)
+    assert not labeler.timeline.is_zoomed()
+
+
+def test_thumbnail_slots_cover_the_video_evenly(tmp_path, videos):
+    cache = main.ThumbnailCache(tmp_path / 'thumbnails', count=10)
+    assert [cache.slot_frame(slot, 100) for slot in (0, 9)] == [5, 95]
+    assert all(cache.slot_at_frame(cache.slot_frame(slot, 100), 100) == slot for slot in range(10))
+    assert cache.slot_at_frame(500, 100) == 9
+
+    video_dir = cache.video_dir(videos[0])
+    videos[0].write_bytes(videos[0].read_bytes() + b'\0')
+    assert cache.video_dir(videos[0]) != video_dir
+
+
+def test_playhead_move_reuses_cached_background(app):
+    timeline = main.TimelineWidget()
+    timeline.resize(780, 80)
+    timeline.set_total_frames(600)
+    timeline.show()
+    app.processEvents()
+    timeline.repaint()
+    background = timeline._background
+    assert background is not None
+
+    timeline.set_current_frame(300)
+    app.processEvents()
+    timeline.repaint()
+    assert timeline._background is background
+
+    timeline.set_marking_start(100)
+    timeline.hide()
+    assert timeline._background is None
+
+
+def test_segment_index_finds_segments_covering_a_range():
+    outer, inner, late = main.VideoSegment(0, 100), main.VideoSegment(40, 60), main.VideoSegment(200, 300)
+    index = main.SegmentIndex([outer, inner, late])
+    assert index.at(50) == [inner, outer]
+    assert index.overlapping(90, 210) == [late, outer]
+    assert index.at(150) == []
+
+    inner.start_frame, inner.end_frame = 250, 260
+    index.update(inner)
+    assert index.at(50) == [outer]
+    assert index.overlaps_of(late) == [inner]
+
+    index.remove(outer)
+    assert len(index) == 2
+    assert index.at(50) == []
+
+
+def test_zoom_keeps_the_anchor_frame_and_clamps_to_the_video(app):
+    timeline = main.TimelineWidget()
+    timeline.resize(600, 80)
+    timeline.set_total_frames(600)
+
+    timeline.zoom(4.0, 300)
+    assert timeline.visible_range() == (225.0, 375.0)
+    assert timeline.x_to_frame(300) == 300
+
+    timeline.zoom(1000.0, 0)
+    view_start, view_end = timeline.visible_range()
+    assert view_end - view_start == main.TIMELINE_MIN_VISIBLE_FRAMES
+
+    timeline.zoom(0.001, 300)
+    assert timeline.visible_range() == (0.0, 600)
+    assert not timeline.is_zoomed()
@@ -0,0 +1,168 @@
+import json
+import time
+
+import cv2
+import numpy as np
+import pytest
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import QImage
+
+import main
+
+
+def test_keyframe_index_starts_at_first_frame(videos):
+    index = main.KeyframeIndex.build(videos[0])
+    if index is None:
+        pytest.skip('OpenCV build cannot read raw packets')
+    assert index.keyframes[0] == 0
+    assert index.keyframes == sorted(index.keyframes)
+    assert index.keyframe_before(59) == index.keyframes[-1]
+
+
+def test_metadata_cache_keeps_keyframes_out_of_index(tmp_path, videos):
+    cache = main.VideoMetadataCache(tmp_path / 'index.json', tmp_path / 'keyframes')
+    cache.store(videos[0], {'fps': 15.0, 'frame_count': 60, 'keyframes': [0, 12, 24]})
+    cache.save()
+
+    index = json.loads((tmp_path / 'index.json').read_text(encoding='utf-8'))
+    entry = next(iter(index.values()))
+    assert 'keyframes' not in entry
+    assert entry['keyframe_count'] == 3
+
+    reloaded = main.VideoMetadataCache(tmp_path / 'index.json', tmp_path / 'keyframes')
+    assert reloaded.get(videos[0])['keyframes'] == [0, 12, 24]
+
+
+def test_indexes_are_flushed_by_saver_thread(labeler):
+    labeler.prober.stop()  # 탐색 결과가 도중에 다시 기록되지 않도록
+    labeler.metadata_cache.dirty = True
+    labeler.flush_indexes()
+    labeler.saver.flush()
+    assert not labeler.metadata_cache.dirty
+    assert labeler.metadata_cache.index_path.exists()
+
+
+def test_switching_videos_discards_previous_frames(labeler, videos):
+    labeler.frame_cache.put(videos[0], 5, np.zeros((4, 4, 3), np.uint8))
+    labeler.load_video(1)
+    assert (str(videos[0]), 5) not in labeler.frame_cache
+    assert all(key[0] == str(videos[1]) for key in list(labeler.frame_cache._frames))
+
+
+def test_frame_cache_budget_option():
+    args, qt_argv = main.parse_gui_args(['main.py', '--frame-cache-mb', '64', '-style', 'fusion'])
+    assert args.frame_cache_mb == 64
+    assert qt_argv == ['main.py', '-style', 'fusion']
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_prober_builds_keyframes_only_when_requested(tmp_path, videos):
+    cache = main.VideoMetadataCache(tmp_path / 'index.json', tmp_path / 'keyframes')
+    prober = main.MetadataProber(cache)
+    prober.start()
+    try:
+        prober.enqueue(videos)
+        wait_for(lambda: all(cache.get(path) is not None for path in videos))
+        assert not any(main.VideoMetadataCache.has_keyframe_index(cache.get(path)) for path in videos)
+
+        prober.enqueue(videos[:1], front=True, keyframes=True)
+        wait_for(lambda: main.VideoMetadataCache.has_keyframe_index(cache.get(videos[0])))
+        assert not main.VideoMetadataCache.has_keyframe_index(cache.get(videos[1]))
+    finally:
+        prober.stop()
+
+
+def test_frame_cache_evicts_least_recently_used_frames():
+    frame = np.zeros((10, 10, 3), np.uint8)
+    cache = main.FrameCache(max_bytes=frame.nbytes * 2)
+    cache.put('a.mp4', 0, frame)
+    cache.put('a.mp4', 1, frame.copy())
+    assert cache.get('a.mp4', 0) is frame
+    cache.put('a.mp4', 2, frame.copy())
+
+    assert ('a.mp4', 1) not in cache
+    assert ('a.mp4', 0) in cache and ('a.mp4', 2) in cache
+    assert cache.current_bytes == frame.nbytes * 2
+    cache.discard_file('a.mp4')
+    assert len(cache) == 0 and cache.current_bytes == 0
+
+
+def test_scrub_preview_decodes_only_up_to_the_keyframe(videos):
+    class EveryThirtyFrames:
+        def keyframe_before(self, frame_index):
+            return frame_index - frame_index % 30
+
+    cache = main.FrameCache()
+    cap = cv2.VideoCapture(str(videos[0]))
+    try:
+        engine = main.SeekEngine(cap, videos[0], cache, EveryThirtyFrames())
+        preview = engine.read_preview(45)
+    finally:
+        cap.release()
+
+    assert (str(videos[0]), 45) not in cache
+    assert np.array_equal(preview, cache.get(videos[0], 30))
+    assert engine.position == 31
+
+
+def test_metadata_cache_is_invalidated_when_the_video_changes(tmp_path, videos):
+    metadata = main.probe_video(videos[0])
+    assert (metadata['width'], metadata['height'], metadata['frame_count']) == (160, 120, 60)
+
+    cache = main.VideoMetadataCache(tmp_path / 'index.json')
+    cache.store(videos[0], metadata)
+    assert cache.get(videos[0])['frame_count'] == 60
+
+    videos[0].write_bytes(videos[0].read_bytes() + b'\0')
+    assert cache.get(videos[0]) is None
+
+
+def test_prefetched_annotation_is_dropped_when_the_file_changes(tmp_path):
+    json_path = tmp_path / 'a.json'
+    json_path.write_text('{}')
+    annotation = object()
+    video = main.PrefetchedVideo(tmp_path / 'a.mp4')
+    video.annotation = annotation
+    video.annotation_signature = main.PersistentIndex.file_signature(json_path)
+    assert video.annotation_for(json_path) is annotation
+
+    json_path.write_text('{"annotations": {}}')
+    assert video.annotation_for(json_path) is None
+
+
+def test_converter_resizes_before_color_conversion_and_reuses_buffers(app):
+    frame = np.zeros((120, 160, 3), np.uint8)
+    frame[..., 0] = 255  # BGR 파란색
+    converter = main.FrameConverter(pool_size=2)
+
+    first = converter.convert(frame, QSize(80, 80))
+    assert (first.width(), first.height()) == (80, 60)
+    color = first.pixelColor(0, 0)
+    assert (color.red(), color.green(), color.blue()) == (0, 0, 255)
+
+    converter.convert(frame, QSize(80, 80))
+    assert converter.convert(frame, QSize(80, 80)) is first
+
+
+def test_canvas_letterboxes_the_frame(app):
+    canvas = main.VideoCanvas()
+    canvas.resize(400, 400)
+    canvas.set_video_size(160, 120)
+    assert canvas.frame_rect == QRect(0, 50, 400, 300)
+
+    canvas.resize(800, 300)
+    canvas.update_frame_rect()
+    assert canvas.frame_rect == QRect(200, 0, 400, 300)
+
+    image = QImage(400, 300, QImage.Format_RGB888)
+    image.fill(Qt.white)
+    canvas.set_frame(image, 0)
+    painted = canvas.grab().toImage()
+    assert painted.pixelColor(100, 150).lightness() == 0
+    assert painted.pixelColor(400, 150).lightness() == 255